@@ -164,6 +164,16 @@ class NoddleInterface(preference.PreferenceInterface):
 
 		return path.join_path(self.manager.asset_path(), 'noddle', 'namingpresets')
 
+	def user_cache_path(self) -> str:
+		"""
+		Returns the absolute path where Noddle cache files of the current user are stored.
+
+		:return: Noddle assets/noddle/cache absolute path.
+		:rtype: str
+		"""
+
+		return path.join_path(self.manager.asset_path(), 'noddle', 'cache')
+
 	def naming_preset_paths(self, root: str | None = None) -> list[str]:
 		"""
 		Returns the paths whether presets are located.
@@ -327,6 +337,22 @@ class NoddleInterface(preference.PreferenceInterface):
 
 		return self.settings(root=root).get('settings', {}).get('naming', {}).get('profile', {}).get('indexPadding', 2)
 
+	def naming_profile(self, root: str | None = None) -> tuple[str | None, int, int]:
+		"""
+		Returns the current Noddle naming profile values with a single settings lookup.
+
+		:param str root: root name to search. If None, then all roots will be searched until relativePath is found.
+		:return: tuple with the current naming template, the name start index and the name index padding.
+		:rtype: tuple[str or None, int, int]
+		"""
+
+		naming_settings = self.settings(root=root).get('settings', {}).get('naming', {})
+		profile = naming_settings.get('profile', {})
+
+		return (
+			naming_settings.get('templates', {}).get(profile.get('template', 'default')), profile.get('startIndex', 2),
+			profile.get('indexPadding', 2))
+
 	def rig_display_line_width(self, root: str | None = None) -> float:
 		"""
 		Returns the default display line width for newly created rig controls.
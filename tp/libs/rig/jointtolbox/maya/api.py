@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import math
 import typing
+from dataclasses import dataclass
 
 import maya.cmds as cmds
 import maya.api.OpenMaya as OpenMaya
+import maya.api.OpenMayaAnim as OpenMayaAnim
 
 from tp.core import log
 from tp.maya import api
 from tp.commands import maya
 from tp.maya.meta import base
 from tp.maya.cmds.nodes import joints
+from tp.libs.rig.utils.maya import align
 
 logger = log.rigLogger
 
@@ -93,6 +97,7 @@ def align_joints(
 
     joint_chains, ignore_joints = joints.joint_chains(
         list(joint_names), ignore_connected_joints=ignore_connected_joints)
+    chains_to_orient: list[tuple[list[api.DagNode], bool]] = []
     for joint_chain in joint_chains:
 
         # Last joint in chain may have a child, and if so, include first found.
@@ -102,13 +107,15 @@ def align_joints(
             joint_chain.append(children[0])
             skip_end = True
 
-        nodes = list(api.nodes_by_names(joint_chain))
-        maya.orient_nodes(nodes, primary_axis_vector, secondary_axis_vector, world_up_axis_vector, skip_end=skip_end)
-        success = True
+        chains_to_orient.append((list(api.nodes_by_names(joint_chain)), skip_end))
 
-    if freeze_joints:
-        for joint_chain in joint_chains:
-            cmds.makeIdentity(joint_chain, apply=True, scale=True, rotate=True, translate=True)
+    if chains_to_orient:
+        # All chains are oriented in a single undoable batch. When freezing, rotations are directly stored in joint
+        # orients.
+        align.orient_chains(
+            chains_to_orient, primary_axis_vector, secondary_axis_vector, world_up_axis_vector,
+            freeze_joints=freeze_joints)
+        success = True
 
     if message:
         pass
@@ -116,21 +123,74 @@ def align_joints(
     return success
 
 
+@dataclass
+class JointState:
+    """
+    Display, orient and label state of a joint.
+    """
+
+    name: str
+    radius: float
+    segment_scale_compensate: bool
+    joint_orient: tuple[float, float, float]
+    side: int
+    type: int
+    other_type: str
+
+
+def selected_joints_state(limit: int | None = None) -> list[JointState]:
+    """
+    Returns the state of the selected joints.
+    State of all joints is computed within a single pass over the active selection list.
+
+    :param int or None limit: optional maximum number of joints to return the state of.
+    :return: list of selected joints states.
+    :rtype: list[JointState]
+    """
+
+    joint_states: list[JointState] = []
+    visited: set[int] = set()
+    selection = OpenMaya.MGlobal.getActiveSelectionList()
+    joint_fn = OpenMayaAnim.MFnIkJoint()
+    for i in range(selection.length()):
+        if limit is not None and len(joint_states) >= limit:
+            break
+        try:
+            dag_path = selection.getDagPath(i)
+        except TypeError:
+            continue
+        if not dag_path.hasFn(OpenMaya.MFn.kJoint):
+            continue
+        joint_handle = OpenMaya.MObjectHandle(dag_path.node()).hashCode()
+        if joint_handle in visited:
+            continue
+        visited.add(joint_handle)
+        joint_fn.setObject(dag_path)
+        orient = joint_fn.orientation().asEulerRotation()
+        joint_states.append(JointState(
+            name=dag_path.partialPathName(),
+            radius=joint_fn.findPlug('radius', False).asDouble(),
+            segment_scale_compensate=joint_fn.findPlug('segmentScaleCompensate', False).asBool(),
+            joint_orient=(math.degrees(orient.x), math.degrees(orient.y), math.degrees(orient.z)),
+            side=joint_fn.findPlug('side', False).asShort(),
+            type=joint_fn.findPlug('type', False).asShort(),
+            other_type=joint_fn.findPlug('otherType', False).asString()))
+
+    return joint_states
+
+
 def selected_joint_properties() -> tuple[float, float | None, bool | None]:
     """
     Returns the joint properties of the first selected joint.
+    Only the state of the first selected joint is read, so the cost does not depend on the selection size.
 
     :return: first selected joint properties.
     :rtype: tuple[float, float or None, bool or None]
     """
 
-    selected_joints = cmds.ls(selection=True, type='joint')
+    joint_states = selected_joints_state(limit=1)
     joint_global_scale = cmds.jointDisplayScale(query=True)
-    if not selected_joints:
+    if not joint_states:
         return joint_global_scale, None, None
 
-    joint = selected_joints[0]
-    joint_local_radius = cmds.getAttr(f'{joint}.radius')
-    scale_compensate = cmds.getAttr(f'{joint}.segmentScaleCompensate')
-
-    return  joint_global_scale, joint_local_radius, scale_compensate
+    return joint_global_scale, joint_states[0].radius, joint_states[0].segment_scale_compensate
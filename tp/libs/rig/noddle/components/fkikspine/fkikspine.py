@@ -125,8 +125,10 @@ class FkIkSpineComponent(animcomponent.AnimComponent):
         # cmds.rebuildCurve(ik_curve.fullPathName(), d=3, kep=True, rpo=True, ch=False, tol=0.01, spans=4)
 
         # Build IK Controls
+        # Curve is sampled once for all the controls placed along it.
+        root_position, mid_position = curves.sample_curve(ik_curve, (0.0, 0.5)).positions.tolist()
         control_locator = api.factory.create_dag_node(name='temp_control_loc', node_type='locator')
-        control_locator.setTranslation(api.Vector(*cmds.pointOnCurve(ik_curve.fullPathName(), pr=0.0, top=True)))
+        control_locator.setTranslation(api.Vector(*root_position))
 
         root_control = rig_layer.create_control(
             name=naming.resolve(
@@ -144,7 +146,7 @@ class FkIkSpineComponent(animcomponent.AnimComponent):
             guide=control_joints[0], delete_guide=False, parent=root_control)
         rig_layer.create_srt_buffer('hips', '_'.join([hips_control.name(False), 'srt']))
 
-        control_locator.setTranslation(api.Vector(*cmds.pointOnCurve(ik_curve.fullPathName(), pr=0.5, top=True)))
+        control_locator.setTranslation(api.Vector(*mid_position))
         mid_control = rig_layer.create_control(
             name=naming.resolve(
                 'controlName',
@@ -86,6 +86,8 @@ NODDLE_OUTPUT_ID_ATTR = 'noddleOutputId'
 NODDLE_SOURCE_INPUTS_ATTR = 'noddleSourceInputs'
 NODDLE_SOURCE_INPUT_ATTR = 'noddleSourceInput'
 NODDLE_SOURCE_INPUT_CONSTRAINT_NODES_ATTR = 'noddleConstraintNodes'
+NODDLE_SKELETON_ATTACHMENT_NODES_ATTR = 'noddleSkeletonAttachmentNodes'
+NODDLE_ORIGINAL_OFFSET_PARENT_MATRIX_ATTR = 'noddleOriginalOffsetParentMatrix'
 NODDLE_JOINTS_ATTR = 'noddleCritJoints'
 NODDLE_JOINT_ATTR = 'noddleJoint'
 NODDLE_JOINT_ID_ATTR = 'noddleJointId'
@@ -231,6 +233,7 @@ DEFAULT_BUILTIN_PRESET_NAME = 'noddle'
 
 COMPONENTS_ENV_VAR_KEY = 'NODDLE_COMPONENTS_PATHS'
 DESCRIPTORS_ENV_VAR_KEY = 'NODDLE_DESCRIPTORS_PATHS'
+COMPONENTS_MANIFEST_ENV_VAR_KEY = 'NODDLE_COMPONENTS_MANIFEST_PATH'
 
 # ======================================================================================================================
 # Build States
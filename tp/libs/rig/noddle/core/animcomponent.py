@@ -6,6 +6,7 @@ from typing import Iterable
 from overrides import override
 
 from tp.maya import api
+from tp.libs.rig.noddle import consts
 from tp.libs.rig.noddle.core import component
 from tp.libs.rig.noddle.meta import layers, animcomponent as meta_component
 from tp.libs.rig.noddle.descriptors import component as descriptor_component
@@ -33,10 +34,12 @@ class AnimComponent(component.Component):
 
         return meta_node
 
-    def attach_to_skeleton(self) -> bool:
+    def attach_to_skeleton(self, use_matrices: bool | None = None) -> bool:
         """
         Attaches component joints into rig skeleton.
 
+        :param bool or None use_matrices: whether to drive rig joints through offset parent matrix networks instead of
+            constraints. If not given, rig configuration is used.
         :return: True if attach to skeleton process was completed successfully; False otherwise.
         :rtype: bool
         """
@@ -51,10 +54,19 @@ class AnimComponent(component.Component):
         self.logger.info(f'{self} attaching to skeleton...')
         component_joints = list(skeleton_layer.iterate_joints())
         rig_joints = rig_skeleton_layer.find_joints(*[joint.id() for joint in component_joints])
+        joint_pairs: list[tuple[api.Joint, api.Joint]] = []
         for component_joint, rig_joint in zip(component_joints, rig_joints):
             if not rig_joint:
                 self.logger.warning(f'Rig joint with ID "{component_joint.id()}" not found in rig skeleton')
                 continue
+            joint_pairs.append((component_joint, rig_joint))
+
+        use_matrices = self.rig.configuration.matrix_skeleton_attachment if use_matrices is None else use_matrices
+        if use_matrices:
+            self._attach_to_skeleton_with_matrices(joint_pairs)
+            return True
+
+        for component_joint, rig_joint in joint_pairs:
             if not self.rig.configuration.ignore_existing_constraints_on_skeleton_attachment:
                 found_parent_constraint: api.DGNode | None = None
                 for _, destination_plug in rig_joint.iterateConnections(source=False):
@@ -87,6 +99,11 @@ class AnimComponent(component.Component):
             self.logger.warning('Rig skeleton is not built.')
             return False
 
+        # Matrix attachment nodes are recorded in component meta node, so they can be deleted directly.
+        if self._detach_from_skeleton_with_matrices():
+            self.logger.info(f'{self} detached from skeleton.')
+            return True
+
         rig_joints_parent_constraints = set()
         component_joints_parent_constraints = set()
 
@@ -108,6 +125,8 @@ class AnimComponent(component.Component):
 
         self.logger.info(f'{self} detached from skeleton.')
 
+        return True
+
     def set_outliner_color(self, color: int | str | Iterable[float, float, float]):
         """
         Sets the color of the animatable component root control within outliner panel.
@@ -130,3 +149,133 @@ class AnimComponent(component.Component):
 
         for found_control, factor in scale_dict.items():
             found_control.scale_shapes(clamped_size, factor=factor)
+
+    def _attach_to_skeleton_with_matrices(self, joint_pairs: list[tuple[api.Joint, api.Joint]]):
+        """
+        Internal function that attaches the given rig joints to their component joints by driving the offset parent
+        matrix of each rig joint with a multMatrix node. All nodes are created, connected and recorded within the
+        component meta node using a single DG modifier.
+        Current offset between each rig joint and its component joint is maintained, and rig joint local channels
+        are left untouched. Original offset parent matrix of each rig joint is stored within its multMatrix node, so it
+        can be restored when detaching. Parent constraints attaching rig joints to their component joints are removed.
+
+        :param list[tuple[api.Joint, api.Joint]] joint_pairs: list of component joint and rig joint pairs.
+        """
+
+        # Previous matrix attachment of this component is removed, so attaching twice does not stack networks.
+        self._detach_from_skeleton_with_matrices()
+
+        nodes_plug = self.meta.skeleton_attachment_nodes_plug()
+        existing_indices = nodes_plug.getExistingArrayAttributeIndices()
+        next_index = existing_indices[-1] + 1 if existing_indices else 0
+        ignore_existing = self.rig.configuration.ignore_existing_constraints_on_skeleton_attachment
+
+        # Constraints must be removed before offsets are computed, so they do not keep driving the joints on top of the
+        # matrix network.
+        for component_joint, rig_joint in joint_pairs:
+            rig_joint_parent_constraints = set()
+            for _, destination_plug in rig_joint.iterateConnections(source=False):
+                node = destination_plug.node()
+                if node and node.apiType() == api.kParentConstraint:
+                    rig_joint_parent_constraints.add(node)
+            # when existing constraints are ignored, only the constraints attaching the rig joint to its component
+            # joint are removed.
+            if ignore_existing:
+                rig_joint_parent_constraints.intersection_update(
+                    destination_plug.node() for _, destination_plug in
+                    component_joint.iterateConnections(destination=False))
+            for constraint_node in rig_joint_parent_constraints:
+                self.logger.info(f'Replacing {rig_joint} constraint attachment to {component_joint}')
+                constraint_node.delete()
+
+        original_matrix_attr = consts.NODDLE_ORIGINAL_OFFSET_PARENT_MATRIX_ATTR
+        original_matrices: list[tuple[api.OpenMaya.MObject, api.OpenMaya.MMatrix]] = []
+        modifier = api.OpenMaya.MDGModifier()
+        for component_joint, rig_joint in joint_pairs:
+            component_fn = api.OpenMaya.MFnDependencyNode(component_joint.object())
+            rig_fn = api.OpenMaya.MFnDependencyNode(rig_joint.object())
+            offset_parent_plug = rig_fn.findPlug('offsetParentMatrix', False)
+            source_plug = offset_parent_plug.source()
+            if not source_plug.isNull:
+                if ignore_existing:
+                    self.logger.warning(f'{rig_joint} offset parent matrix is already connected, skipping attachment')
+                    continue
+                self.logger.info(f'Replacing {rig_joint} attachment to {component_joint}')
+                modifier.disconnect(source_plug, offset_parent_plug)
+
+            # offsetParentMatrix = inverse(local) * offset * componentWorld * parentInverse, where offset keeps the
+            # current relative transform between rig joint and component joint.
+            component_world_plug = component_fn.findPlug('worldMatrix', False).elementByLogicalIndex(0)
+            rig_world = _plug_matrix(rig_fn.findPlug('worldMatrix', False).elementByLogicalIndex(0))
+            rig_local = _plug_matrix(rig_fn.findPlug('matrix', False))
+            offset_matrix = rig_local.inverse() * rig_world * _plug_matrix(component_world_plug).inverse()
+
+            mult_matrix = modifier.createNode('multMatrix')
+            modifier.renameNode(mult_matrix, '_'.join([rig_joint.name(False), 'skeletonAttach', 'mtx']))
+            modifier.addAttribute(
+                mult_matrix, api.OpenMaya.MFnMatrixAttribute().create(original_matrix_attr, original_matrix_attr))
+            original_matrices.append((mult_matrix, _plug_matrix(offset_parent_plug)))
+            mult_fn = api.OpenMaya.MFnDependencyNode(mult_matrix)
+            matrix_in_plug = mult_fn.findPlug('matrixIn', False)
+            modifier.newPlugValue(
+                matrix_in_plug.elementByLogicalIndex(0), api.OpenMaya.MFnMatrixData().create(offset_matrix))
+            modifier.connect(component_world_plug, matrix_in_plug.elementByLogicalIndex(1))
+            modifier.connect(
+                rig_fn.findPlug('parentInverseMatrix', False).elementByLogicalIndex(0),
+                matrix_in_plug.elementByLogicalIndex(2))
+            modifier.connect(mult_fn.findPlug('matrixSum', False), offset_parent_plug)
+            modifier.connect(mult_fn.findPlug('message', False), nodes_plug.elementByLogicalIndex(next_index))
+            next_index += 1
+        modifier.doIt()
+
+        # Original matrix attributes only exist once the queued operations are executed.
+        for mult_matrix, original_matrix in original_matrices:
+            modifier.newPlugValue(
+                api.OpenMaya.MFnDependencyNode(mult_matrix).findPlug(original_matrix_attr, False),
+                api.OpenMaya.MFnMatrixData().create(original_matrix))
+        modifier.doIt()
+
+        self.logger.info(f'{self} attached {len(joint_pairs)} joints to skeleton through offset parent matrices.')
+
+    def _detach_from_skeleton_with_matrices(self) -> bool:
+        """
+        Internal function that deletes the matrix networks recorded in component meta node and restores the original
+        offset parent matrix of the rig joints they were driving, using a single DG modifier.
+
+        :return: True if any matrix attachment node was found and deleted; False otherwise.
+        :rtype: bool
+        """
+
+        attachment_nodes = list(self.meta.iterate_skeleton_attachment_nodes())
+        if not attachment_nodes:
+            return False
+
+        original_matrix_attr = consts.NODDLE_ORIGINAL_OFFSET_PARENT_MATRIX_ATTR
+        modifier = api.OpenMaya.MDGModifier()
+        for attachment_node in attachment_nodes:
+            attachment_fn = api.OpenMaya.MFnDependencyNode(attachment_node)
+            original_matrix = api.OpenMaya.MMatrix()
+            if attachment_fn.hasAttribute(original_matrix_attr):
+                original_matrix = _plug_matrix(attachment_fn.findPlug(original_matrix_attr, False))
+            output_plug = attachment_fn.findPlug('matrixSum', False)
+            for destination_plug in output_plug.destinations():
+                modifier.disconnect(output_plug, destination_plug)
+                modifier.newPlugValue(destination_plug, api.OpenMaya.MFnMatrixData().create(original_matrix))
+            modifier.deleteNode(attachment_node)
+        modifier.doIt()
+
+        self.logger.info(f'Deleted ({len(attachment_nodes)}) skeleton attachment nodes.')
+
+        return True
+
+
+def _plug_matrix(plug: api.OpenMaya.MPlug) -> api.OpenMaya.MMatrix:
+    """
+    Internal function that returns the matrix value of the given matrix plug.
+
+    :param api.OpenMaya.MPlug plug: matrix plug.
+    :return: plug matrix value.
+    :rtype: api.OpenMaya.MMatrix
+    """
+
+    return api.OpenMaya.MFnMatrixData(plug.asMObject()).matrix()
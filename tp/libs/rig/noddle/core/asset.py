@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import typing
 
-from tp.common.python import path, folder, fileio, yamlio, timedate
+from tp.common.python import path, folder, fileio, timedate
 
 from tp.libs.rig.noddle.interface import hud
+from tp.libs.rig.noddle.core import metacache
 from tp.libs.rig.noddle.functions import files
 
 if typing.TYPE_CHECKING:
@@ -71,6 +72,7 @@ class Asset:
 
         # set environment variables
         Asset._INSTANCE = self
+        self._project.invalidate()
         self._project.update_meta()
         self.update_meta()
         hud.NoddleHUD.refresh()
@@ -100,7 +102,7 @@ class Asset:
 
     @property
     def meta_data(self) -> dict:
-        return yamlio.read_file(self.meta_path) if path.is_file(self.meta_path) else dict()
+        return metacache.MetaDataCache.read_file(self.meta_path)
 
     @property
     def controls(self) -> str:
@@ -184,7 +186,7 @@ class Asset:
         data_dict = self.meta_data
         data_dict[key] = value
         data_dict['modified'] = timedate.get_date_and_time()
-        yamlio.write_to_file(data_dict, self.meta_path)
+        metacache.MetaDataCache.write_file(data_dict, self.meta_path)
 
     def update_meta(self):
         """
@@ -200,4 +202,11 @@ class Asset:
         meta_dict['model'] = meta_dict.get('model', '')
         if 'created' not in meta_dict:
             meta_dict['created'] = timedate.get_date_and_time()
-        yamlio.write_to_file(meta_dict, self.meta_path)
+        metacache.MetaDataCache.write_file(meta_dict, self.meta_path)
+
+    def invalidate(self):
+        """
+        Invalidates the cached metadata of this asset, so it is read again from disk.
+        """
+
+        metacache.MetaDataCache.invalidate(self.path)
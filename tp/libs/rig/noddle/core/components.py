@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import os
-import copy
+import sys
 import typing
 import inspect
+import tempfile
+import importlib
+import importlib.util
 
 from tp.core import log
-from tp.common.python import decorators, yamlio
+from tp.common.python import decorators, jsonio, yamlio
 from tp.common import plugin
 from tp.preferences.interfaces import noddle
 
@@ -26,14 +29,22 @@ class ComponentsManager:
     """
     Singleton class that manages and registers a collection of component classes. This class handles the creation and
     returning of component instances and descriptors.
+
+    Discovered components and parsed descriptors are stored within an on-disk manifest. While the manifest is valid
+    (search paths did not change and none of the directories, component modules or descriptor files were modified),
+    descriptors are not parsed again and component modules are only imported when their type is first requested.
     """
 
+    MANIFEST_VERSION = 1
+    MANIFEST_FILE_NAME = 'noddle_components_manifest.json'
+
     def __init__(self):
         super(ComponentsManager, self).__init__()
 
         self._components: dict[str, dict] = {}
         self._descriptors: dict[str, dict] = {}
         self._manager: plugin.PluginFactory | None = None
+        self._components_paths: list[str] = []
         self._preferences_interface = noddle.noddle_interface()
 
     @property
@@ -44,23 +55,43 @@ class ComponentsManager:
     def descriptors(self) -> dict:
         return self._descriptors
 
-    def refresh(self):
+    def refresh(self, force: bool = False):
         """
         Refreshes registered components by clearing the manager and rediscovering the components again.
+
+        :param bool force: whether to ignore components manifest and force the discovery of all components.
         """
 
         self._components.clear()
         self._descriptors.clear()
+        self._manager = None
+
+        search_paths = self._search_paths()
+        manifest = self._read_manifest()
+        if not force and self._is_manifest_valid(manifest, search_paths):
+            self._load_manifest(manifest)
+            return
+
         self._manager = plugin.PluginFactory(
             interface=component.Component, plugin_id='ID', name='NoddleComponentManager')
 
-        self.discover_components()
+        # descriptors from an outdated manifest are reused if their files were not modified
+        cached_descriptors: dict[str, dict] = {}
+        if manifest and manifest.get('version') == self.MANIFEST_VERSION:
+            for descriptor_data in manifest.get('descriptors', {}).values():
+                cached_descriptors[descriptor_data['path']] = descriptor_data
+        self.discover_components(cached_descriptors=cached_descriptors)
+        self._write_manifest(search_paths)
 
-    def discover_components(self):
+    def discover_components(self, cached_descriptors: dict[str, dict] | None = None):
         """
         Searches the component library based on the environment variable NODDLE_COMPONENTS_PATHS
+
+        :param dict[str, dict] or None cached_descriptors: optional already parsed descriptors data, keyed by descriptor
+            path, that are reused if their files were not modified.
         """
 
+        cached_descriptors = cached_descriptors or {}
         self._manager.register_paths_from_env_var(consts.COMPONENTS_ENV_VAR_KEY, package_name='noddle')
         component_paths = self._preferences_interface.user_components_paths()
         self._manager.register_paths(component_paths, package_name='noddle')
@@ -74,8 +105,14 @@ class ComponentsManager:
                     if descriptor_base_name in self._descriptors:
                         continue
                     descriptor_path = os.path.join(root, file_name)
-                    cache = self._load_descriptor_from_path(descriptor_path)
-                    self._descriptors[cache['type']] = {'path': descriptor_path, 'data': cache}
+                    descriptor_mtime = os.path.getmtime(descriptor_path)
+                    cached_descriptor = cached_descriptors.get(descriptor_path)
+                    if cached_descriptor is not None and cached_descriptor.get('mtime') == descriptor_mtime:
+                        cache = cached_descriptor['data']
+                    else:
+                        cache = self._load_descriptor_from_path(descriptor_path)
+                    self._descriptors[cache['type']] = {
+                        'path': descriptor_path, 'data': cache, 'mtime': descriptor_mtime}
 
         for class_obj in self._manager.plugins('noddle'):
             class_id = class_obj.ID if hasattr(class_obj, 'ID') else None
@@ -88,9 +125,24 @@ class ComponentsManager:
             self._components[class_id] = {
                 'object': class_obj,
                 'path': class_path,
-                'descriptor': class_id
+                'descriptor': class_id,
+                'module': class_obj.__module__,
+                'className': class_obj.__name__
             }
 
+    def manifest_path(self) -> str:
+        """
+        Returns the path where components manifest file is stored.
+        Path can be defined using NODDLE_COMPONENTS_MANIFEST_PATH environment variable.
+
+        :return: manifest file path.
+        :rtype: str
+        """
+
+        return os.environ.get(
+            consts.COMPONENTS_MANIFEST_ENV_VAR_KEY,
+            os.path.join(tempfile.gettempdir(), 'noddle', self.MANIFEST_FILE_NAME))
+
     def components_paths(self) -> list[str]:
         """
         Returns all registered components paths.
@@ -99,6 +151,9 @@ class ComponentsManager:
         :rtype: list(str)
         """
 
+        if self._manager is None:
+            return list(self._components_paths)
+
         return self._manager.paths('noddle')
 
     def component_data(self, component_type: str) -> dict | None:
@@ -110,11 +165,17 @@ class ComponentsManager:
         :rtype: dict or None
         """
 
-        return self._components.get(component_type)
+        component_data = self._components.get(component_type)
+        if component_data is not None and component_data['object'] is None:
+            self._load_component_class(component_data)
+
+        return component_data
 
     def load_component_descriptor(self, component_type: str) -> dict:
         """
         Loads teh descriptor file for the component of the given type already registered.
+        Returned dictionary is a shallow copy: nested data is shared with the cached descriptor, so it must be replaced
+        instead of modified in place. Descriptor instances created from this data never modify it.
 
         :param str component_type: component type to load.
         :return: component data loaded from component descriptor file.
@@ -129,7 +190,7 @@ class ComponentsManager:
 
         try:
             descriptor_data = self._descriptors[self._components[component_type]['descriptor']]
-            return copy.deepcopy(descriptor_data['data'])
+            return dict(descriptor_data['data'])
         except ValueError:
             logger.error(f'Failed to load component descriptor: {component_type}', exc_info=True)
             raise ValueError(f'Failed to load component descriptor: {component_type}')
@@ -167,12 +228,17 @@ class ComponentsManager:
         """
 
         try:
-            return self._components[component_type]['object']
+            component_data = self._components[component_type]
         except KeyError:
             raise ValueError(
                 'Component requested is not available. Requested: {}; Available: {}'.format(
                     component_type, self._components.keys()))
 
+        if component_data['object'] is None:
+            self._load_component_class(component_data)
+
+        return component_data['object']
+
     def from_meta_node(self, rig: Rig, meta: NoddleComponent) -> component.Component:
         """
         Creates a new component instance and attaches it to given rig.
@@ -208,3 +274,138 @@ class ComponentsManager:
         except ValueError:
             logger.error(f'Failed to load component descriptor: {descriptor_path}', exc_info=True)
             raise ValueError(f'Failed to load component descriptor: {descriptor_path}')
+
+    def _search_paths(self) -> dict:
+        """
+        Internal function that returns the paths where components and descriptors are searched.
+
+        :return: search paths data.
+        :rtype: dict
+        """
+
+        return {
+            'components': os.environ.get(consts.COMPONENTS_ENV_VAR_KEY, ''),
+            'descriptors': os.environ.get(consts.DESCRIPTORS_ENV_VAR_KEY, ''),
+            'user': list(self._preferences_interface.user_components_paths())
+        }
+
+    def _read_manifest(self) -> dict | None:
+        """
+        Internal function that reads the components manifest file.
+
+        :return: manifest data.
+        :rtype: dict or None
+        """
+
+        manifest_path = self.manifest_path()
+        if not os.path.isfile(manifest_path):
+            return None
+
+        try:
+            return jsonio.read_file(manifest_path)
+        except Exception:
+            logger.warning(f'Failed to read components manifest: {manifest_path}', exc_info=True)
+            return None
+
+    def _is_manifest_valid(self, manifest: dict | None, search_paths: dict) -> bool:
+        """
+        Internal function that returns whether given manifest data is still valid.
+
+        :param dict or None manifest: manifest data.
+        :param dict search_paths: current search paths data.
+        :return: True if manifest is valid; False otherwise.
+        :rtype: bool
+        """
+
+        if not manifest or manifest.get('version') != self.MANIFEST_VERSION or manifest.get(
+                'searchPaths') != search_paths:
+            return False
+
+        tracked_files = list(manifest.get('directories', {}).items())
+        tracked_files.extend((data['path'], data['mtime']) for data in manifest.get('components', {}).values())
+        tracked_files.extend((data['path'], data['mtime']) for data in manifest.get('descriptors', {}).values())
+        for file_path, mtime in tracked_files:
+            try:
+                if os.path.getmtime(file_path) != mtime:
+                    return False
+            except OSError:
+                return False
+
+        return True
+
+    def _load_manifest(self, manifest: dict):
+        """
+        Internal function that registers the components and descriptors stored within given manifest data.
+        Component classes are not loaded until they are requested.
+
+        :param dict manifest: manifest data.
+        """
+
+        self._components_paths = list(manifest.get('componentPaths', []))
+        for component_type, component_data in manifest.get('components', {}).items():
+            self._components[component_type] = dict(component_data, object=None)
+        for descriptor_type, descriptor_data in manifest.get('descriptors', {}).items():
+            self._descriptors[descriptor_type] = dict(descriptor_data)
+
+    def _write_manifest(self, search_paths: dict):
+        """
+        Internal function that writes the components manifest file with the currently registered components and
+        descriptors.
+
+        :param dict search_paths: search paths data.
+        """
+
+        component_paths = self._manager.paths('noddle')
+        self._components_paths = list(component_paths)
+        root_paths = [path for path in search_paths['components'].split(os.pathsep) if path]
+        root_paths.extend(path for path in search_paths['descriptors'].split(os.pathsep) if path)
+        root_paths.extend(search_paths['user'])
+        directories: dict[str, float] = {}
+        for root_path in root_paths:
+            for root, _, _ in os.walk(root_path):
+                directories[root] = os.path.getmtime(root)
+
+        manifest = {
+            'version': self.MANIFEST_VERSION,
+            'searchPaths': search_paths,
+            'componentPaths': list(component_paths),
+            'directories': directories,
+            'components': {
+                component_type: {
+                    'path': component_data['path'], 'mtime': os.path.getmtime(component_data['path']),
+                    'descriptor': component_data['descriptor'], 'module': component_data['module'],
+                    'className': component_data['className']
+                } for component_type, component_data in self._components.items()},
+            'descriptors': self._descriptors
+        }
+
+        manifest_path = self.manifest_path()
+        try:
+            os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+            jsonio.write_to_file(manifest, manifest_path)
+        except Exception:
+            logger.warning(f'Failed to write components manifest: {manifest_path}', exc_info=True)
+
+    @staticmethod
+    def _load_component_class(component_data: dict):
+        """
+        Internal function that imports the module of the given component and stores its class within component data.
+
+        :param dict component_data: component data {'object': None, 'path': str, 'module': str, 'className': str}.
+        """
+
+        module_name = component_data['module']
+        module = sys.modules.get(module_name)
+        if module is None:
+            try:
+                module = importlib.import_module(module_name)
+            except ImportError:
+                spec = importlib.util.spec_from_file_location(module_name, component_data['path'])
+                module = importlib.util.module_from_spec(spec)
+                sys.modules[module_name] = module
+                spec.loader.exec_module(module)
+
+        class_obj = getattr(module, component_data['className'])
+        if not getattr(class_obj, 'ID', None):
+            class_obj.ID = class_obj.__name__
+        component_data['object'] = class_obj
@@ -67,6 +67,7 @@ class Configuration:
         self._guide_control_visibility = False
         self._guide_pivot_visibility = True
         self._ignore_existing_constraints_on_skeleton_attachment = False
+        self._matrix_skeleton_attachment = False
 
         self._initialize_managers()
         self._initialize_environment()
@@ -242,6 +243,29 @@ class Configuration:
 
         return self._ignore_existing_constraints_on_skeleton_attachment
 
+    @property
+    def matrix_skeleton_attachment(self) -> bool:
+        """
+        Returns whether components are attached to rig skeleton through offset parent matrix networks instead of
+        constraints.
+
+        :return: True if matrix networks are used to attach components to rig skeleton; False otherwise.
+        :rtype: bool
+        """
+
+        return self._matrix_skeleton_attachment
+
+    @matrix_skeleton_attachment.setter
+    def matrix_skeleton_attachment(self, flag: bool):
+        """
+        Sets whether components are attached to rig skeleton through offset parent matrix networks instead of
+        constraints.
+
+        :param bool flag: True if matrix networks are used to attach components to rig skeleton; False otherwise.
+        """
+
+        self._matrix_skeleton_attachment = flag
+
     def update_from_cache(self, cache: dict, rig: Rig | None = None):
         """
         Updates this configuration from the given configuration dictionary.
@@ -285,7 +309,8 @@ class Configuration:
                         'autoAlignGuides',
                         'guidePivotVisibility',
                         'guideControlVisibility',
-                        'hideControlShapesInOutliner'):
+                        'hideControlShapesInOutliner',
+                        'matrixSkeletonAttachment'):
             config_state = cache.get(setting)
             current_state = None
             if hasattr(self, setting):
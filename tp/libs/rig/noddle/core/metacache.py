@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+import timeit
+
+from tp.core import log
+from tp.common.python import yamlio
+
+logger = log.rigLogger
+
+
+class MetaDataCache:
+    """
+    Process wide cache of metadata files contents and directory listings used by projects and assets.
+    Each entry is keyed by its path and stores the stat signature of the file or directory when it was read, so
+    entries are only read again from disk when a stat call shows that the file or directory changed.
+    """
+
+    _FILES: dict[str, tuple[tuple[int, int], dict]] = {}
+    _DIRECTORIES: dict[str, tuple[int, list[str]]] = {}
+
+    @classmethod
+    def read_file(cls, file_path: str) -> dict:
+        """
+        Returns the contents of the given YAML metadata file.
+
+        :param str file_path: absolute path of the metadata file.
+        :return: metadata dictionary. Empty dictionary if the file does not exist.
+        :rtype: dict
+        ..note:: returned dictionary is a shallow copy, so nested values should not be modified in place.
+        """
+
+        file_path = os.path.normpath(file_path)
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            cls._FILES.pop(file_path, None)
+            return {}
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = cls._FILES.get(file_path)
+        if cached is None or cached[0] != signature:
+            cached = (signature, yamlio.read_file(file_path) or {})
+            cls._FILES[file_path] = cached
+
+        return dict(cached[1])
+
+    @classmethod
+    def write_file(cls, data: dict, file_path: str, **kwargs):
+        """
+        Writes given metadata into the given YAML file and invalidates its cached contents.
+
+        :param dict data: metadata to write.
+        :param str file_path: absolute path of the metadata file.
+        :param Dict kwargs: extra keyword arguments passed to the YAML writer.
+        """
+
+        yamlio.write_to_file(data, file_path, **kwargs)
+        cls._FILES.pop(os.path.normpath(file_path), None)
+
+    @classmethod
+    def sub_directories(cls, directory: str) -> list[str]:
+        """
+        Returns the names of the directories within the given directory.
+
+        :param str directory: absolute path of the directory to list.
+        :return: list of directory names. Empty list if the directory does not exist.
+        :rtype: list[str]
+        ..note:: returned list is shared with the cache, so it should not be modified.
+        """
+
+        directory = os.path.normpath(directory)
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            cls._DIRECTORIES.pop(directory, None)
+            return []
+
+        cached = cls._DIRECTORIES.get(directory)
+        if cached is None or cached[0] != mtime:
+            with os.scandir(directory) as entries:
+                cached = (mtime, [entry.name for entry in entries if entry.is_dir()])
+            cls._DIRECTORIES[directory] = cached
+
+        return cached[1]
+
+    @classmethod
+    def invalidate(cls, root_path: str | None = None):
+        """
+        Invalidates the cached entries of the given path and of all the files and directories under it.
+
+        :param str or None root_path: path to invalidate. If not given, the whole cache is cleared.
+        """
+
+        if root_path is None:
+            cls._FILES.clear()
+            cls._DIRECTORIES.clear()
+            return
+
+        root_path = os.path.normpath(root_path)
+        prefix = os.path.join(root_path, '')
+        for cache in (cls._FILES, cls._DIRECTORIES):
+            for cached_path in [p for p in cache if p == root_path or p.startswith(prefix)]:
+                del cache[cached_path]
+
+
+def project_meta_data(directory: str, meta_path: str) -> dict:
+    """
+    Returns the metadata of the project located in given directory. Project metadata contains the contents of the
+    project metadata file and the list of assets names of each one of the project categories.
+
+    :param str directory: absolute path of the project directory.
+    :param str meta_path: absolute path of the project metadata file.
+    :return: project metadata.
+    :rtype: dict
+    """
+
+    meta_dict = MetaDataCache.read_file(meta_path)
+    for category in MetaDataCache.sub_directories(directory):
+        meta_dict[category] = MetaDataCache.sub_directories(os.path.join(directory, category))
+
+    return meta_dict
+
+
+def benchmark_project_meta_data(
+        asset_counts: tuple[int, ...] = (10, 100, 1000, 5000), categories: tuple[str, ...] = ('characters', 'props'),
+        iterations: int = 50) -> dict[int, tuple[float, float]]:
+    """
+    Benchmarks project metadata access within temporary projects with the given number of assets, both reading from
+    disk on every access and using the metadata cache.
+    Cached access cost stays flat as the assets count grows, because only the project metadata file and the category
+    directories are stat on each access.
+
+    :param tuple[int, ...] asset_counts: number of assets of each one of the benchmarked projects.
+    :param tuple[str, ...] categories: project categories the assets are distributed into.
+    :param int iterations: number of metadata accesses to time for each project.
+    :return: dictionary mapping each assets count with the average uncached and cached access times in seconds.
+    :rtype: dict[int, tuple[float, float]]
+    """
+
+    results: dict[int, tuple[float, float]] = {}
+    for asset_count in asset_counts:
+        directory = tempfile.mkdtemp(prefix='noddle_meta_benchmark_')
+        try:
+            for i in range(asset_count):
+                os.makedirs(os.path.join(directory, categories[i % len(categories)], f'asset{i}'))
+            meta_path = os.path.join(directory, f'{os.path.basename(directory)}.meta')
+            yamlio.write_to_file({'created': 'benchmark'}, meta_path)
+
+            def _uncached_access():
+                MetaDataCache.invalidate(directory)
+                project_meta_data(directory, meta_path)
+
+            uncached_time = timeit.timeit(_uncached_access, number=iterations) / iterations
+            project_meta_data(directory, meta_path)
+            cached_time = timeit.timeit(lambda: project_meta_data(directory, meta_path), number=iterations) / iterations
+            results[asset_count] = (uncached_time, cached_time)
+            logger.info(
+                f'{asset_count} assets: uncached {uncached_time * 1000.0:.3f}ms, cached {cached_time * 1000.0:.3f}ms')
+        finally:
+            MetaDataCache.invalidate(directory)
+            shutil.rmtree(directory, ignore_errors=True)
+
+    return results
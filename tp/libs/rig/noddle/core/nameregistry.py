@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import contextlib
+from typing import Callable, Hashable, Iterator
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as OpenMaya
+
+from tp.core import log
+
+logger = log.rigLogger
+
+
+class NameRegistry:
+    """
+    Scene scoped registry of node names used to generate unique names without probing the scene.
+    Registry does not register any Maya callback by itself: outside of a registry session, names are checked directly
+    within the scene. Within a session, scene names are snapshotted once and kept in sync through Maya callbacks when
+    nodes are added, removed or renamed, and generated names are reserved, so consecutive calls never return the same
+    name even before the node is created.
+    """
+
+    _NAME_COUNTS: dict[str, int] | None = None
+    _RESERVED: set[str] = set()
+    _NEXT_INDICES: dict[Hashable, int] = {}
+    _NAME_OWNERS: dict[str, tuple[Hashable, int]] = {}
+    _CALLBACK_IDS: list[int] = []
+    _CALLBACK_USERS = 0
+
+    @classmethod
+    @contextlib.contextmanager
+    def session(cls) -> Iterator[type[NameRegistry]]:
+        """
+        Context manager that keeps the registry in sync with the scene while the context is active.
+
+        :return: name registry class.
+        :rtype: Iterator[type[NameRegistry]]
+        """
+
+        cls.register_callbacks()
+        try:
+            yield cls
+        finally:
+            cls.unregister_callbacks()
+
+    @classmethod
+    def is_active(cls) -> bool:
+        """
+        Returns whether registry is being kept in sync with the scene.
+
+        :return: True if registry callbacks are registered; False otherwise.
+        :rtype: bool
+        """
+
+        return bool(cls._CALLBACK_IDS)
+
+    @classmethod
+    def exists(cls, name: str) -> bool:
+        """
+        Returns whether a node with given name exists within current scene or whether given name is reserved.
+
+        :param str name: node name to check.
+        :return: True if name is already in use; False otherwise.
+        :rtype: bool
+        """
+
+        if not cls._CALLBACK_IDS:
+            return cmds.objExists(name)
+
+        return cls._name_counts().get(name, 0) > 0 or name in cls._RESERVED
+
+    @classmethod
+    def reserve(cls, name: str):
+        """
+        Reserves given name, so it is not returned by unique_name function. Names are only reserved within a registry
+        session.
+
+        :param str name: name to reserve.
+        """
+
+        if not cls._CALLBACK_IDS:
+            return
+
+        cls._name_counts()
+        cls._RESERVED.add(name)
+
+    @classmethod
+    def unique_name(
+            cls, key: Hashable, compose: Callable[[int], str], start_index: int = 0, timeout: int = 300) -> str:
+        """
+        Returns and reserves the first free name generated by given compose function.
+        Within a registry session, next free index for each key is remembered, so subsequent calls with the same key do
+        not probe the indices that were already used.
+
+        :param Hashable key: key that identifies the names generated by given compose function.
+        :param Callable[[int], str] compose: function that returns the name for the given index.
+        :param int start_index: index to start looking for free names from.
+        :param int timeout: number of probed indices after which a warning is logged.
+        :return: unique name.
+        :rtype: str
+        """
+
+        active = cls.is_active()
+        index = max(cls._NEXT_INDICES.get(key, start_index), start_index) if active else start_index
+        probe_start_index = index
+        name = compose(index)
+        while cls.exists(name):
+            if active:
+                cls._NAME_OWNERS.setdefault(name, (key, index))
+            index += 1
+            name = compose(index)
+            if index - probe_start_index == timeout:
+                logger.warning(f'Reached maximum number of iterations ({timeout}) while looking for a unique name')
+
+        if active:
+            cls._NEXT_INDICES[key] = index + 1
+            cls._NAME_OWNERS[name] = (key, index)
+            cls.reserve(name)
+
+        return name
+
+    @classmethod
+    def clear(cls):
+        """
+        Clears scene names snapshot and all reserved names.
+        """
+
+        cls._NAME_COUNTS = None
+        cls._RESERVED.clear()
+        cls._NEXT_INDICES.clear()
+        cls._NAME_OWNERS.clear()
+
+    @classmethod
+    def register_callbacks(cls):
+        """
+        Registers the Maya callbacks used to keep the registry in sync with current scene.
+        Each call must be paired with an unregister_callbacks call, callbacks are removed once no one uses them.
+        """
+
+        cls._CALLBACK_USERS += 1
+        if cls._CALLBACK_IDS:
+            return
+
+        cls.clear()
+        cls._CALLBACK_IDS = [
+            OpenMaya.MDGMessage.addNodeAddedCallback(cls._on_node_added),
+            OpenMaya.MDGMessage.addNodeRemovedCallback(cls._on_node_removed),
+            OpenMaya.MNodeMessage.addNameChangedCallback(OpenMaya.MObject.kNullObj, cls._on_name_changed),
+            OpenMaya.MSceneMessage.addCallback(OpenMaya.MSceneMessage.kBeforeNew, cls._on_scene_changed),
+            OpenMaya.MSceneMessage.addCallback(OpenMaya.MSceneMessage.kBeforeOpen, cls._on_scene_changed),
+            OpenMaya.MSceneMessage.addCallback(OpenMaya.MSceneMessage.kAfterOpen, cls._on_scene_changed),
+        ]
+
+    @classmethod
+    def unregister_callbacks(cls):
+        """
+        Unregisters registry Maya callbacks, if no one else is using them, and clears the registry.
+        """
+
+        cls._CALLBACK_USERS = max(0, cls._CALLBACK_USERS - 1)
+        if cls._CALLBACK_USERS:
+            return
+
+        if cls._CALLBACK_IDS:
+            OpenMaya.MMessage.removeCallbacks(cls._CALLBACK_IDS)
+        cls._CALLBACK_IDS = []
+        cls.clear()
+
+    @classmethod
+    def _name_counts(cls) -> dict[str, int]:
+        """
+        Internal function that returns the number of nodes using each name within current scene, taking the snapshot
+        of the scene names if necessary.
+
+        :return: scene names counts.
+        :rtype: dict[str, int]
+        """
+
+        if cls._NAME_COUNTS is None:
+            name_counts: dict[str, int] = {}
+            node_iterator = OpenMaya.MItDependencyNodes()
+            node_fn = OpenMaya.MFnDependencyNode()
+            while not node_iterator.isDone():
+                node_fn.setObject(node_iterator.thisNode())
+                name = node_fn.name()
+                name_counts[name] = name_counts.get(name, 0) + 1
+                node_iterator.next()
+            cls._NAME_COUNTS = name_counts
+
+        return cls._NAME_COUNTS
+
+    @classmethod
+    def _add_name(cls, name: str):
+        """
+        Internal function that registers a new scene node with given name.
+
+        :param str name: node name.
+        """
+
+        cls._NAME_COUNTS[name] = cls._NAME_COUNTS.get(name, 0) + 1
+        cls._RESERVED.discard(name)
+
+    @classmethod
+    def _remove_name(cls, name: str):
+        """
+        Internal function that unregisters a scene node with given name.
+        If the freed name was generated by the registry, the next free index of the key that generated it is lowered,
+        so the name can be reused.
+
+        :param str name: node name.
+        """
+
+        count = cls._NAME_COUNTS.get(name, 0) - 1
+        if count > 0:
+            cls._NAME_COUNTS[name] = count
+        else:
+            cls._NAME_COUNTS.pop(name, None)
+            owner = cls._NAME_OWNERS.pop(name, None)
+            if owner is not None:
+                key, index = owner
+                if index < cls._NEXT_INDICES.get(key, index):
+                    cls._NEXT_INDICES[key] = index
+
+    @classmethod
+    def _on_node_added(cls, node: OpenMaya.MObject, *args):
+        """
+        Internal callback function that is called each time a node is added into the scene.
+
+        :param OpenMaya.MObject node: added node.
+        """
+
+        if cls._NAME_COUNTS is not None:
+            cls._add_name(OpenMaya.MFnDependencyNode(node).name())
+
+    @classmethod
+    def _on_node_removed(cls, node: OpenMaya.MObject, *args):
+        """
+        Internal callback function that is called each time a node is removed from the scene.
+
+        :param OpenMaya.MObject node: removed node.
+        """
+
+        if cls._NAME_COUNTS is not None:
+            cls._remove_name(OpenMaya.MFnDependencyNode(node).name())
+
+    @classmethod
+    def _on_name_changed(cls, node: OpenMaya.MObject, previous_name: str, *args):
+        """
+        Internal callback function that is called each time a node is renamed.
+
+        :param OpenMaya.MObject node: renamed node.
+        :param str previous_name: previous name of the node.
+        """
+
+        # name changed callback can be triggered with an empty previous name while nodes are being created, those names
+        # are already registered by node added callback.
+        if cls._NAME_COUNTS is None or not previous_name:
+            return
+
+        cls._remove_name(previous_name)
+        cls._add_name(OpenMaya.MFnDependencyNode(node).name())
+
+    @classmethod
+    def _on_scene_changed(cls, *args):
+        """
+        Internal callback function that is called each time a new scene is created or opened.
+        """
+
+        cls.clear()
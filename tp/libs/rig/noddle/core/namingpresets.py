@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 import json
 import tempfile
+from typing import Callable
 
 from tp.core import log
 from tp.common.python import osplatform, path, folder, jsonio
@@ -283,6 +284,7 @@ class NameManagerData:
         self._name = name
         self._noddle_type = noddle_type
         self._manager: manager.NameManager | None = None
+        self._manager_loader: Callable[[], manager.NameManager] | None = None
 
     def __eq__(self, other: NameManagerData) -> bool:
         if not isinstance(other, NameManagerData):
@@ -307,11 +309,25 @@ class NameManagerData:
 
     @property
     def manager(self) -> manager.NameManager:
+        if self._manager is None and self._manager_loader is not None:
+            self._manager = self._manager_loader()
+            self._manager_loader = None
         return self._manager
 
     @manager.setter
     def manager(self, value):
         self._manager = value
+        self._manager_loader = None
+
+    def set_manager_loader(self, loader: Callable[[], manager.NameManager]):
+        """
+        Sets the function used to load the name manager the first time it is requested.
+
+        :param Callable[[], manager.NameManager] loader: function that returns the name manager.
+        """
+
+        self._manager = None
+        self._manager_loader = loader
 
     def serialize(self) -> dict:
         """
@@ -333,6 +349,9 @@ class PresetsManager:
     """
 
     ENV_VAR = 'NODDLE_NAME_PRESET_PATH'
+    CACHE_ENV_VAR = 'NODDLE_NAME_PRESET_CACHE_PATH'
+    CACHE_FILE_NAME = 'namingpresetscache.json'
+    CACHE_VERSION = 1
 
     def __init__(self):
         super().__init__()
@@ -346,9 +365,19 @@ class PresetsManager:
         # root preset loaded from naming preset hierarchy
         self._root_preset: Preset | None = None
 
-        # dictionary containing all naming managers
+        # set containing the clean file paths of all presets
+        self._preset_paths: set[str] = set()
+
+        # dictionary containing all loaded naming managers
         self._naming_managers: dict[str, manager.NameManager] = {}
 
+        # dictionary containing the file paths of all the naming managers that can be loaded
+        self._naming_manager_paths: dict[str, str] = {}
+
+        # dictionary containing parsed preset and config files data, keyed by file path
+        self._files_cache: dict[str, tuple[float, dict]] = {}
+        self._files_cache_changed = False
+
         # dictionary containing all available naming manager types
         self._available_manager_types = set()
 
@@ -402,12 +431,7 @@ class PresetsManager:
         :rtype: bool
         """
 
-        file_path = path.clean_path(file_path)
-        for preset in self._presets:
-            if path.clean_path(preset.file_path) == file_path:
-                return True
-
-        return False
+        return path.clean_path(file_path) in self._preset_paths
 
     def load_from_file(self, file_path: str) -> manager.NameManager | Preset | None:
         """
@@ -422,15 +446,27 @@ class PresetsManager:
             return
 
         if file_path.endswith('.' + PRESET_EXT):
-            loaded_preset = Preset.load_from_path(path.clean_path(file_path))
-            if loaded_preset is not None:
-                self._presets.append(loaded_preset)
-                for manager_data in loaded_preset.managers_data:
-                    self._available_manager_types.add(manager_data.noddle_type)
-                return loaded_preset
+            file_path = path.clean_path(file_path)
+            try:
+                data = self._read_file_data(file_path)
+            except json.decoder.JSONDecodeError:
+                logger.error(f'Failed to load preset file: {file_path}', exc_info=True)
+                return None
+            loaded_preset = Preset.load_from_data(data, file_path)
+            self._presets.append(loaded_preset)
+            self._preset_paths.add(file_path)
+            for manager_data in loaded_preset.managers_data:
+                self._available_manager_types.add(manager_data.noddle_type)
+            return loaded_preset
         elif file_path.endswith('.' + CONFIG_EXT):
-            loaded_manager = manager.NameManager.from_path(file_path)
-            self._naming_managers[loaded_manager.name] = loaded_manager
+            # name managers are only created when they are used for the first time
+            try:
+                config_name = self._read_file_data(file_path).get('name')
+            except json.decoder.JSONDecodeError:
+                logger.error(f'Failed to load naming config file: {file_path}', exc_info=True)
+                return None
+            self._naming_managers.pop(config_name, None)
+            self._naming_manager_paths[config_name] = file_path
 
     def load_from_directory_path(self, directory: str):
         """
@@ -460,9 +496,12 @@ class PresetsManager:
         """
 
         self._presets.clear()
+        self._preset_paths.clear()
         self._root_preset = None
         self._naming_managers.clear()
+        self._naming_manager_paths.clear()
         self._available_manager_types.clear()
+        self._load_files_cache()
 
         paths = osplatform.get_env_var(self.ENV_VAR, default='').split(os.pathsep)
         pref_paths = self._preferences_interface.naming_preset_paths()
@@ -484,6 +523,29 @@ class PresetsManager:
                 continue
 
         self._load_preset_hierarchy(hierarchy)
+        self._save_files_cache()
+
+    def naming_manager(self, name: str) -> manager.NameManager | None:
+        """
+        Returns the naming manager with given name, loading it if necessary.
+
+        :param str name: name of the naming manager to get.
+        :return: naming manager instance.
+        :rtype: manager.NameManager or None
+        """
+
+        naming_manager = self._naming_managers.get(name)
+        if naming_manager is not None:
+            return naming_manager
+
+        file_path = self._naming_manager_paths.get(name)
+        if file_path is None:
+            return None
+
+        naming_manager = manager.NameManager.from_path(file_path)
+        self._naming_managers[name] = naming_manager
+
+        return naming_manager
 
     def hierarchy_data(self) -> dict:
         """
@@ -526,6 +588,7 @@ class PresetsManager:
         if parent is not None:
             parent.children.append(new_preset)
         self._presets.append(new_preset)
+        self._preset_paths.add(path.clean_path(file_path))
 
         return new_preset
 
@@ -564,6 +627,9 @@ class PresetsManager:
             parent_preset.children.remove(found_preset)
 
         self._presets.remove(found_preset)
+        preset_path = path.clean_path(found_preset.file_path)
+        if not any(path.clean_path(preset.file_path) == preset_path for preset in self._presets):
+            self._preset_paths.discard(preset_path)
 
         return True
 
@@ -652,24 +718,40 @@ class PresetsManager:
             child_preset.parent = parent
 
             for name_manager_data in child_preset.managers_data:
-                name_manager = self._naming_managers.get(name_manager_data.name)
-                if name_manager is None:
+                if name_manager_data.name not in self._naming_manager_paths:
                     # if no manager found we set it to the Noddle global one
-                    name_manager_data.manager = global_config
+                    name_manager_data.set_manager_loader(lambda: self.naming_manager('noddleGlobalConfig'))
                     continue
-                name_manager_data.manager = name_manager
-                parent_manager = global_config if name_manager_data.noddle_type != 'global' else None
-                if parent is not None:
-                    parent_manager = parent.find_name_manager_for_type(name_manager_data.noddle_type)
-                name_manager.parent_manager = parent_manager
+                name_manager_data.set_manager_loader(
+                    lambda _data=name_manager_data, _parent=parent: _load_name_manager(_data, _parent))
 
             for _child_hierarchy in child_hierarchy.get('children', list()):
                 _process_child(_child_hierarchy, parent=child_preset)
 
             return child_preset
 
+        def _load_name_manager(name_manager_data: NameManagerData, parent: Preset | None) -> manager.NameManager:
+            """
+            Internal function that loads the name manager of the given data and sets its parent manager.
+
+            :param NameManagerData name_manager_data: name manager data to load manager of.
+            :param Preset or None parent: parent preset.
+            :return: loaded name manager.
+            :rtype: manager.NameManager
+            """
+
+            name_manager = self.naming_manager(name_manager_data.name)
+            parent_manager = self.naming_manager('noddleGlobalConfig') if name_manager_data.noddle_type != 'global' \
+                else None
+            if parent is not None:
+                parent_manager = parent.find_name_manager_for_type(name_manager_data.noddle_type)
+            name_manager.parent_manager = parent_manager
+
+            return name_manager
+
         current_presets = {i.name: i for i in self._presets}
-        global_config = self._naming_managers['noddleGlobalConfig']
+        if 'noddleGlobalConfig' not in self._naming_manager_paths:
+            raise KeyError('noddleGlobalConfig')
 
         if hierarchy:
             root = _process_child(hierarchy, parent=None)
@@ -682,3 +764,79 @@ class PresetsManager:
                 root.children.append(preset)
 
         self._root_preset = root
+
+    def cache_path(self) -> str:
+        """
+        Returns the path where parsed presets and configs cache file is stored. By default, it is stored within the
+        user preferences folder. Path can be defined using NODDLE_NAME_PRESET_CACHE_PATH environment variable.
+
+        :return: cache file path.
+        :rtype: str
+        """
+
+        return os.environ.get(
+            self.CACHE_ENV_VAR, path.join_path(self._preferences_interface.user_cache_path(), self.CACHE_FILE_NAME))
+
+    def _read_file_data(self, file_path: str) -> dict:
+        """
+        Internal function that returns the parsed data of the given preset or config file. Parsed data is cached by
+        file modification time.
+
+        :param str file_path: absolute preset or config file path.
+        :return: parsed file data.
+        :rtype: dict
+        :raises json.decoder.JSONDecodeError: if file is not a valid JSON file.
+        """
+
+        mtime = os.path.getmtime(file_path)
+        cached_mtime, data = self._files_cache.get(file_path, (None, None))
+        if cached_mtime != mtime:
+            logger.debug(f'Parsing naming file: {file_path}')
+            data = jsonio.read_file(file_path)
+            self._files_cache[file_path] = (mtime, data)
+            self._files_cache_changed = True
+
+        return data
+
+    def _load_files_cache(self):
+        """
+        Internal function that loads parsed presets and configs cache from disk.
+        """
+
+        self._files_cache = {}
+        self._files_cache_changed = False
+        cache_path = self.cache_path()
+        if not os.path.isfile(cache_path):
+            return
+
+        try:
+            cache = jsonio.read_file(cache_path)
+            if cache.get('version') != self.CACHE_VERSION:
+                return
+            self._files_cache = {
+                file_path: (mtime, data) for file_path, (mtime, data) in cache.get('files', {}).items()
+                if isinstance(data, dict)}
+        except Exception:
+            logger.warning(f'Failed to load naming presets cache: {cache_path}', exc_info=True)
+
+    def _save_files_cache(self):
+        """
+        Internal function that saves parsed presets and configs cache into disk, if it changed.
+        """
+
+        if not self._files_cache_changed:
+            return
+
+        cache_path = self.cache_path()
+        cache = {
+            'version': self.CACHE_VERSION,
+            'files': {file_path: [mtime, data] for file_path, (mtime, data) in self._files_cache.items()}}
+        try:
+            folder.ensure_folder_exists(os.path.dirname(cache_path))
+            temp_path = f'{cache_path}.tmp'
+            with open(temp_path, 'w') as f:
+                json.dump(cache, f)
+            os.replace(temp_path, cache_path)
+            self._files_cache_changed = False
+        except Exception:
+            logger.warning(f'Failed to save naming presets cache: {cache_path}', exc_info=True)
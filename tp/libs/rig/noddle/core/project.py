@@ -1,14 +1,12 @@
 from __future__ import annotations
 
-import os
-
 from typing import Dict
 
 from tp.core import log
-from tp.common.python import path, folder, fileio, yamlio, timedate
+from tp.common.python import path, folder, fileio, timedate
 from tp.preferences import manager as preferences
 
-from tp.libs.rig.noddle.core import asset
+from tp.libs.rig.noddle.core import asset, metacache
 from tp.libs.rig.noddle.interface import hud
 
 logger = log.rigLogger
@@ -49,16 +47,7 @@ class Project:
 
     @property
     def meta_data(self) -> Dict:
-        meta_dict = {}
-        if path.is_file(self.meta_path):
-            meta_dict = yamlio.read_file(self.meta_path)
-        for category in os.listdir(self.path):
-            category_path = path.join_path(self.path, category)
-            if path.is_dir(category_path):
-                asset_dirs = filter(path.is_dir, [path.join_path(category_path, item) for item in os.listdir(category_path)])
-                meta_dict[category] = [path.basename(asset) for asset in asset_dirs]
-
-        return meta_dict
+        return metacache.project_meta_data(self.path, self.meta_path)
 
     @classmethod
     def is_project(cls, directory: str) -> bool:
@@ -172,14 +161,21 @@ class Project:
 
         data_dict = self.meta_data
         data_dict[key] = value
-        yamlio.write_to_file(data_dict, self.meta_path, sort_keys=False)
+        metacache.MetaDataCache.write_file(data_dict, self.meta_path, sort_keys=False)
 
     def update_meta(self):
         """
         Updates metadata file with the internal data of this instance.
         """
 
-        yamlio.write_to_file(self.meta_data, self.meta_path, sort_keys=False)
+        metacache.MetaDataCache.write_file(self.meta_data, self.meta_path, sort_keys=False)
+
+    def invalidate(self):
+        """
+        Invalidates the cached metadata of this project and of all its assets, so it is read again from disk.
+        """
+
+        metacache.MetaDataCache.invalidate(self.path)
 
     def add_to_recent(self):
         """
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import typing
+
+import maya.api.OpenMaya as OpenMaya
+
+from tp.core import log
+from tp.maya.meta import base
+
+from tp.libs.rig.noddle import consts
+from tp.libs.rig.noddle.core import rig
+
+if typing.TYPE_CHECKING:
+    from tp.libs.rig.noddle.meta.rig import NoddleRig
+
+logger = log.rigLogger
+
+
+class RigRegistry:
+    """
+    Scene scoped registry that stores rig instances keyed by the handle of their root meta node.
+    Registered rigs are reused between tool operations, so their sessions and component caches are kept warm.
+    Registry does not register any Maya callback by itself: while no callbacks are registered, scene rigs are searched
+    each time they are requested. Tools can register callbacks while they are opened, so the list of scene rigs is
+    only searched again when rig meta nodes are added or removed or when a scene is opened.
+    """
+
+    _RIGS: dict[int, tuple[OpenMaya.MObjectHandle, rig.Rig]] = {}
+    _SCENE_RIGS: list[rig.Rig] | None = None
+    _ADDED_NODES: list[OpenMaya.MObjectHandle] = []
+    _CALLBACK_IDS: list[int] = []
+    _CALLBACK_USERS = 0
+
+    @classmethod
+    def rig(cls, meta_node: NoddleRig | base.MetaBase) -> rig.Rig:
+        """
+        Returns the rig instance for the given root rig meta node, creating and starting its session if necessary.
+
+        :param NoddleRig or base.MetaBase meta_node: root rig meta node instance.
+        :return: rig instance.
+        :rtype: rig.Rig
+        """
+
+        handle = OpenMaya.MObjectHandle(meta_node.object())
+        cached_handle, cached_rig = cls._RIGS.get(handle.hashCode(), (None, None))
+        if cached_rig is not None and cached_handle.isAlive() and cached_handle == handle and cached_rig.exists():
+            return cached_rig
+
+        new_rig = rig.Rig(meta=meta_node)
+        new_rig.start_session()
+        cls._RIGS[handle.hashCode()] = (handle, new_rig)
+
+        return new_rig
+
+    @classmethod
+    def scene_rigs(cls) -> list[rig.Rig]:
+        """
+        Returns all rig instances within current scene.
+
+        :return: list of scene rig instances.
+        :rtype: list[rig.Rig]
+        """
+
+        if cls._ADDED_NODES:
+            cls._process_added_nodes()
+
+        scene_rigs = cls._SCENE_RIGS if cls._CALLBACK_IDS else None
+        if scene_rigs is None or not all(found_rig.exists() for found_rig in scene_rigs):
+            scene_rigs = [cls.rig(meta_rig) for meta_rig in base.find_meta_nodes_by_class_type(consts.RIG_TYPE)]
+            cls._SCENE_RIGS = scene_rigs if cls._CALLBACK_IDS else None
+
+        return list(scene_rigs)
+
+    @classmethod
+    def clear(cls):
+        """
+        Removes all registered rig instances.
+        """
+
+        cls._RIGS.clear()
+        cls._SCENE_RIGS = None
+        cls._ADDED_NODES.clear()
+
+    @classmethod
+    def register_callbacks(cls):
+        """
+        Registers the Maya callbacks used to keep the registry in sync with current scene.
+        Each call must be paired with an unregister_callbacks call, callbacks are removed once no one uses them.
+        """
+
+        cls._CALLBACK_USERS += 1
+        if cls._CALLBACK_IDS:
+            return
+
+        cls._SCENE_RIGS = None
+        cls._CALLBACK_IDS = [
+            OpenMaya.MDGMessage.addNodeAddedCallback(cls._on_node_added, 'network'),
+            OpenMaya.MDGMessage.addNodeRemovedCallback(cls._on_node_removed, 'network'),
+            OpenMaya.MSceneMessage.addCallback(OpenMaya.MSceneMessage.kBeforeNew, cls._on_scene_changed),
+            OpenMaya.MSceneMessage.addCallback(OpenMaya.MSceneMessage.kBeforeOpen, cls._on_scene_changed),
+            OpenMaya.MSceneMessage.addCallback(OpenMaya.MSceneMessage.kAfterOpen, cls._on_scene_changed),
+        ]
+
+    @classmethod
+    def unregister_callbacks(cls):
+        """
+        Unregisters registry Maya callbacks, if no one else is using them, and clears all registered rigs.
+        """
+
+        cls._CALLBACK_USERS = max(0, cls._CALLBACK_USERS - 1)
+        if cls._CALLBACK_USERS:
+            return
+
+        if cls._CALLBACK_IDS:
+            OpenMaya.MMessage.removeCallbacks(cls._CALLBACK_IDS)
+        cls._CALLBACK_IDS = []
+        cls.clear()
+
+    @classmethod
+    def _process_added_nodes(cls):
+        """
+        Internal function that invalidates the scene rigs list if any of the network nodes added since last time is a
+        rig meta node. Nodes are checked lazily, because meta class attribute is not set yet when nodes are added.
+        """
+
+        added_nodes = cls._ADDED_NODES
+        cls._ADDED_NODES = []
+        for handle in added_nodes:
+            if not handle.isAlive():
+                continue
+            node_fn = OpenMaya.MFnDependencyNode(handle.object())
+            if not node_fn.hasAttribute(base.MCLASS_ATTR_NAME):
+                continue
+            if node_fn.findPlug(base.MCLASS_ATTR_NAME, False).asString() == consts.RIG_TYPE:
+                cls._SCENE_RIGS = None
+                return
+
+    @classmethod
+    def _on_node_added(cls, node: OpenMaya.MObject, *args):
+        """
+        Internal callback function that is called each time a network node is added into the scene.
+
+        :param OpenMaya.MObject node: added node.
+        """
+
+        cls._ADDED_NODES.append(OpenMaya.MObjectHandle(node))
+
+    @classmethod
+    def _on_node_removed(cls, node: OpenMaya.MObject, *args):
+        """
+        Internal callback function that is called each time a network node is removed from the scene.
+
+        :param OpenMaya.MObject node: removed node.
+        """
+
+        if not cls._RIGS:
+            return
+
+        if cls._RIGS.pop(OpenMaya.MObjectHandle(node).hashCode(), None) is not None:
+            cls._SCENE_RIGS = None
+
+    @classmethod
+    def _on_scene_changed(cls, *args):
+        """
+        Internal callback function that is called each time a new scene is created or opened.
+        """
+
+        cls.clear()
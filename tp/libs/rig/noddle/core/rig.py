@@ -12,7 +12,7 @@ from tp.maya import api
 from tp.maya.meta import base
 from tp.libs.rig.noddle import consts
 from tp.libs.rig.noddle.meta import rig as meta_rig
-from tp.libs.rig.noddle.core import errors, config, component
+from tp.libs.rig.noddle.core import errors, config, component, nameregistry
 from tp.libs.rig.noddle.functions import naming, components
 
 if typing.TYPE_CHECKING:
@@ -425,7 +425,11 @@ class Rig:
         :rtype: Component or None
         """
 
-        for component_found in self._components_cache:
+        # components deleted by undo or by other rig instances are discarded from the cache
+        for component_found in list(self._components_cache):
+            if not component_found.exists():
+                self._components_cache.discard(component_found)
+                continue
             if component_found.name() == name and component_found.side() == side:
                 return component_found
 
@@ -501,12 +505,14 @@ class Rig:
         self._config.update_from_rig(self)
 
         skeleton_layer = self.get_or_create_skeleton_layer()
-        if root_joint not in skeleton_layer.joints():
-            skeleton_layer.add_joint(root_joint, 'root')
-
-        child_joints = list(root_joint.iterateChildren(recursive=True, node_types=(api.kNodeTypes.kJoint,)))
-        for child_joint in child_joints:
-            skeleton_layer.add_joint(child_joint, child_joint.fullPathName(partial_name=True, include_namespace=False))
+        existing_joints = set(skeleton_layer.joints())
+        joints_to_add = [] if root_joint in existing_joints else [(root_joint, 'root')]
+        for child_joint in root_joint.iterateChildren(recursive=True, node_types=(api.kNodeTypes.kJoint,)):
+            if child_joint in existing_joints:
+                continue
+            joints_to_add.append(
+                (child_joint, child_joint.fullPathName(partial_name=True, include_namespace=False)))
+        skeleton_layer.add_joints(joints_to_add)
 
         parent_node = skeleton_layer.root_transform()
         parent_node.show()
@@ -612,10 +618,12 @@ class Rig:
         current_components = child_parent_relationship
         visited: set[Component] = set()
 
-        for child, parent in component_build_order.items():
-            success = _process_component(child, parent)
-            if not success:
-                return False
+        # names generated while building are tracked by the name registry only during the build.
+        with nameregistry.NameRegistry.session():
+            for child, parent in component_build_order.items():
+                success = _process_component(child, parent)
+                if not success:
+                    return False
 
         return True
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from tp.maya import api
 
-from tp.common.python import helpers
+from tp.libs.rig.noddle.descriptors import base
 
 
 def attribute_class_for_type(attr_type: int) -> type:
@@ -32,7 +32,7 @@ def attribute_class_for_descriptor(descriptor: AttributeDescriptor) -> Attribute
     return instance(descriptor)
 
 
-class AttributeDescriptor(helpers.ObjectDict):
+class AttributeDescriptor(base.SlottedDescriptor):
     """
     Wrapper class to handle Maya types to dictionary storage. Each key requires a Maya data type that will be either
     returned or converted back to a JSON compatible data type.
@@ -50,6 +50,8 @@ class AttributeDescriptor(helpers.ObjectDict):
     :keyword bool keyable: whether this attribute  can be keyed.
     """
 
+    __slots__ = ()
+
     @property
     def value(self):
         return self['value']
@@ -101,6 +103,8 @@ class AttributeDescriptor(helpers.ObjectDict):
 
 class VectorAttributeDescriptor(AttributeDescriptor):
 
+    __slots__ = ()
+
     @property
     def value(self):
         return api.Vector(self['value'])
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from typing import Any
+from collections.abc import Mapping
+
+
+def serialize_descriptor_data(data: Any) -> Any:
+    """
+    Recursively converts given descriptor data into plain dictionaries and lists that can be serialized into JSON.
+
+    :param Any data: descriptor data to convert.
+    :return: plain descriptor data.
+    :rtype: Any
+    """
+
+    if isinstance(data, SlottedDescriptor):
+        return data.serialize()
+    elif isinstance(data, Mapping):
+        return {key: serialize_descriptor_data(value) for key, value in data.items()}
+    elif isinstance(data, list):
+        return [serialize_descriptor_data(value) for value in data]
+
+    return data
+
+
+class SlottedDescriptor(dict):
+    """
+    Descriptor base class: a dictionary whose keys can also be accessed as attributes.
+    Descriptors are real dictionaries, so item access runs at native dictionary speed, isinstance checks against dict
+    keep working and descriptors can be directly serialized into JSON. Empty __slots__ only avoid the per instance
+    attributes dictionary that ObjectDict based descriptors carry, so memory usage is roughly the one of a plain dict.
+
+    ..warning:: subclasses must define empty __slots__, otherwise instances will have a __dict__.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+
+        if args:
+            self.update(args[0])
+        if kwargs:
+            self.update(kwargs)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({dict.__repr__(self)})'
+
+    def __getattr__(self, item: str) -> Any:
+        # only called when normal attribute lookup fails.
+        if item.startswith('_'):
+            raise AttributeError(item)
+        try:
+            return self[item]
+        except KeyError:
+            raise AttributeError(f'{self.__class__.__name__!r} object has no attribute {item!r}') from None
+
+    def __setattr__(self, key: str, value: Any):
+        if key.startswith('_') or hasattr(self.__class__, key):
+            object.__setattr__(self, key, value)
+        else:
+            self[key] = value
+
+    def __delattr__(self, item: str):
+        if item.startswith('_') or hasattr(self.__class__, item):
+            object.__delattr__(self, item)
+        else:
+            try:
+                del self[item]
+            except KeyError:
+                raise AttributeError(item) from None
+
+    def update(self, *args, **kwargs):
+        """
+        Updates the descriptor with the given items. If subclass overrides __setitem__, items are set one by one, so its
+        conversions are also applied to them.
+        """
+
+        if type(self).__setitem__ is dict.__setitem__:
+            dict.update(self, *args, **kwargs)
+            return
+
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        """
+        Returns the value of the given key, setting it to the given default value if the key is not defined.
+
+        :param str key: descriptor key.
+        :param Any default: value to set if key is not defined.
+        :return: key value.
+        :rtype: Any
+        """
+
+        if key not in self:
+            self[key] = default
+
+        return self[key]
+
+    @classmethod
+    def deserialize(cls, data: Mapping) -> SlottedDescriptor:
+        """
+        Returns a new descriptor instance from given data.
+
+        :param Mapping data: data to deserialize.
+        :return: deserialized descriptor instance.
+        :rtype: SlottedDescriptor
+        """
+
+        return cls(**data)
+
+    def copy(self) -> SlottedDescriptor:
+        """
+        Returns a copy of this descriptor.
+
+        :return: descriptor copy instance.
+        :rtype: SlottedDescriptor
+        """
+
+        return self.deserialize(self)
+
+    def serialize(self) -> dict:
+        """
+        Returns the plain dictionary representation of this descriptor, that can be serialized into JSON.
+
+        :return: serialized descriptor.
+        :rtype: dict
+        """
+
+        return {key: serialize_descriptor_data(value) for key, value in self.items()}
@@ -52,6 +52,7 @@ def migrate_to_latest_version(descriptor_data: dict, original_descriptor: dict |
 
     # expect rig layer to come from the base descriptor not the scene, so keep original rig data
     if original_descriptor:
+        descriptor_data = dict(descriptor_data)
         descriptor_data[consts.RIG_LAYER_DESCRIPTOR_KEY] = original_descriptor.get(
             consts.RIG_LAYER_DESCRIPTOR_KEY, {})
 
@@ -69,8 +70,9 @@ def load_descriptor(descriptor_data: dict, original_descriptor: dict, path: str
     :rtype: ComponentDescriptor
     """
 
+    # descriptors do not modify given data, so original descriptor data can be shared instead of copied
     latest_data = migrate_to_latest_version(descriptor_data, original_descriptor=original_descriptor)
-    return ComponentDescriptor(data=latest_data, original_descriptor=copy.deepcopy(original_descriptor), path=path)
+    return ComponentDescriptor(data=latest_data, original_descriptor=original_descriptor, path=path)
 
 
 def parse_raw_descriptor(descriptor_data: dict) -> dict:
@@ -120,7 +122,11 @@ class ComponentDescriptor(helpers.ObjectDict):
             self, data: dict | None = None, original_descriptor: ComponentDescriptor | dict | None = None,
             path: str | None = None):
 
-        data = data or {}
+        # given data is not modified: layers are rebuilt as new descriptor instances and only the small top level
+        # containers are copied, so large descriptor trees are never deep copied.
+        data = {
+            k: copy.deepcopy(v) if isinstance(v, (dict, list)) and k not in consts.LAYER_DESCRIPTOR_KEYS else v
+            for k, v in (data or {}).items() if k not in ('original_descriptor', 'path')}
         data[consts.VERSION_DESCRIPTOR_KEY] = self.VERSION
         data[consts.INPUT_LAYER_DESCRIPTOR_KEY] = layers.InputLayerDescriptor.from_data(
             data.get(consts.INPUT_LAYER_DESCRIPTOR_KEY, {}))
@@ -184,7 +190,8 @@ class ComponentDescriptor(helpers.ObjectDict):
         for k, v in self.items():
             if k in ('original_descriptor', 'path'):
                 continue
-            data[k] = v
+            # layers contain node descriptors which are only converted into plain data here
+            data[k] = v.serialize() if isinstance(v, layers.LayerDescriptor) else v
 
         return data
 
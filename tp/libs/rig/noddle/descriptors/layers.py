@@ -7,28 +7,38 @@ from overrides import override
 from tp.common.python import helpers
 
 from tp.libs.rig.noddle import consts
-from tp.libs.rig.noddle.descriptors import nodes, attributes, graphs
+from tp.libs.rig.noddle.descriptors import base, nodes, attributes, graphs
+
+
+def iterate_descriptor_hierarchy(root_nodes: list[dict]) -> Iterator:
+    """
+    Depth first search generator function which walks given descriptor nodes and all their children.
+    Traversal is done iteratively to avoid recursion overhead with deep hierarchies.
+
+    :param list[dict] root_nodes: descriptor nodes to start the traversal from.
+    :return: iterated descriptor nodes.
+    :rtype: Iterator
+    """
+
+    stack = list(reversed(root_nodes))
+    while stack:
+        node = stack.pop()
+        yield node
+        children = node.get('children', None)
+        if children:
+            stack.extend(reversed(children))
 
 
 def traverse_descriptor_layer_dag(layer_descriptor: LayerDescriptor) -> Iterator:
     """
-    Depth first search recursive generator function which walks the layer descriptor DAG nodes.
+    Depth first search generator function which walks the layer descriptor DAG nodes.
 
     :param LayerDescriptor layer_descriptor: layer descriptor to traverse.
     :return: iterated DAG nodes.
     :rtype: Iterator
     """
 
-    def _node_iter(_node):
-        for _child in iter(_node.get('children', list())):
-            yield _child
-            for i in _node_iter(_child):
-                yield i
-
-    for node in iter(layer_descriptor.get(consts.DAG_DESCRIPTOR_KEY, list())):
-        yield node
-        for child in _node_iter(node):
-            yield child
+    return iterate_descriptor_hierarchy(layer_descriptor.get(consts.DAG_DESCRIPTOR_KEY, None) or [])
 
 
 class LayerDescriptor(helpers.ObjectDict):
@@ -51,6 +61,31 @@ class LayerDescriptor(helpers.ObjectDict):
 
         return cls()
 
+    @override
+    def __setitem__(self, key: str, value: Any):
+        super().__setitem__(key, value)
+        if key == consts.DAG_DESCRIPTOR_KEY:
+            self.invalidate_index()
+
+    def serialize(self) -> dict:
+        """
+        Returns the plain dictionary representation of this layer, converting all its node and attribute descriptors.
+
+        :return: serialized layer descriptor.
+        :rtype: dict
+        """
+
+        return base.serialize_descriptor_data(self)
+
+    def invalidate_index(self):
+        """
+        Clears the internal DAG nodes ID index, so it is rebuilt the next time a node is queried.
+
+        ..note:: this only needs to be called manually when DAG nodes are modified without using layer functions.
+        """
+
+        self.__dict__.pop('_node_id_index', None)
+
     def has_node(self, node_id: str) -> bool:
         """
         Returns whether DAG node with given ID exists within this layer.
@@ -71,9 +106,7 @@ class LayerDescriptor(helpers.ObjectDict):
         :rtype: nodes.TransformDescriptor
         """
 
-        for found_node in traverse_descriptor_layer_dag(self):
-            if found_node['id'] == node_id:
-                return found_node
+        return self._node_index().get(node_id)
 
     def iterate_nodes(self, include_root: bool = True) -> Iterator[nodes.TransformDescriptor]:
         """
@@ -91,19 +124,14 @@ class LayerDescriptor(helpers.ObjectDict):
 
     def find_nodes(self, *node_ids: tuple) -> list[nodes.TransformDescriptor | None]:
         """
-        Loops through all nodes within this layer and returns a list with found nodes.
+        Returns a list with the nodes within this layer that matches given IDs.
 
         :param tuple[str] node_ids: list of node IDs to search.
         :return: list[nodes.TransformDescriptor or None]
         """
 
-        results = [None] * len(node_ids)
-        for found_node in traverse_descriptor_layer_dag(self):
-            node_id = found_node['id']
-            if node_id in node_ids:
-                results[node_ids.index(node_id)] = found_node
-
-        return results
+        index = self._node_index()
+        return [index.get(node_id) for node_id in node_ids]
 
     def setting(self, name: str) -> attributes.AttributeDescriptor | None:
         """
@@ -137,6 +165,52 @@ class LayerDescriptor(helpers.ObjectDict):
         if found_setting:
             found_setting.value = value
 
+    def _node_index(self) -> dict[str, nodes.TransformDescriptor]:
+        """
+        Internal function that returns the DAG nodes ID index, building it if necessary.
+
+        :return: dictionary mapping node IDs with their descriptors.
+        :rtype: dict[str, nodes.TransformDescriptor]
+        """
+
+        index = self.__dict__.get('_node_id_index')
+        if index is None:
+            index = {}
+            for found_node in traverse_descriptor_layer_dag(self):
+                index.setdefault(found_node['id'], found_node)
+            self.__dict__['_node_id_index'] = index
+
+        return index
+
+    def _index_node(self, node_descriptor: nodes.TransformDescriptor):
+        """
+        Internal function that adds given node descriptor and all its children into the DAG nodes ID index.
+
+        :param nodes.TransformDescriptor node_descriptor: node descriptor to index.
+        """
+
+        index = self.__dict__.get('_node_id_index')
+        if index is None:
+            return
+
+        for found_node in iterate_descriptor_hierarchy([node_descriptor]):
+            index.setdefault(found_node['id'], found_node)
+
+    def _unindex_node(self, node_descriptor: nodes.TransformDescriptor):
+        """
+        Internal function that removes given node descriptor and all its children from the DAG nodes ID index.
+
+        :param nodes.TransformDescriptor node_descriptor: node descriptor to remove from index.
+        """
+
+        index = self.__dict__.get('_node_id_index')
+        if index is None:
+            return
+
+        for found_node in iterate_descriptor_hierarchy([node_descriptor]):
+            if index.get(found_node['id']) is found_node:
+                del index[found_node['id']]
+
 
 class InputLayerDescriptor(LayerDescriptor):
 
@@ -170,10 +244,8 @@ class InputLayerDescriptor(LayerDescriptor):
         :rtype: Iterator[nodes.InputDescriptor]
         """
 
-        for input_descriptor in iter(self.get(consts.DAG_DESCRIPTOR_KEY, [])):
+        for input_descriptor in traverse_descriptor_layer_dag(self):
             yield input_descriptor
-            for child in input_descriptor.iterate_children():
-                yield child
 
     def input(self, name: str) -> nodes.InputDescriptor | None:
         """
@@ -184,13 +256,7 @@ class InputLayerDescriptor(LayerDescriptor):
         :rtype: nodes.InputDescriptor or None
         """
 
-        found_input_descriptor = None
-        for input_descriptor in self.iterate_inputs():
-            if input_descriptor['id'] == name:
-                found_input_descriptor = input_descriptor
-                break
-
-        return found_input_descriptor
+        return self.node(name)
 
     def create_input(self, **data: dict) -> nodes.InputDescriptor:
         """
@@ -222,12 +288,13 @@ class InputLayerDescriptor(LayerDescriptor):
         input_descriptor['noddleType'] = 'input'
         if input_descriptor.parent is None:
             self[consts.DAG_DESCRIPTOR_KEY].append(input_descriptor)
+            self._index_node(input_descriptor)
             return
 
-        for _input_descriptor in self.iterate_inputs():
-            if _input_descriptor.id == input_descriptor.parent:
-                _input_descriptor.children.append(input_descriptor)
-                break
+        parent_descriptor = self.node(input_descriptor.parent)
+        if parent_descriptor is not None:
+            parent_descriptor.children.append(input_descriptor)
+            self._index_node(input_descriptor)
 
     def clear_inputs(self):
         """
@@ -266,6 +333,7 @@ class OutputLayerDescriptor(LayerDescriptor):
                     output_descriptor['children'] = [
                         nodes.OutputDescriptor.deserialize(i, output_descriptor['id']) for i in children]
                 current_node.update(output_descriptor)
+                self.invalidate_index()
             else:
                 self.create_output(**output_descriptor)
 
@@ -277,10 +345,8 @@ class OutputLayerDescriptor(LayerDescriptor):
         :rtype: Iterator[nodes.OutputDescriptor]
         """
 
-        for output_descriptor in iter(self.get(consts.DAG_DESCRIPTOR_KEY, [])):
+        for output_descriptor in traverse_descriptor_layer_dag(self):
             yield output_descriptor
-            for child in output_descriptor.iterate_children():
-                yield child
 
     def output(self, name: str) -> nodes.OutputDescriptor | None:
         """
@@ -291,13 +357,7 @@ class OutputLayerDescriptor(LayerDescriptor):
         :rtype: nodes.OutputDescriptor or None
         """
 
-        found_output_descriptor = None
-        for output_descriptor in self.iterate_outputs():
-            if output_descriptor['id'] == name:
-                found_output_descriptor = output_descriptor
-                break
-
-        return found_output_descriptor
+        return self.node(name)
 
     def create_output(self, **data) -> nodes.OutputDescriptor:
         """
@@ -329,12 +389,13 @@ class OutputLayerDescriptor(LayerDescriptor):
         output_descriptor['noddleType'] = 'output'
         if output_descriptor.parent is None:
             self[consts.DAG_DESCRIPTOR_KEY].append(output_descriptor)
+            self._index_node(output_descriptor)
             return
 
-        for _output_descriptor in self.iterate_outputs():
-            if _output_descriptor.id == output_descriptor.parent:
-                _output_descriptor.children.append(output_descriptor)
-                break
+        parent_descriptor = self.node(output_descriptor.parent)
+        if parent_descriptor is not None:
+            parent_descriptor.children.append(output_descriptor)
+            self._index_node(output_descriptor)
 
     def clear_outputs(self):
         """
@@ -388,13 +449,7 @@ class SkeletonLayerDescriptor(LayerDescriptor):
         :rtype: nodes.JointDescriptor or None
         """
 
-        found_joint_descriptor = None
-        for joint_descriptor in self.iterate_joints():
-            if joint_descriptor.id == joint_id:
-                found_joint_descriptor = joint_descriptor
-                break
-
-        return found_joint_descriptor
+        return self.node(joint_id)
 
     def iterate_joints(self) -> Iterator[nodes.JointDescriptor]:
         """
@@ -404,10 +459,8 @@ class SkeletonLayerDescriptor(LayerDescriptor):
         :rtype: terator[nodes.JointDescriptor]
         """
 
-        for joint_descriptor in iter(self.get(consts.DAG_DESCRIPTOR_KEY, [])):
+        for joint_descriptor in traverse_descriptor_layer_dag(self):
             yield joint_descriptor
-            for child in joint_descriptor.iterate_children():
-                yield child
 
     def joints(self) -> list[nodes.JointDescriptor]:
         """
@@ -428,13 +481,7 @@ class SkeletonLayerDescriptor(LayerDescriptor):
         :rtype: List[nodes.JointDescriptor or None]
         """
 
-        found_joint_descriptors = [None] * len(ids)
-        for joint_descriptor in self.iterate_joints():
-            joint_id = joint_descriptor.id
-            if joint_id in ids:
-                found_joint_descriptors[ids.index(joint_id)] = joint_descriptor
-
-        return found_joint_descriptors
+        return self.find_nodes(*ids)
 
     def create_joint(self, **data: dict) -> nodes.JointDescriptor:
         """
@@ -475,12 +522,13 @@ class SkeletonLayerDescriptor(LayerDescriptor):
         joint_descriptor['noddleType'] = 'joint'
         if joint_descriptor.parent is None:
             self[consts.DAG_DESCRIPTOR_KEY].append(joint_descriptor)
+            self._index_node(joint_descriptor)
             return
 
-        for _joint_descriptor in self.iterate_joints():
-            if _joint_descriptor.id == joint_descriptor.parent:
-                _joint_descriptor.children.append(joint_descriptor)
-                break
+        parent_descriptor = self.joint(joint_descriptor.parent)
+        if parent_descriptor is not None:
+            parent_descriptor.children.append(joint_descriptor)
+            self._index_node(joint_descriptor)
 
     def delete_joints(self, *joints_ids: tuple[str]):
         """
@@ -489,18 +537,17 @@ class SkeletonLayerDescriptor(LayerDescriptor):
         :param tuple[str] joints_ids: joint IDs to delete.
         """
 
-        top_level_nodes_to_delete = []
-        for joint_descriptor in self.iterate_joints():
-            if joint_descriptor.id not in joints_ids:
+        for joint_id in joints_ids:
+            joint_descriptor = self.joint(joint_id)
+            if joint_descriptor is None:
                 continue
-            elif joint_descriptor.parent is None:
-                top_level_nodes_to_delete.append(joint_descriptor)
-                continue
-            parent = self.joint(joint_descriptor.parent)
-            parent.delete_child(joint_descriptor.id)
-
-        for joint_descriptor in top_level_nodes_to_delete:
-            self[consts.DAG_DESCRIPTOR_KEY].remove(joint_descriptor)
+            if joint_descriptor.parent is None:
+                self[consts.DAG_DESCRIPTOR_KEY].remove(joint_descriptor)
+            else:
+                parent = self.joint(joint_descriptor.parent)
+                if parent is not None:
+                    parent.delete_child(joint_descriptor.id)
+            self._unindex_node(joint_descriptor)
 
     def clear_joints(self):
         """
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-import copy
 import collections
+from typing import Any
 
 from overrides import override
 
@@ -10,7 +10,7 @@ from tp.maya import api
 from tp.maya.om import utils
 
 from tp.libs.rig.noddle import consts
-from tp.libs.rig.noddle.descriptors import attributes
+from tp.libs.rig.noddle.descriptors import base, attributes
 
 
 class DGNodeDescriptor(helpers.ObjectDict):
@@ -57,7 +57,7 @@ class DGNodeDescriptor(helpers.ObjectDict):
         return None
 
 
-class TransformDescriptor(DGNodeDescriptor):
+class TransformDescriptor(base.SlottedDescriptor):
     """
     Transform descriptor class with the following data:
         {
@@ -72,8 +72,14 @@ class TransformDescriptor(DGNodeDescriptor):
             "worldMatrix": [],
             "shapeTransform": {"translate": [0,0,0], "rotate": [0,0,0,1], "scale": [1,1,1]}
         }
+
+    ..note:: transform descriptors are plain dictionaries with empty slots, so item access and JSON serialization run at
+        native dictionary speed. Vector values are stored as tuples when set.
     """
 
+    __slots__ = ()
+
+    VECTOR_KEYS = frozenset(('translate', 'rotate', 'scale', 'matrix', 'worldMatrix'))
     DEFAULTS = {
         'name': 'control',
         'children': [],
@@ -88,17 +94,12 @@ class TransformDescriptor(DGNodeDescriptor):
 
     def __init__(self, *args, **kwargs):
 
-        defaults = copy.deepcopy(self.DEFAULTS)
+        # children is the only mutable default value (vectors are converted to tuples when set)
+        defaults = dict(self.DEFAULTS, children=[])
         if args:
             defaults.update(args[0])
         defaults.update(kwargs)
 
-        # ensure type compatibility
-        for name in ('translate', 'rotate', 'scale', 'matrix', 'worldMatrix'):
-            existing_data = defaults.get(name)
-            if existing_data is not None:
-                defaults[name] = tuple(existing_data)
-
         # convert attributes dictionaries to attribute descriptor instances
         new_attrs: list[attributes.AttributeDescriptor] = defaults.get('attributes', [])
         attr_instances = []
@@ -112,6 +113,13 @@ class TransformDescriptor(DGNodeDescriptor):
 
         super().__init__(defaults)
 
+    @override
+    def __setitem__(self, key: str, value: Any):
+        # ensure type compatibility
+        if value is not None and key in self.VECTOR_KEYS:
+            value = tuple(value)
+        super().__setitem__(key, value)
+
     @property
     def translate(self):
         return api.Vector(self['translate'])
@@ -158,7 +166,7 @@ class TransformDescriptor(DGNodeDescriptor):
     @override
     def copy(self) -> TransformDescriptor:
         """
-        Overrides copy function to return a descriptor instance.
+        Overrides copy function to return a descriptor instance keeping the parent.
 
         :return: copied descriptor instance.
         :rtype: TransformDescriptor
@@ -167,6 +175,7 @@ class TransformDescriptor(DGNodeDescriptor):
         return self.deserialize(self, parent=self.parent)
 
     @classmethod
+    @override(check_signature=False)
     def deserialize(cls, data: dict, parent: TransformDescriptor | None = None) -> TransformDescriptor:
         """
         Given a valid descriptor dictionary recursively converts all children to descriptors and returns the
@@ -187,20 +196,42 @@ class TransformDescriptor(DGNodeDescriptor):
 
         return new_instance
 
+    def attribute(self, attribute_name: str) -> attributes.AttributeDescriptor | None:
+        """
+        Returns descriptor attribute instance with given name.
+
+        :param str attribute_name: name of the descriptor attribute to get.
+        :return: attribute descriptor instance.
+        :rtype: attributes.AttributeDescriptor or None
+        """
+
+        for attr in self.get('attributes', []):
+            if attr['name'] == attribute_name:
+                return attr
+
+        return None
+
     def iterate_children(self, recursive: bool = True) -> collections.Iterator[TransformDescriptor]:
         """
-        Generator function that iterates recursively over all children of this transform descriptor instance.
+        Generator function that iterates over all children of this transform descriptor instance.
 
         :param bool recursive: whether to iterate children recursively.
         :return: iterated transform descriptor instances.
         :rtype: collections.Iterator[TransformDescriptor]
         """
 
-        for child in iter(self.get('children', list())):
+        if not recursive:
+            for child in iter(self.get('children', list())):
+                yield child
+            return
+
+        stack = list(reversed(self.get('children', None) or []))
+        while stack:
+            child = stack.pop()
             yield child
-            if recursive:
-                for sub_child in child.iterate_children(recursive=recursive):
-                    yield sub_child
+            sub_children = child.get('children', None)
+            if sub_children:
+                stack.extend(reversed(sub_children))
 
     def delete_child(self, child_id: str) -> bool:
         """
@@ -279,6 +310,8 @@ class JointDescriptor(TransformDescriptor):
     Joint descriptor class
     """
 
+    __slots__ = ()
+
     DEFAULTS = {
         'name': 'joint',
         'id': '',
@@ -297,6 +330,8 @@ class InputDescriptor(TransformDescriptor):
     Input descriptor class
     """
 
+    __slots__ = ()
+
     DEFAULTS = {
         'name': 'input',
         'id': '',
@@ -316,6 +351,8 @@ class OutputDescriptor(TransformDescriptor):
     Output descriptor class
     """
 
+    __slots__ = ()
+
     DEFAULTS = {
         'name': 'output',
         'id': '',
@@ -335,6 +372,8 @@ class ControlDescriptor(TransformDescriptor):
     Control descriptor class
     """
 
+    __slots__ = ()
+
     DEFAULTS = {
         'name': 'control',
         'shape': 'circle',
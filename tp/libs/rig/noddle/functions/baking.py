@@ -1,9 +1,321 @@
 from __future__ import annotations
 
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as OpenMaya
+import maya.api.OpenMayaAnim as OpenMayaAnim
+
+from tp.core import log
 from tp.maya import api
 
+logger = log.rigLogger
+
+# Rotation axes, in application order, for each one of the Maya rotate orders (xyz, yzx, zxy, xzy, yxz, zyx).
+ROTATE_ORDER_AXES = ((0, 1, 2), (1, 2, 0), (2, 0, 1), (0, 2, 1), (1, 0, 2), (2, 1, 0))
+
 
 def bake_objects(
         nodes: list[api.DagNode | api.Joint], translate: bool = True, rotate: bool = True, scale: bool = True,
-        use_settings: bool = True, **kwargs):
-    raise NotImplementedError
+        use_settings: bool = True, **kwargs) -> list[OpenMaya.MObject]:
+    """
+    Bakes the world space transformation of the given nodes into keys on their local transform channels.
+
+    World matrices are evaluated for all nodes and frames using DG contexts (without changing current time), local
+    transforms are decomposed in a single vectorized pass (including Euler filtering) and keys are written per channel
+    in bulk.
+
+    :param list[api.DagNode | api.Joint] nodes: nodes to bake.
+    :param bool translate: whether to bake translation channels.
+    :param bool rotate: whether to bake rotation channels.
+    :param bool scale: whether to bake scale channels.
+    :param bool use_settings: whether to bake using time slider playback range. If False, the whole scene animation
+        range is used.
+    :keyword float start_frame: optional start frame to bake from.
+    :keyword float end_frame: optional end frame to bake to.
+    :keyword bool simulation: whether to evaluate frames by changing current time (required for simulated nodes).
+    :keyword bool euler_filter: whether to apply Euler filter to baked rotations. Default to True.
+    :return: list of anim curves keyed by the bake operation.
+    :rtype: list[OpenMaya.MObject]
+    """
+
+    nodes = [node for node in nodes if node is not None]
+    if not nodes or not any((translate, rotate, scale)):
+        return []
+
+    if use_settings:
+        start_frame, end_frame = OpenMayaAnim.MAnimControl.minTime(), OpenMayaAnim.MAnimControl.maxTime()
+    else:
+        start_frame = OpenMayaAnim.MAnimControl.animationStartTime()
+        end_frame = OpenMayaAnim.MAnimControl.animationEndTime()
+    start_frame = kwargs.get('start_frame', start_frame.value)
+    end_frame = kwargs.get('end_frame', end_frame.value)
+    simulation = kwargs.get('simulation', False)
+
+    if np is None:
+        logger.warning('NumPy is not available, baking objects using bakeResults command')
+        attributes = [attr for attr, enabled in zip(('t', 'r', 's'), (translate, rotate, scale)) if enabled]
+        cmds.bakeResults(
+            [node.fullPathName() for node in nodes], time=(start_frame, end_frame), attribute=attributes,
+            simulation=simulation)
+        return []
+
+    start_time = time.perf_counter()
+    frames = np.arange(start_frame, end_frame + 1, dtype=np.float64)
+    world_matrices, parent_matrices = _evaluate_matrices(nodes, frames, simulation=simulation)
+    local_matrices = np.matmul(world_matrices, np.linalg.inv(parent_matrices))
+    translations, rotations, scales = _decompose_local_matrices(
+        nodes, local_matrices, euler_filter=kwargs.get('euler_filter', True))
+
+    channels: list[tuple[OpenMaya.MPlug, np.ndarray]] = []
+    for i, node in enumerate(nodes):
+        node_fn = OpenMaya.MFnDependencyNode(node.object())
+        for enabled, attribute_name, values in (
+                (translate, 'translate', translations), (rotate, 'rotate', rotations), (scale, 'scale', scales)):
+            if not enabled:
+                continue
+            for axis_index, axis in enumerate('XYZ'):
+                channels.append((node_fn.findPlug(f'{attribute_name}{axis}', False), values[:, i, axis_index]))
+
+    anim_curves = _write_keys(channels, frames)
+    logger.debug(
+        f'Baked {len(nodes)} nodes over {len(frames)} frames in {time.perf_counter() - start_time:.3f} seconds')
+
+    return anim_curves
+
+
+def _evaluate_matrices(
+        nodes: list[api.DagNode], frames: np.ndarray, simulation: bool = False) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Internal function that evaluates world and parent matrices of the given nodes for all given frames.
+    Parent matrices are only evaluated for nodes whose parent is not part of the given nodes.
+
+    :param list[api.DagNode] nodes: nodes to evaluate matrices of.
+    :param np.ndarray frames: frames to evaluate.
+    :param bool simulation: whether to evaluate frames by changing current time instead of using DG contexts.
+    :return: tuple with world matrices and parent world matrices arrays, with (frames, nodes, 4, 4) shape.
+    :rtype: tuple[np.ndarray, np.ndarray]
+    """
+
+    handles = [OpenMaya.MObjectHandle(node.object()) for node in nodes]
+    node_indices = {handle.hashCode(): i for i, handle in enumerate(handles)}
+    world_plugs: list[OpenMaya.MPlug] = []
+    parent_sources: list[tuple[int, int | OpenMaya.MPlug | None]] = []
+    for i, node in enumerate(nodes):
+        node_fn = OpenMaya.MFnDagNode(node.object())
+        world_plugs.append(node_fn.findPlug('worldMatrix', False).elementByLogicalIndex(0))
+        parent = node_fn.parent(0) if node_fn.parentCount() else None
+        if parent is None or parent.hasFn(OpenMaya.MFn.kWorld):
+            continue
+        parent_index = node_indices.get(OpenMaya.MObjectHandle(parent).hashCode())
+        if parent_index is not None:
+            parent_sources.append((i, parent_index))
+        else:
+            parent_sources.append((i, node_fn.findPlug('parentMatrix', False).elementByLogicalIndex(0)))
+    parent_plugs = [(i, source) for i, source in parent_sources if isinstance(source, OpenMaya.MPlug)]
+
+    frame_count, node_count = len(frames), len(nodes)
+    world_matrices = np.empty((frame_count, node_count, 4, 4), dtype=np.float64)
+    parent_matrices = np.broadcast_to(np.identity(4), (frame_count, node_count, 4, 4)).copy()
+    time_unit = OpenMaya.MTime.uiUnit()
+    current_time = OpenMayaAnim.MAnimControl.currentTime()
+    try:
+        for frame_index, frame in enumerate(frames):
+            frame_time = OpenMaya.MTime(float(frame), time_unit)
+            if simulation:
+                OpenMayaAnim.MAnimControl.setCurrentTime(frame_time)
+                previous_context = None
+            else:
+                previous_context = OpenMaya.MDGContext(frame_time).makeCurrent()
+            try:
+                world_matrices[frame_index] = np.array(
+                    [list(OpenMaya.MFnMatrixData(plug.asMObject()).matrix()) for plug in world_plugs],
+                    dtype=np.float64).reshape(node_count, 4, 4)
+                for node_index, plug in parent_plugs:
+                    parent_matrices[frame_index, node_index] = np.array(
+                        list(OpenMaya.MFnMatrixData(plug.asMObject()).matrix()), dtype=np.float64).reshape(4, 4)
+            finally:
+                if previous_context is not None:
+                    previous_context.makeCurrent()
+    finally:
+        if simulation:
+            OpenMayaAnim.MAnimControl.setCurrentTime(current_time)
+
+    for node_index, parent_index in parent_sources:
+        if not isinstance(parent_index, OpenMaya.MPlug):
+            parent_matrices[:, node_index] = world_matrices[:, parent_index]
+
+    return world_matrices, parent_matrices
+
+
+def _decompose_local_matrices(
+        nodes: list[api.DagNode], local_matrices: np.ndarray,
+        euler_filter: bool = True) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Internal function that decomposes given local matrices into translate, rotate (in radians) and scale channel values,
+    taking into account rotate order, rotate axis and joint orient of each node.
+
+    :param list[api.DagNode] nodes: nodes local matrices belong to.
+    :param np.ndarray local_matrices: local matrices array with (frames, nodes, 4, 4) shape.
+    :param bool euler_filter: whether to apply Euler filter to the resulting rotations.
+    :return: tuple with translation, rotation and scale arrays, each one with (frames, nodes, 3) shape.
+    :rtype: tuple[np.ndarray, np.ndarray, np.ndarray]
+    """
+
+    translations = local_matrices[..., 3, :3].copy()
+    rotation_scale = local_matrices[..., :3, :3]
+    scales = np.linalg.norm(rotation_scale, axis=-1)
+    negative = np.linalg.det(rotation_scale) < 0.0
+    scales[..., 0] = np.where(negative, -scales[..., 0], scales[..., 0])
+    rotation_matrices = rotation_scale / scales[..., :, None]
+
+    # Maya row vector rotation composition is [rotateAxis] * [rotate] * [jointOrient]
+    rotate_axis_inverses = np.empty((len(nodes), 3, 3), dtype=np.float64)
+    joint_orient_inverses = np.empty((len(nodes), 3, 3), dtype=np.float64)
+    rotate_orders = np.empty(len(nodes), dtype=np.int32)
+    for i, node in enumerate(nodes):
+        node_object = node.object()
+        transform_fn = OpenMaya.MFnTransform(node_object)
+        rotate_axis = transform_fn.rotateOrientation(OpenMaya.MSpace.kTransform).asMatrix()
+        joint_orient = OpenMayaAnim.MFnIkJoint(node_object).orientation().asMatrix() if node_object.hasFn(
+            OpenMaya.MFn.kJoint) else OpenMaya.MMatrix()
+        rotate_axis_inverses[i] = np.array(list(rotate_axis), dtype=np.float64).reshape(4, 4)[:3, :3].T
+        joint_orient_inverses[i] = np.array(list(joint_orient), dtype=np.float64).reshape(4, 4)[:3, :3].T
+        rotate_orders[i] = transform_fn.findPlug('rotateOrder', False).asInt()
+    rotation_matrices = np.matmul(np.matmul(rotate_axis_inverses, rotation_matrices), joint_orient_inverses)
+
+    rotations = np.empty(translations.shape, dtype=np.float64)
+    for rotate_order, axes in enumerate(ROTATE_ORDER_AXES):
+        node_indices = np.nonzero(rotate_orders == rotate_order)[0]
+        if node_indices.size:
+            rotations[:, node_indices] = _matrices_to_euler(rotation_matrices[:, node_indices], axes)
+    if euler_filter:
+        rotations = _euler_filter(rotations, rotate_orders)
+
+    return translations, rotations, scales
+
+
+def _matrices_to_euler(rotation_matrices: np.ndarray, axes: tuple[int, int, int]) -> np.ndarray:
+    """
+    Internal function that converts given row vector rotation matrices into Euler angles for the given rotate order.
+
+    :param np.ndarray rotation_matrices: rotation matrices array with (..., 3, 3) shape.
+    :param tuple[int, int, int] axes: rotation axes indices in application order.
+    :return: Euler angles array with (..., 3) shape, in X, Y, Z order and in radians.
+    :rtype: np.ndarray
+    """
+
+    i, j, k = axes
+    odd_parity = (j - i) % 3 != 1
+
+    # transpose to get the column vector matrices, where rotation is composed as R = Rk * Rj * Ri.
+    matrices = np.swapaxes(rotation_matrices, -1, -2)
+    cos_j = np.sqrt(matrices[..., i, i] ** 2 + matrices[..., j, i] ** 2)
+    if odd_parity:
+        angle_i = np.arctan2(-matrices[..., k, j], matrices[..., k, k])
+        angle_j = np.arctan2(matrices[..., k, i], cos_j)
+        angle_k = np.arctan2(-matrices[..., j, i], matrices[..., i, i])
+    else:
+        angle_i = np.arctan2(matrices[..., k, j], matrices[..., k, k])
+        angle_j = np.arctan2(-matrices[..., k, i], cos_j)
+        angle_k = np.arctan2(matrices[..., j, i], matrices[..., i, i])
+
+    angles = np.empty(matrices.shape[:-1], dtype=np.float64)
+    angles[..., i] = angle_i
+    angles[..., j] = angle_j
+    angles[..., k] = angle_k
+
+    return angles
+
+
+def _euler_filter(rotations: np.ndarray, rotate_orders: np.ndarray) -> np.ndarray:
+    """
+    Internal function that removes Euler flips from given rotations by picking, for each frame, the equivalent Euler
+    rotation closest to the previous frame one.
+
+    :param np.ndarray rotations: rotations array with (frames, nodes, 3) shape and in radians.
+    :param np.ndarray rotate_orders: rotate order of each node.
+    :return: filtered rotations.
+    :rtype: np.ndarray
+    """
+
+    two_pi = 2.0 * np.pi
+    middle_axes = np.array([ROTATE_ORDER_AXES[rotate_order][1] for rotate_order in rotate_orders])
+    middle_mask = np.zeros(rotations.shape[1:], dtype=bool)
+    middle_mask[np.arange(len(rotate_orders)), middle_axes] = True
+
+    # alternative Euler solution that represents the same rotation: (a + pi, pi - b, c + pi)
+    alternatives = np.where(middle_mask, np.pi - rotations, rotations + np.pi)
+
+    filtered = rotations.copy()
+    for frame_index in range(1, len(rotations)):
+        previous = filtered[frame_index - 1]
+        candidates = []
+        for candidate in (rotations[frame_index], alternatives[frame_index]):
+            candidate = candidate + two_pi * np.round((previous - candidate) / two_pi)
+            candidates.append(candidate)
+        distances = [np.abs(candidate - previous).sum(axis=-1) for candidate in candidates]
+        filtered[frame_index] = np.where((distances[1] < distances[0])[:, None], candidates[1], candidates[0])
+
+    return filtered
+
+
+def _write_keys(channels: list[tuple[OpenMaya.MPlug, np.ndarray]], frames: np.ndarray) -> list[OpenMaya.MObject]:
+    """
+    Internal function that writes given channel values as keys into the given plugs.
+    Plugs driven by other nodes than anim curves are disconnected and anim curves are created using a single DG
+    modifier before keys are added in bulk for each curve.
+
+    :param list[tuple[OpenMaya.MPlug, np.ndarray]] channels: list of plugs and their per frame values.
+    :param np.ndarray frames: frames to write keys on.
+    :return: list of keyed anim curves.
+    :rtype: list[OpenMaya.MObject]
+    """
+
+    modifier = OpenMaya.MDGModifier()
+    curve_functions: list[tuple[OpenMayaAnim.MFnAnimCurve, np.ndarray]] = []
+    disconnected_parents: set[str] = set()
+    for plug, values in channels:
+        if plug.isLocked:
+            logger.warning(f'Skipping bake of locked attribute: {plug.name()}')
+            continue
+
+        # when a compound parent (such as rotate) is connected, its connection is removed only once and its children
+        # are not disconnected, because their incoming connection is the parent one.
+        parent_connected = False
+        parent_plug = plug.parent() if plug.isChild else None
+        if parent_plug is not None:
+            parent_name = parent_plug.name()
+            if parent_name in disconnected_parents:
+                parent_connected = True
+            elif parent_plug.isDestination:
+                modifier.disconnect(parent_plug.source(), parent_plug)
+                disconnected_parents.add(parent_name)
+                parent_connected = True
+
+        anim_curve_fn = OpenMayaAnim.MFnAnimCurve()
+        source = OpenMaya.MPlug() if parent_connected else plug.source()
+        if not source.isNull and source.node().hasFn(OpenMaya.MFn.kAnimCurve):
+            anim_curve_fn.setObject(source.node())
+        else:
+            if not source.isNull:
+                modifier.disconnect(source, plug)
+            anim_curve_fn.create(plug, OpenMayaAnim.MFnAnimCurve.kAnimCurveUnknown, modifier)
+        curve_functions.append((anim_curve_fn, values))
+    modifier.doIt()
+
+    time_unit = OpenMaya.MTime.uiUnit()
+    times = OpenMaya.MTimeArray([OpenMaya.MTime(float(frame), time_unit) for frame in frames])
+    anim_curves: list[OpenMaya.MObject] = []
+    for anim_curve_fn, values in curve_functions:
+        anim_curve_fn.addKeys(
+            times, OpenMaya.MDoubleArray(values.tolist()), OpenMayaAnim.MFnAnimCurve.kTangentAuto,
+            OpenMayaAnim.MFnAnimCurve.kTangentAuto, False)
+        anim_curves.append(anim_curve_fn.object())
+
+    return anim_curves
@@ -48,15 +48,42 @@ def components_from_nodes(nodes: list[api.DGNode]) -> dict[Component, list[api.D
     :param list[DGNode] nodes: list of nodes to get components for.
     :return: dictionary with the found components and its related scene nodes.
     :rtype: dict[Component, list[api.DGNode]]
+    :raises errors.NoddleMissingRigForNode: if the component of one of the nodes does not belong to any rig.
+    ..note:: nodes are grouped by their connected meta node, so each rig and component is only resolved once.
     """
 
-    found_components = {}
+    # Import here to avoid cyclic imports
+    from tp.libs.rig.noddle.functions import rigs
+
+    nodes_by_meta: dict[base.MetaBase, list[api.DGNode]] = {}
     for node in nodes:
-        try:
-            found_component = component_from_node(node)
-        except errors.NoddleMissingMetaNode:
+        meta_nodes = base.connected_meta_nodes(node) if not base.is_meta_node(node) else [base.MetaBase(node.object())]
+        if not meta_nodes:
             continue
-        found_components.setdefault(found_component, []).append(node)
+        nodes_by_meta.setdefault(meta_nodes[0], []).append(node)
+
+    found_components: dict[Component, list[api.DGNode]] = {}
+    rigs_cache: dict[base.MetaBase, Rig] = {}
+    components_cache: dict[base.MetaBase, Component | None] = {}
+    for meta_node, meta_nodes_members in nodes_by_meta.items():
+        component_meta = component_meta_node_from_meta_node(meta_node)
+        if component_meta is None:
+            continue
+        if component_meta in components_cache:
+            found_component = components_cache[component_meta]
+        else:
+            root_meta = rigs.parent_rig_meta_node(component_meta)
+            if root_meta is None:
+                raise errors.NoddleMissingRigForNode(meta_nodes_members[0].fullPathName())
+            found_rig = rigs_cache.get(root_meta)
+            if found_rig is None:
+                found_rig = rigs.parent_rig(component_meta)
+                rigs_cache[root_meta] = found_rig
+            found_component = found_rig.component(
+                component_meta.attribute(consts.NODDLE_NAME_ATTR).value(),
+                component_meta.attribute(consts.NODDLE_SIDE_ATTR).value())
+            components_cache[component_meta] = found_component
+        found_components.setdefault(found_component, []).extend(meta_nodes_members)
 
     return found_components
 
@@ -87,11 +114,22 @@ def component_meta_node_from_node(node: api.DGNode) -> CritComponent | base.Meta
     if not meta_nodes:
         raise ValueError('No meta node attached to given node!')
 
-    actual = meta_nodes[0]
-    if actual.hasAttribute(consts.NODDLE_COMPONENT_TYPE_ATTR):
-        return actual
+    return component_meta_node_from_meta_node(meta_nodes[0])
+
+
+def component_meta_node_from_meta_node(meta_node: base.MetaBase) -> CritComponent | base.MetaBase | None:
+    """
+    Returns the component meta node instance which is either the given meta node or one of its meta parents.
+
+    :param base.MetaBase meta_node: meta node to get component meta node instance from.
+    :return: component meta node instance.
+    :rtype: CritComponent or None
+    """
+
+    if meta_node.hasAttribute(consts.NODDLE_COMPONENT_TYPE_ATTR):
+        return meta_node
 
-    for meta_parent in actual.iterate_meta_parents():
+    for meta_parent in meta_node.iterate_meta_parents():
         if meta_parent.hasAttribute(consts.NODDLE_COMPONENT_TYPE_ATTR):
             return meta_parent
 
@@ -1,12 +1,28 @@
 from __future__ import annotations
 
-from typing import List
+from typing import List, NamedTuple, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 import maya.cmds as cmds
+import maya.api.OpenMaya as OpenMaya
 
 from tp.maya import api
 
 
+class CurveSamples(NamedTuple):
+    """
+    Curve samples evaluated by sample_curve function.
+    """
+
+    parameters: np.ndarray
+    positions: np.ndarray
+    tangents: np.ndarray
+
+
 def curve_from_points(
         name: str, degree: int = 1, points: List[List[float, float, float], ...] | None = None,
         parent: api.DagNode | None = None) -> api.DagNode:
@@ -32,3 +48,81 @@ def curve_from_points(
         new_curve.setParent(parent)
 
     return new_curve
+
+
+def curve_shape_path(curve: api.DagNode) -> OpenMaya.MDagPath:
+    """
+    Returns the DAG path to the NURBS curve shape of the given curve transform or shape.
+
+    :param api.DagNode curve: curve transform or curve shape node.
+    :return: curve shape DAG path.
+    :rtype: OpenMaya.MDagPath
+    """
+
+    curve_path = OpenMaya.MDagPath.getAPathTo(curve.object())
+    if not curve_path.hasFn(OpenMaya.MFn.kNurbsCurve):
+        raise TypeError(f'curve_shape_path() expects a NURBS curve ({curve} given)!')
+    if curve_path.apiType() != OpenMaya.MFn.kNurbsCurve:
+        curve_path.extendToShape()
+
+    return curve_path
+
+
+def uniform_percentages(amount: int) -> np.ndarray:
+    """
+    Returns the given amount of evenly spaced percentages between 0.0 and 1.0, both included.
+
+    :param int amount: number of percentages.
+    :return: percentages array.
+    :rtype: np.ndarray
+    """
+
+    return np.linspace(0.0, 1.0, amount) if amount > 1 else np.zeros(max(amount, 0))
+
+
+def sample_curve(
+        curve: api.DagNode | OpenMaya.MDagPath, percentages: Sequence[float] | np.ndarray,
+        uniform_length: bool = False) -> CurveSamples:
+    """
+    Evaluates the world space positions and tangents of the given curve at the given percentages in a single pass
+    through the curve function set.
+
+    :param api.DagNode or OpenMaya.MDagPath curve: curve node or curve shape DAG path to sample.
+    :param Sequence[float] or np.ndarray percentages: percentages (from 0.0 to 1.0) along the curve to sample.
+    :param bool uniform_length: if True, percentages are measured along the curve arc length, so samples are evenly
+        spaced in distance; otherwise percentages are measured along the curve parameter range (as pointOnCurve
+        command does when turnOnPercentage is enabled).
+    :return: sampled curve parameters with (N, 3) positions and (N, 3) normalized tangents arrays.
+    :rtype: CurveSamples
+    :raises ImportError: if NumPy is not available.
+    """
+
+    if np is None:
+        raise ImportError('NumPy is required to sample curves!')
+
+    curve_path = curve if isinstance(curve, OpenMaya.MDagPath) else curve_shape_path(curve)
+    curve_fn = OpenMaya.MFnNurbsCurve(curve_path)
+    percentages = np.clip(np.asarray(percentages, dtype=np.float64), 0.0, 1.0)
+    if uniform_length:
+        curve_length = curve_fn.length()
+        find_param = curve_fn.findParamFromLength
+        parameters = np.fromiter(
+            (find_param(length) for length in (percentages * curve_length).tolist()), dtype=np.float64,
+            count=len(percentages))
+    else:
+        min_param, max_param = curve_fn.knotDomain
+        parameters = min_param + percentages * (max_param - min_param)
+
+    positions = np.empty((len(parameters), 3), dtype=np.float64)
+    tangents = np.empty((len(parameters), 3), dtype=np.float64)
+    get_point, get_tangent, world_space = curve_fn.getPointAtParam, curve_fn.tangent, OpenMaya.MSpace.kWorld
+    for i, parameter in enumerate(parameters.tolist()):
+        point = get_point(parameter, world_space)
+        tangent = get_tangent(parameter, world_space)
+        positions[i] = (point.x, point.y, point.z)
+        tangents[i] = (tangent.x, tangent.y, tangent.z)
+
+    lengths = np.linalg.norm(tangents, axis=1, keepdims=True)
+    np.divide(tangents, lengths, out=tangents, where=lengths > 0.0)
+
+    return CurveSamples(parameters=parameters, positions=positions, tangents=tangents)
@@ -1,5 +1,16 @@
 from __future__ import annotations
 
+import array
+import hashlib
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as OpenMaya
+
 from tp.maya import api
 from tp.maya.om import dagpath
 
@@ -24,3 +35,85 @@ def list_deformer_paths(deformer_type: int, under_group: api.DagNode | None = No
                     found_deformers.append(deformer_node_path)
 
     return found_deformers
+
+
+def geometry_component_count(shape: OpenMaya.MDagPath) -> int:
+    """
+    Returns the number of deformable components (vertices, CVs or lattice points) of the given geometry shape.
+
+    :param OpenMaya.MDagPath shape: geometry shape path.
+    :return: number of components.
+    :rtype: int
+    """
+
+    if shape.hasFn(OpenMaya.MFn.kMesh):
+        return OpenMaya.MFnMesh(shape).numVertices
+
+    return OpenMaya.MItGeometry(shape).count()
+
+
+def topology_fingerprint(shape: OpenMaya.MDagPath) -> str:
+    """
+    Returns a fingerprint that identifies the topology of the given geometry shape, with the format "count:hash".
+    For meshes the hash is computed from the polygon vertex counts and connections, so meshes with the same vertex
+    count but with different topology have different fingerprints. For other geometry types only the components count
+    is used.
+
+    :param OpenMaya.MDagPath shape: geometry shape path.
+    :return: topology fingerprint.
+    :rtype: str
+    """
+
+    count = geometry_component_count(shape)
+    if not shape.hasFn(OpenMaya.MFn.kMesh):
+        return f'{count}:'
+
+    polygon_counts, polygon_connects = OpenMaya.MFnMesh(shape).getVertices()
+    digest = hashlib.sha1(array.array('i', polygon_counts).tobytes())
+    digest.update(array.array('i', polygon_connects).tobytes())
+
+    return f'{count}:{digest.hexdigest()[:16]}'
+
+
+def read_deformer_weights(deformer_name: str, geometry_index: int, count: int) -> np.ndarray:
+    """
+    Returns the per component weights of the given deformer for the geometry at the given index.
+    Existing weights are read with a single call, components without an explicit weight get the default weight (1.0).
+
+    :param str deformer_name: name of the deformer to read weights from.
+    :param int geometry_index: index of the deformed geometry within the deformer.
+    :param int count: number of components of the deformed geometry.
+    :return: weights array.
+    :rtype: np.ndarray
+    """
+
+    weights = np.ones(count, dtype=np.float32)
+    weights_attribute = f'{deformer_name}.weightList[{geometry_index}].weights'
+    selection = OpenMaya.MSelectionList()
+    selection.add(weights_attribute)
+    indices = np.asarray(selection.getPlug(0).getExistingArrayAttributeIndices(), dtype=np.int64)
+    if not len(indices):
+        return weights
+
+    values = np.asarray(cmds.getAttr(weights_attribute), dtype=np.float32).reshape(-1)
+    valid = indices < count
+    weights[indices[valid]] = values[valid]
+
+    return weights
+
+
+def write_deformer_weights(deformer_name: str, geometry_index: int, weights: np.ndarray):
+    """
+    Sets the per component weights of the given deformer for the geometry at the given index with a single call.
+
+    :param str deformer_name: name of the deformer to set weights of.
+    :param int geometry_index: index of the deformed geometry within the deformer.
+    :param np.ndarray weights: weights array with a weight for each one of the geometry components.
+    """
+
+    count = len(weights)
+    if not count:
+        return
+
+    cmds.setAttr(
+        f'{deformer_name}.weightList[{geometry_index}].weights[0:{count - 1}]', *weights.tolist(), size=count)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import bisect
 import shutil
 
 from tp.core import log, dcc
@@ -9,6 +10,10 @@ from tp.preferences.interfaces import noddle
 
 logger = log.rigLogger
 
+# Versioned files indices. Keys are (directory, extension, split character) tuples and values are tuples containing the
+# directory modification time when it was scanned and the dictionary of versioned files.
+_VERSIONED_FILES_INDEX: dict[tuple[str, str, str], tuple[int, dict[str, list[str]]]] = {}
+
 
 def create_empty_scene(new_path: str) -> bool:
 	"""
@@ -48,22 +53,7 @@ def versioned_files(directory: str, extension: str = '', split_char: str = '.')
 	:rtype: dict[str, list[str]]
 	"""
 
-	files_dict = dict()
-	all_files = [item for item in os.listdir(directory) if path.is_file(path.join_path(directory, item))]
-	if extension:
-		all_files = [item for item in all_files if item.endswith(f'.{extension}')]
-	for found_file in all_files:
-		split_file = found_file.split(split_char)[0]
-		if  split_file not in files_dict:
-			files_dict[split_file] = [found_file]
-		else:
-			files_dict[split_file].append(found_file)
-
-	# sort items for each key
-	for key, value in files_dict.items():
-		files_dict[key] = sorted(value)
-
-	return files_dict
+	return {key: list(value) for key, value in _versioned_files_index(directory, extension, split_char).items()}
 
 
 def latest_file(
@@ -80,11 +70,11 @@ def latest_file(
 	:rtype: str or None
 	"""
 
-	files_dict = versioned_files(directory, extension=extension, split_char=split_char)
-	if name not in files_dict:
+	versions = _versioned_files_index(directory, extension, split_char).get(name)
+	if not versions:
 		return None
 
-	return files_dict[name][-1] if not full_path else path.join_path(directory, files_dict[name][-1])
+	return versions[-1] if not full_path else path.join_path(directory, versions[-1])
 
 
 def new_versioned_file(
@@ -99,10 +89,125 @@ def new_versioned_file(
 	:param str split_char: character used to split the file name from the version sub string.
 	:return: new versioned file path.
 	:rtype: str
+	..note:: store the directory_modification_time before writing the new version file and call
+		register_versioned_file once it is written, so the versioned files index of the directory is updated without
+		scanning the directory again.
 	"""
 
-	files_dict = versioned_files(directory, extension=extension, split_char=split_char)
-	new_version = int(files_dict[name][-1].split(split_char)[-2]) + 1 if name in files_dict else 0
+	versions = _versioned_files_index(directory, extension, split_char).get(name)
+	new_version = int(versions[-1].split(split_char)[-2]) + 1 if versions else 0
 	new_file_name = f'{name}{split_char}{str(new_version).zfill(4)}{split_char}{extension}'
 
 	return new_file_name if not full_path else path.join_path(directory, new_file_name)
+
+
+def directory_modification_time(directory: str) -> int | None:
+	"""
+	Returns the modification time of the given directory in nanoseconds.
+
+	:param str directory: directory to get modification time of.
+	:return: directory modification time or None if the directory cannot be accessed.
+	:rtype: int or None
+	..note:: call this before writing versioned files into the directory and pass the result to
+		register_versioned_file.
+	"""
+
+	try:
+		return os.stat(os.path.normpath(directory)).st_mtime_ns
+	except OSError:
+		return None
+
+
+def register_versioned_file(file_path: str, previous_mtime: int | None = None, split_char: str = '.'):
+	"""
+	Adds given newly written versioned file into the versioned files indices of its directory.
+
+	:param str file_path: absolute path of the written versioned file.
+	:param int or None previous_mtime: modification time of the file directory before the file was written.
+	:param str split_char: character used to split the file name from the version sub string.
+	"""
+
+	register_versioned_files([file_path], previous_mtime=previous_mtime, split_char=split_char)
+
+
+def register_versioned_files(file_paths: list[str], previous_mtime: int | None = None, split_char: str = '.'):
+	"""
+	Adds given newly written versioned files into the versioned files indices of their directory.
+	Indices are only updated if the directory modification time before the files were written matches the one the
+	indices were built with. Otherwise, other files may have been written into the directory in the meantime, so
+	indices are discarded and the directory will be scanned again the next time it is queried.
+
+	:param list[str] file_paths: absolute paths of the written versioned files. All of them must be located within the
+		same directory.
+	:param int or None previous_mtime: modification time of the files directory before the files were written.
+	:param str split_char: character used to split the file name from the version sub string.
+	"""
+
+	if not file_paths:
+		return
+
+	directory = os.path.dirname(os.path.normpath(file_paths[0]))
+	file_names = [os.path.basename(os.path.normpath(file_path)) for file_path in file_paths]
+	mtime = directory_modification_time(directory)
+
+	for key, (index_mtime, files_dict) in list(_VERSIONED_FILES_INDEX.items()):
+		index_directory, extension, index_split_char = key
+		if index_directory != directory or index_split_char != split_char:
+			continue
+		if mtime is None or previous_mtime is None or index_mtime != previous_mtime:
+			del _VERSIONED_FILES_INDEX[key]
+			continue
+		for file_name in file_names:
+			if extension and not file_name.endswith(f'.{extension}'):
+				continue
+			versions = files_dict.setdefault(file_name.split(split_char)[0], [])
+			if file_name not in versions:
+				bisect.insort(versions, file_name)
+		_VERSIONED_FILES_INDEX[key] = (mtime, files_dict)
+
+
+def clear_versioned_files_cache(directory: str | None = None):
+	"""
+	Clears the versioned files indices.
+
+	:param str or None directory: optional directory to clear indices of. If not given, all indices are cleared.
+	"""
+
+	if directory is None:
+		_VERSIONED_FILES_INDEX.clear()
+		return
+
+	directory = os.path.normpath(directory)
+	for key in [key for key in _VERSIONED_FILES_INDEX if key[0] == directory]:
+		del _VERSIONED_FILES_INDEX[key]
+
+
+def _versioned_files_index(directory: str, extension: str = '', split_char: str = '.') -> dict[str, list[str]]:
+	"""
+	Internal function that returns the versioned files index of the given directory. Directory is only scanned when
+	its modification time changed since the last scan.
+
+	:param str directory: path where versioned files are located.
+	:param str extension: optional filter extension for the versioned files to retrieve.
+	:param str split_char: character used to split the file name from the version sub string.
+	:return: dictionary containing file names as keys and a sorted list of files with that version as values.
+	:rtype: dict[str, list[str]]
+	"""
+
+	key = (os.path.normpath(directory), extension, split_char)
+	mtime = os.stat(directory).st_mtime_ns
+	cached = _VERSIONED_FILES_INDEX.get(key)
+	if cached is not None and cached[0] == mtime:
+		return cached[1]
+
+	files_dict: dict[str, list[str]] = {}
+	with os.scandir(directory) as entries:
+		for entry in entries:
+			if not entry.is_file() or (extension and not entry.name.endswith(f'.{extension}')):
+				continue
+			files_dict.setdefault(entry.name.split(split_char)[0], []).append(entry.name)
+	for versions in files_dict.values():
+		versions.sort()
+	_VERSIONED_FILES_INDEX[key] = (mtime, files_dict)
+
+	return files_dict
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
-from typing import List
+from typing import List, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 import maya.cmds as cmds
 
 from tp.core import log
 from tp.maya import api
 
-from tp.libs.rig.noddle.functions import naming, nodes
+from tp.libs.rig.noddle.functions import naming, nodes, curves
 
 logger = log.rigLogger
 
@@ -42,35 +47,34 @@ def joint_chain(start_joint: api.Joint, end_joint: api.Joint | None = None) -> L
 
 def create_along_curve(
         curve: api.DagNode, amount: int, joint_name: str = 'joint', joint_side: str = 'c', joint_suffix: str = 'jnt',
-        delete_curve: bool = False, attach_to_curve: bool = False) -> List[api.Joint]:
+        delete_curve: bool = False, attach_to_curve: bool = False, uniform_length: bool = False) -> List[api.Joint]:
     """
     Creates new joints along given curve.
+    Curve is sampled in a single pass and all joints are created and positioned with a single modifier each, so it
+    scales to chains with hundreds of joints.
 
     :param api.DagNode curve: curve to create joints following it.
-    :param int amount:
+    :param int amount: number of joints to create.
     :param str joint_name: name part for the new joints names.
     :param str joint_side: side part fo the new joints names.
     :param str joint_suffix: suffix part for the new joints names.
     :param bool delete_curve: whether to delete curve after creating the joints.
     :param bool attach_to_curve: whether to attach joints to the curve.
+    :param bool uniform_length: whether to space joints evenly along the curve arc length instead of along the curve
+        parameter range.
     :return: newly created joints.
     :rtype: List[api.Joint]
     """
 
-    joints = []
-    for i in range(amount):
-        param = float(i) / float(amount - 1)
-        point = cmds.pointOnCurve(curve.fullPathName(), pr=param, top=1)
-        jnt = api.node_by_name(cmds.createNode('joint', n=naming.generate_name(joint_name, joint_side, joint_suffix)))
-        jnt.setTranslation(api.Vector(*point), space=api.kWorldSpace)
-        joints.append(jnt)
+    samples = curves.sample_curve(curve, curves.uniform_percentages(amount), uniform_length=uniform_length)
+    joints = create_from_positions(samples.positions, joint_name, joint_side, joint_suffix)
 
     if attach_to_curve:
-        pt_on_curve_info = nodes.create('pointOnCurveInfo', joint_name, joint_side, suffix='ptcrv')
-        curve.worldSpace[0].connect(pt_on_curve_info.inputCurve)
-        pt_on_curve_info.parameter.set(param)
-        pt_on_curve_info.turnOnPercentage.set(True)
-        pt_on_curve_info.result.position.connect(jnt.translate)
+        for jnt, parameter in zip(joints, samples.parameters.tolist()):
+            pt_on_curve_info = nodes.create('pointOnCurveInfo', joint_name, joint_side, suffix='ptcrv')
+            curve.worldSpace[0].connect(pt_on_curve_info.inputCurve)
+            pt_on_curve_info.parameter.set(parameter)
+            pt_on_curve_info.result.position.connect(jnt.translate)
 
     if delete_curve:
         curve.delete()
@@ -78,6 +82,39 @@ def create_along_curve(
     return joints
 
 
+def create_from_positions(
+        positions: Sequence[Sequence[float]] | np.ndarray, joint_name: str = 'joint', joint_side: str = 'c',
+        joint_suffix: str = 'jnt') -> List[api.Joint]:
+    """
+    Creates new world parented joints at the given world positions.
+    All joints are created with a single modifier and positioned with another one.
+
+    :param Sequence[Sequence[float]] or np.ndarray positions: (N, 3) world positions of the joints to create.
+    :param str joint_name: name part for the new joints names.
+    :param str joint_side: side part fo the new joints names.
+    :param str joint_suffix: suffix part for the new joints names.
+    :return: newly created joints.
+    :rtype: List[api.Joint]
+    """
+
+    create_modifier = api.OpenMaya.MDagModifier()
+    joint_objects: list[api.OpenMaya.MObject] = []
+    for _ in range(len(positions)):
+        joint_object = create_modifier.createNode('joint', api.OpenMaya.MObject.kNullObj)
+        create_modifier.renameNode(joint_object, naming.generate_name(joint_name, joint_side, joint_suffix))
+        joint_objects.append(joint_object)
+    create_modifier.doIt()
+
+    value_modifier = api.OpenMaya.MDGModifier()
+    for joint_object, position in zip(joint_objects, positions):
+        translate_plug = api.OpenMaya.MFnDependencyNode(joint_object).findPlug('translate', False)
+        for i in range(3):
+            value_modifier.newPlugValueDouble(translate_plug.child(i), float(position[i]))
+    value_modifier.doIt()
+
+    return [api.node_by_object(joint_object) for joint_object in joint_objects]
+
+
 def create_chain(joint_list: List[api.Joint] | None = None, reverse: bool = False) -> List[api.Joint]:
     """
     Creates joint hierarchy from a list of given joints.
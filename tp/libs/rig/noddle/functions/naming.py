@@ -2,13 +2,12 @@ from __future__ import annotations
 
 import re
 import typing
-from typing import Iterator
-
-import maya.cmds as cmds
+from typing import Iterator, Iterable
 
 from tp.core import log
 from tp.common.python import helpers
 from tp.preferences.interfaces import noddle
+from tp.libs.rig.noddle.core import nameregistry
 
 if typing.TYPE_CHECKING:
     from tp.common.naming.manager import NameManager
@@ -16,6 +15,83 @@ if typing.TYPE_CHECKING:
 
 logger = log.rigLogger
 
+_INDEX_REGEX = re.compile(r"\d+|^$")
+
+
+class NamingTemplate:
+    """
+    Naming template compiled into a formatter and token positions, so names can be composed and deconstructed without
+    parsing the template each time.
+    """
+
+    def __init__(self, template: str):
+        """
+        Constructor.
+
+        :param str template: naming template. Eg. '{side}_{name}_{suffix}'
+        """
+
+        self._template = template
+        self._format = template.format
+        template_tokens = template.split('_')
+        self._name_position = template_tokens.index('{name}')
+        self._side_position = template_tokens.index('{side}')
+        self._suffix_position = template_tokens.index('{suffix}')
+
+    @property
+    def template(self) -> str:
+        return self._template
+
+    def compose(self, side: str, name: str, suffix: str) -> str:
+        """
+        Composes a node name using this template.
+
+        :param str side: side name.
+        :param str name: name (including index).
+        :param str suffix: suffix name.
+        :return: composed name.
+        :rtype: str
+        """
+
+        return self._format(side=side, name=name, suffix=suffix)
+
+    def deconstruct(self, node_name: str) -> helpers.ObjectDict:
+        """
+        Deconstruct given node name to tokens using this template.
+
+        :param str node_name: name we want to deconstruct
+        :return: deconstructed name dictionary.
+        :rtype: helpers.ObjectDict
+        """
+
+        name_parts = node_name.split('_')
+        index_positions = [i for i, part in enumerate(name_parts) if _INDEX_REGEX.match(part) is not None]
+        if not index_positions:
+            raise IndexError(f'Name "{node_name}" has no index token')
+        index_position = index_positions[-1]
+        index = name_parts[index_position]
+        name = '_'.join(name_parts[self._name_position:index_position])
+        indexed_name = '_'.join(name_parts[self._name_position:index_position + 1])
+
+        # tokens positions are resolved with the indexed name collapsed into a single token
+        tokens = name_parts[:self._name_position] + ['name'] + name_parts[index_position + 1:]
+
+        data = helpers.ObjectDict()
+        data.update({
+            'side': tokens[self._side_position],
+            'name': name,
+            'indexed_name': indexed_name,
+            'index': index,
+            'suffix': tokens[self._suffix_position]
+        })
+
+        return data
+
+
+_COMPILED_TEMPLATES: dict[str, NamingTemplate] = {}
+# Current naming settings, stored along with the naming profile values they were created from.
+_CURRENT_NAMING_SETTINGS: tuple[tuple[str | None, int, int], tuple[NamingTemplate, int, int]] | None = None
+
 
 def unique_name_for_rig(rigs: Iterator[Rig], name: str) -> str:
     """
@@ -27,8 +103,8 @@ def unique_name_for_rig(rigs: Iterator[Rig], name: str) -> str:
     :rtype: str
     """
 
+    current_names = {i.name() for i in rigs}
     new_name = name
-    current_names = [i.name() for i in rigs]
     index = 1
     while new_name in current_names:
         new_name = name + str(index).zfill(3)
@@ -49,7 +125,7 @@ def unique_name_for_component_by_rig(rig: Rig, name: str, side: str) -> str:
     """
 
     current_name = ':'.join([name, side])
-    current_names = [':'.join([i.name(), i.side()]) for i in rig.iterate_components()]
+    current_names = {':'.join([i.name(), i.side()]) for i in rig.iterate_components()}
     index = 1
     while current_name in current_names:
         current_name = ':'.join([name + str(index).zfill(3), side])
@@ -164,6 +240,24 @@ def compose_settings_name(name_manager: NameManager, component_name: str, compon
         {'componentName': component_name, 'side': component_side, 'section': section, 'type': 'settings'})
 
 
+def side_symmetry_tokens(name_manager: NameManager) -> dict[str, str]:
+    """
+    Returns the side tokens of the given name manager mapped to their mirrored side tokens, as defined within the
+    "sideSymmetry" token of the naming preset.
+
+    :param NameManager name_manager: name manager to get side symmetry tokens from.
+    :return: dictionary mapping each side token with its mirrored side token.
+    :rtype: dict[str, str]
+    """
+
+    token = name_manager.token('sideSymmetry')
+    if token is None:
+        logger.warning(f'Naming manager {name_manager} does not define a "sideSymmetry" token')
+        return {}
+
+    return {key_value.name: key_value.value for key_value in token.iterate_key_values()}
+
+
 def naming_template() -> str:
     """
     Returns the current naming template to use.
@@ -178,6 +272,60 @@ def naming_template() -> str:
     return all_templates.get(current_name)
 
 
+def current_naming_settings() -> tuple[NamingTemplate, int, int]:
+    """
+    Returns the current naming settings: the compiled current naming template, the name start index and the name
+    index padding.
+    Naming profile values are read from preferences with a single lookup, and the compiled settings are only rebuilt
+    when those values change, so changes to naming preferences are picked up by the next generated name.
+
+    :return: tuple with the compiled naming template, the name start index and the name index padding.
+    :rtype: tuple[NamingTemplate, int, int]
+    """
+
+    global _CURRENT_NAMING_SETTINGS
+
+    naming_profile = noddle.noddle_interface().naming_profile()
+    if _CURRENT_NAMING_SETTINGS is None or _CURRENT_NAMING_SETTINGS[0] != naming_profile:
+        template, start_index, index_padding = naming_profile
+        _CURRENT_NAMING_SETTINGS = (
+            naming_profile, (compiled_naming_template(template), start_index, index_padding))
+
+    return _CURRENT_NAMING_SETTINGS[1]
+
+
+def compiled_naming_template(template: str | None = None) -> NamingTemplate:
+    """
+    Returns the compiled version of the given naming template.
+    Compiled templates are cached by template string.
+
+    :param str or None template: naming template to compile. If not given, cached current naming template is used.
+    :return: compiled naming template.
+    :rtype: NamingTemplate
+    """
+
+    if template is None:
+        return current_naming_settings()[0]
+
+    compiled_template = _COMPILED_TEMPLATES.get(template)
+    if compiled_template is None:
+        compiled_template = _COMPILED_TEMPLATES[template] = NamingTemplate(template)
+
+    return compiled_template
+
+
+def invalidate():
+    """
+    Clears cached current naming settings and compiled naming templates, so they are compiled again the next time a
+    name is generated or deconstructed.
+    """
+
+    global _CURRENT_NAMING_SETTINGS
+
+    _CURRENT_NAMING_SETTINGS = None
+    _COMPILED_TEMPLATES.clear()
+
+
 def generate_name(name: str | list[str], side: str, suffix: str, override_index: int | None = None) -> str:
     """
     Generates a new node name.
@@ -190,25 +338,16 @@ def generate_name(name: str | list[str], side: str, suffix: str, override_index:
     :rtype: str
     """
 
-    noddle_preferences = noddle.noddle_interface()
     name = '_'.join(name) if isinstance(name, (list, tuple)) else name
-    timeout = 300
-    template = naming_template()
-    index = noddle_preferences.name_start_index()
-    zfill = noddle_preferences.name_index_padding()
-    index_str = str(index).zfill(zfill) if override_index is None else override_index
-    indexed_name = f'{name}_{index_str}'
-    full_name = template.format(side=side, name=indexed_name, suffix=suffix)
-    while cmds.objExists(full_name):
-        index += 1
-        index_str = str(index).zfill(zfill) if override_index is None else override_index
-        indexed_name = f'{name}_{index_str}'
-        full_name = template.format(side=side, name=indexed_name, suffix=suffix)
-        if index == timeout:
-            logger.warning(f'Reached maximum number of iterations ({timeout}')
-            break
+    template, start_index, zfill = current_naming_settings()
+    if override_index is not None:
+        return template.compose(side, f'{name}_{override_index}', suffix)
+
+    def _compose(_index: int) -> str:
+        return template.compose(side, f'{name}_{str(_index).zfill(zfill)}', suffix)
 
-    return full_name
+    return nameregistry.NameRegistry.unique_name(
+        (template.template, name, side, suffix, zfill), _compose, start_index=start_index)
 
 
 def deconstruct_name(node_name: str) -> helpers.ObjectDict:
@@ -220,31 +359,30 @@ def deconstruct_name(node_name: str) -> helpers.ObjectDict:
     :rtype: helpers.ObjectDict
     """
 
-    template = naming_template()
-    name_parts = node_name.split('_')
+    return compiled_naming_template().deconstruct(node_name)
 
-    re_index = re.compile(r"\d+|^$")
-    all_indexes = list(filter(re_index.match, name_parts))
-    index_index = len(name_parts) - name_parts[::-1].index(all_indexes[-1]) - 1
-    index = name_parts[index_index]
 
-    name_start_index = template.split('_').index('{name}')
-    name = '_'.join(name_parts[name_start_index:index_index])
-    indexed_name = '_'.join(name_parts[name_start_index:index_index + 1])
+def compose_names(names: Iterable[tuple[str, str, str]]) -> list[str]:
+    """
+    Composes the node names for all given side, name and suffix tokens using current naming template.
+
+    :param Iterable[tuple[str, str, str]] names: list of side, name and suffix tokens.
+    :return: composed names.
+    :rtype: list[str]
+    """
+
+    template = compiled_naming_template()
+    return [template.compose(side, name, suffix) for side, name, suffix in names]
 
-    temp_name = node_name.replace(indexed_name, 'name')
-    side_index = template.split('_').index('{side}')
-    suffix_index = template.split('_').index('{suffix}')
-    side = temp_name.split('_')[side_index]
-    suffix = temp_name.split('_')[suffix_index]
 
-    data = helpers.ObjectDict()
-    data.update({
-        'side': side,
-        'name': name,
-        'indexed_name': indexed_name,
-        'index': index,
-        'suffix': suffix
-    })
+def deconstruct_names(node_names: Iterable[str]) -> list[helpers.ObjectDict]:
+    """
+    Deconstructs all given node names to tokens using current naming template.
+
+    :param Iterable[str] node_names: names we want to deconstruct.
+    :return: list of deconstructed name dictionaries.
+    :rtype: list[helpers.ObjectDict]
+    """
 
-    return data
+    template = compiled_naming_template()
+    return [template.deconstruct(node_name) for node_name in node_names]
@@ -11,7 +11,7 @@ from tp.maya.meta import base
 from tp.common.python import helpers
 
 from tp.libs.rig.noddle import consts
-from tp.libs.rig.noddle.core import asset, rig, nodes, errors
+from tp.libs.rig.noddle.core import asset, rig, nodes, errors, registry
 
 if typing.TYPE_CHECKING:
     from tp.libs.rig.noddle.meta.rig import NoddleRig
@@ -116,11 +116,10 @@ def iterate_scene_rigs() -> Iterator[rig.Rig]:
 
     :return: iterated scene rig instances.
     :rtype: Iterator[rig.Rig]
+    ..note:: rig instances are retrieved from the scene rig registry, so their sessions are reused between calls.
     """
 
-    for meta_rig in iterate_scene_rig_meta_nodes():
-        rig_instance = rig.Rig(meta=meta_rig)
-        rig_instance.start_session()
+    for rig_instance in registry.RigRegistry.scene_rigs():
         yield rig_instance
 
 
@@ -190,12 +189,23 @@ def parent_rig(meta_node: base.MetaBase) -> rig.Rig | None:
     :rtype: rig.Rig or None
     """
 
-    found_rig = None
+    root_meta = parent_rig_meta_node(meta_node)
+
+    return registry.RigRegistry.rig(root_meta) if root_meta is not None else None
+
+
+def parent_rig_meta_node(meta_node: base.MetaBase) -> base.MetaBase | None:
+    """
+    Returns the root rig meta node of the given meta node instance without initializing any rig session.
+
+    :param base.MetaBase meta_node: meta base class to get root rig meta node of.
+    :return: root rig meta node instance found to be the parent of the given meta node instance.
+    :rtype: base.MetaBase or None
+    """
+
     for parent in meta_node.iterate_meta_parents(recursive=True):
-        crit_root_attr = parent.attribute(consts.NODDLE_IS_ROOT_ATTR)
-        if crit_root_attr and crit_root_attr.value():
-            found_rig = rig.Rig(meta=parent)
-            found_rig.start_session()
-            break
+        noddle_root_attr = parent.attribute(consts.NODDLE_IS_ROOT_ATTR)
+        if noddle_root_attr and noddle_root_attr.value():
+            return parent
 
-    return found_rig
+    return None
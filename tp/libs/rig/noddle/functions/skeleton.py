@@ -3,6 +3,7 @@ from __future__ import annotations
 import time
 
 import maya.cmds as cmds
+import maya.api.OpenMaya as OpenMaya
 
 from tp.core import log
 from tp.maya import api
@@ -17,6 +18,13 @@ from tp.libs.rig.noddle.functions import baking
 
 logger = log.rigLogger
 
+# Node types that drive the transform of the nodes they are connected to.
+DRIVER_NODE_TYPES = (
+    OpenMaya.MFn.kAnimCurve, OpenMaya.MFn.kConstraint, OpenMaya.MFn.kExpression, OpenMaya.MFn.kMotionPath)
+
+# Node types that are traversed through when looking for driver nodes.
+PASS_THROUGH_NODE_TYPES = (OpenMaya.MFn.kUnitConversion, OpenMaya.MFn.kPairBlend)
+
 
 def characterize_skeleton(
         joint: api.Joint, name, freeze_skeleton: bool = True) -> rig.Rig | None:
@@ -32,9 +40,19 @@ def characterize_skeleton(
     """
 
     start_time = time.perf_counter()
+    stage_start_time = start_time
+    timings: dict[str, float] = {}
+
+    def _stage_completed(stage_name: str):
+        nonlocal stage_start_time
+        current_time = time.perf_counter()
+        timings[stage_name] = current_time - stage_start_time
+        stage_start_time = current_time
+
     prefs = noddle.noddle_interface()
 
     clean_skeleton(joint)
+    _stage_completed('clean')
 
     found_meta_rig = None
     skeleton_layer = base.find_meta_node_from_node(joint, check_type=layers.NoddleSkeletonLayer)
@@ -53,6 +71,7 @@ def characterize_skeleton(
         [skeleton_root] + list(skeleton_root.iterateChildren(recursive=True, node_types=(api.kNodeTypes.kTransform,))))
     if not skeleton_root.exists():
         skeleton_root = root_joint(replace_joints[-1])
+    _stage_completed('replace transforms')
 
     rig_namespace = skeleton_root.namespace()
     root_parent = skeleton_root.parent()
@@ -66,6 +85,7 @@ def characterize_skeleton(
         baking.bake_objects(
             [skeleton_root], translate=True, rotate=True, scale=True, use_settings=False, simulation=False)
         cmds.delete(temp_constraint)
+    _stage_completed('bake')
 
     # root_folder = path.dirname(cmds.file(query=True, sceneName=True))
     # if prefs.check_project():
@@ -73,12 +93,14 @@ def characterize_skeleton(
     # rig_node.attribute(consts.ROOT_PATH_ATTR).set(root_folder)
 
     rig_node.setup_skeleton(skeleton_root)
+    _stage_completed('setup skeleton')
 
-    joints = [skeleton_root] + list(skeleton_root.iterateChildren(recursive=True, node_types=(api.kNodeTypes.kJoint,)))
-    for joint in joints:
-        setup_joint(joint)
+    setup_joints(skeleton_joints(skeleton_root))
+    _stage_completed('setup joints')
 
-    logger.info(f'Characterize completed in {time.perf_counter() - start_time} seconds')
+    logger.info(
+        f'Characterize completed in {time.perf_counter() - start_time} seconds '
+        f'({", ".join(f"{stage}: {elapsed:.3f}s" for stage, elapsed in timings.items())})')
 
     return rig_node
 
@@ -109,22 +131,100 @@ def is_animated(nodes: list[api.DagNode | api.Joint], filter_joints: bool = True
 
     if filter_joints:
         nodes = [x for x in nodes if x and x.apiType() == api.kNodeTypes.kJoint]
+
+    return any(animation_states([node for node in nodes if node], recursive=recursive).values())
+
+
+def animation_states(nodes: list[api.DagNode | api.Joint], recursive: bool = True) -> dict[api.DagNode, bool]:
+    """
+    Returns the animated state of each one of the given nodes. A node is animated if it is driven by animation keys,
+    constraints, expressions, motion paths or animation layers or, if recursive, if any of its ancestors is animated.
+    Driven and inherited states are memoized, so shared ancestors are only analyzed once.
+
+    :param list[api.DagNode | api.Joint] nodes: DAG nodes to check.
+    :param bool recursive: whether to take into account the animated state of the ancestors of each node.
+    :return: dictionary mapping each node with its animated state.
+    :rtype: dict[api.DagNode, bool]
+    """
+
+    driven_states: dict[int, bool] = {}
+    animated_states: dict[int, bool] = {}
+    result: dict[api.DagNode, bool] = {}
     for node in nodes:
-        node_name = node.fullPathName()
-        # TODO: do this check using OpenMaya
-        if cmds.listConnections(node_name, type='animCurve') or cmds.listConnections(
-                node_name, type='constraint', s=True, d=False) or cmds.listConnections(
-            node_name, type='animLayer', s=False, d=True):
-            return True
-        else:
-            if recursive:
-                return is_animated([node.parent()])
-            else:
-                return False
+        hierarchy: list[tuple[int, OpenMaya.MObject]] = []
+        animated = False
+        current = node.object()
+        while current is not None:
+            handle_hash = OpenMaya.MObjectHandle(current).hashCode()
+            if handle_hash in animated_states:
+                animated = animated_states[handle_hash]
+                break
+            hierarchy.append((handle_hash, current))
+            if not recursive:
+                break
+            dag_fn = OpenMaya.MFnDagNode(current)
+            parent = dag_fn.parent(0) if dag_fn.parentCount() else None
+            current = None if parent is None or parent.hasFn(OpenMaya.MFn.kWorld) else parent
+
+        # hierarchy is processed from top to bottom, so driven check is skipped once an ancestor is animated.
+        for handle_hash, node_object in reversed(hierarchy):
+            if not animated:
+                animated = driven_states.get(handle_hash)
+                if animated is None:
+                    animated = driven_states[handle_hash] = _is_driven(node_object)
+            animated_states[handle_hash] = animated
+        result[node] = animated
+
+    return result
+
+
+def _is_driven(node_object: OpenMaya.MObject) -> bool:
+    """
+    Internal function that returns whether given node is directly driven by animation nodes.
+
+    :param OpenMaya.MObject node_object: node to check.
+    :return: True if node is driven by animation nodes; False otherwise.
+    :rtype: bool
+    """
+
+    for direction, driver_types in (
+            (OpenMaya.MItDependencyGraph.kUpstream, DRIVER_NODE_TYPES),
+            (OpenMaya.MItDependencyGraph.kDownstream, (OpenMaya.MFn.kAnimLayer,))):
+        graph_iterator = OpenMaya.MItDependencyGraph(
+            node_object, OpenMaya.MFn.kInvalid, direction, OpenMaya.MItDependencyGraph.kBreadthFirst,
+            OpenMaya.MItDependencyGraph.kNodeLevel)
+        while not graph_iterator.isDone():
+            current = graph_iterator.currentNode()
+            if current != node_object:
+                if any(current.hasFn(driver_type) for driver_type in driver_types):
+                    return True
+                if not any(current.hasFn(pass_type) for pass_type in PASS_THROUGH_NODE_TYPES):
+                    graph_iterator.prune()
+            graph_iterator.next()
 
     return False
 
 
+def skeleton_joints(root: api.Joint) -> list[api.Joint]:
+    """
+    Returns all the joints of the skeleton hierarchy below given root joint (included) in depth first order.
+    Hierarchy is gathered in a single DAG traversal.
+
+    :param api.Joint root: skeleton root joint.
+    :return: list of skeleton joints.
+    :rtype: list[api.Joint]
+    """
+
+    found_joints: list[api.Joint] = []
+    dag_iterator = OpenMaya.MItDag()
+    dag_iterator.reset(root.object(), OpenMaya.MItDag.kDepthFirst, OpenMaya.MFn.kJoint)
+    while not dag_iterator.isDone():
+        found_joints.append(api.node_by_object(dag_iterator.currentItem()))
+        dag_iterator.next()
+
+    return found_joints
+
+
 def clean_skeleton(node: api.Joint):
     """
     Clean all connections to a skeleton to remove any links to meta node graph and set all scale values to 1.0
@@ -132,18 +232,23 @@ def clean_skeleton(node: api.Joint):
     :param api.Joint node: Maya scene joint that is part of a skeleton hierarchy.
     """
 
-    root_jnt = root_joint(node)
-    joints = [root_jnt] + list(root_jnt.iterateChildren(recursive=True, node_types=(api.kNodeTypes.kJoint,)))
-    for joint in joints:
-        if not joint.attribute('scale').isLocked:
-            joint.attribute('scale').set([1.0, 1.0, 1.0])
-        joint_name = joint.fullPathName()
-        for attr in cmds.listAttr(joint_name, ud=True) or []:
-            attr_name = f'{joint_name}.{attr}'
-            if not cmds.attributeQuery(attr, node=joint_name, exists=True):
+    modifier = OpenMaya.MDGModifier()
+    for joint in skeleton_joints(root_joint(node)):
+        joint_object = joint.object()
+        joint_fn = OpenMaya.MFnDependencyNode(joint_object)
+        scale_plug = joint_fn.findPlug('scale', False)
+        if not scale_plug.isLocked:
+            for i in range(scale_plug.numChildren()):
+                modifier.newPlugValueDouble(scale_plug.child(i), 1.0)
+        for i in range(joint_fn.attributeCount()):
+            attribute = joint_fn.attribute(i)
+            if joint_fn.attributeClass(attribute) != OpenMaya.MFnDependencyNode.kLocalDynamicAttr:
+                continue
+            if not OpenMaya.MFnAttribute(attribute).parent.isNull():
                 continue
-            if not cmds.listConnections(attr_name, s=True, d=False, p=True):
-                cmds.deleteAttr(attr_name)
+            if not _has_source_connection(OpenMaya.MPlug(joint_object, attribute)):
+                modifier.removeAttribute(joint_object, attribute)
+    modifier.doIt()
 
 
 def replace_transforms_with_joints(nodes: list[api.DagNode | api.Joint]) -> list[api.Joint]:
@@ -155,24 +260,53 @@ def replace_transforms_with_joints(nodes: list[api.DagNode | api.Joint]) -> list
     :rtype: list[api.Joint]
     """
 
-    result = nodes
-    for node in nodes:
-        if not node.shapes():
-            continue
-        parent_node = node.parent()
-        children = node.children(node_types=(api.kNodeTypes.kTransform,))
+    result = list(nodes)
+    replacements: list[tuple[api.DagNode, OpenMaya.MObject, OpenMaya.MVector, OpenMaya.MEulerRotation]] = []
+
+    # nodes are processed parent first, so nested transforms are created below the joints replacing their parents
+    nodes_to_replace = sorted(
+        [node for node in nodes if node.shapes()], key=lambda n: OpenMaya.MDagPath.getAPathTo(n.object()).length())
+    replaced_handles = {OpenMaya.MObjectHandle(node.object()).hashCode() for node in nodes_to_replace}
+    replace_joints: dict[int, OpenMaya.MObject] = {}
+    modifier = OpenMaya.MDagModifier()
+    for node in nodes_to_replace:
+        node_object = node.object()
+        transform_fn = OpenMaya.MFnTransform(node_object)
+        parent_object = transform_fn.parent(0)
+        if parent_object.hasFn(OpenMaya.MFn.kWorld):
+            parent_object = OpenMaya.MObject.kNullObj
+        else:
+            parent_object = replace_joints.get(OpenMaya.MObjectHandle(parent_object).hashCode(), parent_object)
+        replace_joint = modifier.createNode('joint', parent_object)
+        replace_joints[OpenMaya.MObjectHandle(node_object).hashCode()] = replace_joint
+        for i in range(transform_fn.childCount()):
+            child = transform_fn.child(i)
+            if not child.hasFn(OpenMaya.MFn.kTransform):
+                continue
+            # children that are replaced too are created directly below this joint
+            if OpenMaya.MObjectHandle(child).hashCode() in replaced_handles:
+                continue
+            modifier.reparentNode(child, replace_joint)
+        replacements.append(
+            (node, replace_joint, transform_fn.translation(OpenMaya.MSpace.kTransform), transform_fn.rotation()))
+
+    # replaced nodes are deleted children first, once all their children have been moved below the new joints
+    for node, replace_joint, _, _ in reversed(replacements):
         name = node.name()
-        cmds.select(clear=True)
-        replace_joint = api.factory.create_dag_node('temp_joint', node_type='joint')
-        replace_joint.setParent(parent_node)
-        replace_joint.attribute('translate').set(node.attribute('translate').value())
-        replace_joint.attribute('rotate').set(node.attribute('rotate').value())
-        for child in children:
-            child.setParent(child)
-        node.delete()
-        replace_joint.rename(name)
+        modifier.deleteNode(node.object())
+        modifier.renameNode(replace_joint, name)
+
+    if not replacements:
+        return result
+
+    modifier.doIt()
+
+    for node, replace_joint, translation, rotation in replacements:
+        joint_fn = OpenMaya.MFnTransform(replace_joint)
+        joint_fn.setTranslation(translation, OpenMaya.MSpace.kTransform)
+        joint_fn.setRotation(rotation)
         result.remove(node)
-        result.append(replace_joint)
+        result.append(api.node_by_object(replace_joint))
 
     return result
 
@@ -185,12 +319,66 @@ def setup_joint(joint: api.Joint):
     :param api.Joint joint: Maya scene joint node to set up.
     """
 
-    metaproperty.add_property(joint, properties.ExportProperty)
-    if not joint.hasAttribute(consts.NODDLE_BIND_TRANSLATE_ATTR):
-        joint.addAttribute(consts.NODDLE_BIND_TRANSLATE_ATTR, type=api.kMFnNumeric3Double)
-    if not joint.hasAttribute(consts.NODDLE_BIND_ROTATE_ATTR):
-        joint.addAttribute(consts.NODDLE_BIND_ROTATE_ATTR, type=api.kMFnNumeric3Double)
-    joint.attribute(consts.NODDLE_BIND_TRANSLATE_ATTR).set(joint.attribute('translate').value())
-    joint.attribute(consts.NODDLE_BIND_ROTATE_ATTR).set(joint.attribute('rotate').value())
-    if not joint.attribute('scale').isLocked:
-        joint.attribute('scale').set([1.0, 1.0, 1.0])
+    setup_joints([joint])
+
+
+def setup_joints(joints: list[api.Joint]):
+    """
+    Batch version of setup_joint function. Bind attributes of all given joints are added with a single modifier and
+    their values are set with another one.
+
+    :param list[api.Joint] joints: Maya scene joint nodes to set up.
+    """
+
+    for joint in joints:
+        metaproperty.add_property(joint, properties.ExportProperty)
+
+    bind_attribute_names = (consts.NODDLE_BIND_TRANSLATE_ATTR, consts.NODDLE_BIND_ROTATE_ATTR)
+    add_modifier = OpenMaya.MDGModifier()
+    for joint in joints:
+        joint_fn = OpenMaya.MFnDependencyNode(joint.object())
+        for attribute_name in bind_attribute_names:
+            if not joint_fn.hasAttribute(attribute_name):
+                add_modifier.addAttribute(
+                    joint.object(), OpenMaya.MFnNumericAttribute().create(
+                        attribute_name, attribute_name, OpenMaya.MFnNumericData.k3Double, 0.0))
+    add_modifier.doIt()
+
+    value_modifier = OpenMaya.MDGModifier()
+    for joint in joints:
+        joint_fn = OpenMaya.MFnDependencyNode(joint.object())
+        translate_plug = joint_fn.findPlug('translate', False)
+        rotate_plug = joint_fn.findPlug('rotate', False)
+        bind_values = (
+            [translate_plug.child(i).asDouble() for i in range(3)],
+            [rotate_plug.child(i).asMAngle().asDegrees() for i in range(3)])
+        for attribute_name, values in zip(bind_attribute_names, bind_values):
+            data_fn = OpenMaya.MFnNumericData()
+            data_object = data_fn.create(OpenMaya.MFnNumericData.k3Double)
+            data_fn.setData(values)
+            value_modifier.newPlugValue(joint_fn.findPlug(attribute_name, False), data_object)
+        scale_plug = joint_fn.findPlug('scale', False)
+        if not scale_plug.isLocked:
+            for i in range(scale_plug.numChildren()):
+                value_modifier.newPlugValueDouble(scale_plug.child(i), 1.0)
+    value_modifier.doIt()
+
+
+def _has_source_connection(plug: OpenMaya.MPlug) -> bool:
+    """
+    Internal function that returns whether given plug, or any of its elements or children, has an incoming connection.
+
+    :param OpenMaya.MPlug plug: plug to check.
+    :return: True if plug is driven by a connection; False otherwise.
+    :rtype: bool
+    """
+
+    if plug.isDestination:
+        return True
+    if plug.isArray:
+        return any(
+            _has_source_connection(plug.connectionByPhysicalIndex(i)) for i in range(plug.numConnectedElements()))
+    if plug.isCompound:
+        return any(_has_source_connection(plug.child(i)) for i in range(plug.numChildren()))
+
+    return False
@@ -1,14 +1,25 @@
 from __future__ import annotations
 
+import os
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from overrides import override
 
 import maya.cmds as cmds
+import maya.api.OpenMaya as OpenMaya
+import maya.api.OpenMayaAnim as OpenMayaAnim
 
 from tp.core import log
+from tp.maya import api
 from tp.common.python import jsonio
 
 from tp.libs.rig.noddle.io import abstract
-from tp.libs.rig.noddle.functions import files
+from tp.libs.rig.noddle.functions import files, deformer
 
 logger = log.rigLogger
 
@@ -17,17 +28,73 @@ class BlendShapesManager(abstract.AbstractIOManager):
 
     DATA_TYPE = 'blendShape'
     EXTENSION = 'shape'
+    DELTAS_EXTENSION = 'npz'
+
+    # Table with an entry for each exported target item. Only the components whose delta is bigger than the tolerance
+    # are stored: components and deltas of all the items are stored in single arrays, and offset/count fields define
+    # the slice of those arrays that belongs to each item.
+    TARGETS_DTYPE = [
+        ('name', 'U256'), ('index', 'i4'), ('item', 'i4'), ('weight', 'f8'), ('offset', 'i8'), ('count', 'i4')]
+    DELTA_TOLERANCE = 1e-6
+
+    def __init__(self):
+        super().__init__()
+
+        self._mapping: dict | None = None
 
     @property
     def path(self) -> str:
         return self.asset.data.blendshapes
 
     @classmethod
-    def import_all(cls):
+    def export_all(cls) -> dict[str, dict]:
+        """
+        Exports the targets of all the blendshapes found under the asset geometry as sparse delta files.
+
+        :return: dictionary containing the export result of each one of the blendshapes.
+        :rtype: dict[str, dict]
+        """
 
         manager = cls()
-        for bs_name in manager.versioned_files.keys():
-            manager.import_single(bs_name)
+        geometry_layer = manager.rig.geometry_layer() if manager.rig else None
+        if not geometry_layer:
+            logger.warning(f'{manager}: No geometry layer found for asset rig, skipping blendshapes export...')
+            return {}
+
+        results: dict[str, dict] = {}
+        for bs_name in deformer.list_deformer_paths(OpenMaya.MFn.kBlendShape, geometry_layer.root_transform()):
+            start_time = time.time()
+            export_path = manager.export_single(bs_name)
+            results[bs_name] = {
+                'file': export_path or '', 'success': bool(export_path), 'time': time.time() - start_time}
+
+        return results
+
+    @classmethod
+    def import_all(cls) -> dict[str, dict]:
+        """
+        Imports all the blendshapes saved for the asset.
+        Mapping file is only read once for the whole import.
+
+        :return: dictionary containing the import result of each one of the blendshapes.
+        :rtype: dict[str, dict]
+        """
+
+        manager = cls()
+        bs_names = list(manager.versioned_files.keys())
+        bs_names.extend(
+            bs_name for bs_name in files.versioned_files(manager.path, extension=cls.DELTAS_EXTENSION)
+            if bs_name not in manager.versioned_files)
+
+        results: dict[str, dict] = {}
+        for bs_name in bs_names:
+            start_time = time.time()
+            success = manager.import_single(bs_name)
+            results[bs_name] = {
+                'file': manager.latest_deltas_file(bs_name) or manager.latest_file(bs_name, full_path=True) or '',
+                'success': success, 'time': time.time() - start_time}
+
+        return results
 
     @override(check_signature=False)
     def base_name(self, bs_name: str) -> str:
@@ -37,15 +104,44 @@ class BlendShapesManager(abstract.AbstractIOManager):
     def latest_file(self, bs_name: str, full_path: bool = False) -> str:
         return files.latest_file(self.base_name(bs_name), self.path, extension=self.EXTENSION, full_path=full_path)
 
-    def mapping(self) -> dict:
+    def latest_deltas_file(self, bs_name: str) -> str | None:
+        """
+        Returns the latest sparse deltas file of the given blendshape.
+
+        :param str bs_name: name of the blendshape.
+        :return: latest deltas file absolute path.
+        :rtype: str or None
+        """
+
+        return files.latest_file(
+            self.base_name(bs_name), self.path, extension=self.DELTAS_EXTENSION, full_path=True)
+
+    def new_deltas_file(self, bs_name: str) -> str:
+        """
+        Returns the path of the new version of the sparse deltas file of the given blendshape.
+
+        :param str bs_name: name of the blendshape.
+        :return: new deltas file absolute path.
+        :rtype: str
+        """
+
+        return files.new_versioned_file(
+            self.base_name(bs_name), directory=self.path, extension=self.DELTAS_EXTENSION, full_path=True)
+
+    def mapping(self, refresh: bool = False) -> dict:
         """
         Returns mapping data from asset blenshapes mapping file.
+        Mapping file is only read the first time this function is called for this manager instance.
 
+        :param bool refresh: whether to force the read of the mapping file.
         :return: mapping data.
         :rtype :dict
         """
 
-        return jsonio.read_file(self.asset.mapping.blendshapes)
+        if self._mapping is None or refresh:
+            self._mapping = jsonio.read_file(self.asset.mapping.blendshapes) or {}
+
+        return self._mapping
 
     def mapped_geometry(self, bs_name: str) -> str:
         """
@@ -56,9 +152,85 @@ class BlendShapesManager(abstract.AbstractIOManager):
         :rtype: str
         """
 
+        return self.mapping().get(str(bs_name), '')
+
+    def export_single(self, bs_name: str) -> str | None:
+        """
+        Exports the targets of the given blendshape into a new sparse deltas file and updates the blendshapes mapping.
+
+        :param str bs_name: name of the blendshape to export.
+        :return: exported file path. None if the export operation failed.
+        :rtype: str or None
+        """
+
         bs_name = str(bs_name)
-        print(self.mapping())
-        return self.mapping().get(bs_name, '')
+        if np is None:
+            logger.error(f'{self}: NumPy is required to export blendshape deltas')
+            return None
+        if not cmds.objExists(bs_name):
+            logger.warning(f'{self}: blendshape {bs_name} does not exist')
+            return None
+
+        bs_object = api.node_by_name(bs_name).object()
+        geometry_filter_fn = OpenMayaAnim.MFnGeometryFilter(bs_object)
+        output_shapes = geometry_filter_fn.getOutputGeometry()
+        if not len(output_shapes) or not output_shapes[0].hasFn(OpenMaya.MFn.kMesh):
+            logger.warning(f'{self}: sparse deltas are only supported for blendshapes deforming meshes: {bs_name}')
+            return None
+        shape = OpenMaya.MDagPath.getAPathTo(output_shapes[0])
+        geometry_index = geometry_filter_fn.indexForOutputShape(output_shapes[0])
+
+        bs_fn = OpenMaya.MFnDependencyNode(bs_object)
+        weight_plug = bs_fn.findPlug('weight', False)
+        groups_plug = bs_fn.findPlug('inputTarget', False).elementByLogicalIndex(geometry_index).child(
+            bs_fn.attribute('inputTargetGroup'))
+        item_attr = bs_fn.attribute('inputTargetItem')
+        points_attr = bs_fn.attribute('inputPointsTarget')
+        components_attr = bs_fn.attribute('inputComponentsTarget')
+        aliases = {index: alias for alias, index in self._target_aliases(bs_name).items()}
+
+        targets: list[tuple] = []
+        all_components: list[np.ndarray] = []
+        all_deltas: list[np.ndarray] = []
+        offset = 0
+        for target_index in groups_plug.getExistingArrayAttributeIndices():
+            items_plug = groups_plug.elementByLogicalIndex(target_index).child(item_attr)
+            weight = weight_plug.elementByLogicalIndex(target_index).asDouble()
+            for item_index in items_plug.getExistingArrayAttributeIndices():
+                item_plug = items_plug.elementByLogicalIndex(item_index)
+                components, deltas = self._read_target_item(
+                    item_plug.child(points_attr), item_plug.child(components_attr))
+                mask = np.any(np.abs(deltas) > self.DELTA_TOLERANCE, axis=1)
+                components, deltas = components[mask], deltas[mask]
+                targets.append((
+                    aliases.get(target_index, f'target{target_index}'), target_index, item_index, weight, offset,
+                    len(components)))
+                all_components.append(components)
+                all_deltas.append(deltas)
+                offset += len(components)
+
+        export_path = self.new_deltas_file(bs_name)
+        previous_mtime = files.directory_modification_time(self.path)
+        temp_file_path = f'{export_path}.tmp'
+        with open(temp_file_path, 'wb') as f:
+            np.savez_compressed(
+                f, targets=np.array(targets, dtype=self.TARGETS_DTYPE),
+                components=np.concatenate(all_components).astype(np.int32) if all_components else np.zeros(
+                    0, dtype=np.int32),
+                deltas=np.concatenate(all_deltas).astype(np.float32) if all_deltas else np.zeros(
+                    (0, 3), dtype=np.float32),
+                fingerprint=np.array(deformer.topology_fingerprint(shape)))
+        os.replace(temp_file_path, export_path)
+        files.register_versioned_file(export_path, previous_mtime=previous_mtime)
+
+        mapping = self.mapping()
+        geometry_name = OpenMaya.MDagPath(shape).pop().partialPathName()
+        if mapping.get(bs_name) != geometry_name:
+            mapping[bs_name] = geometry_name
+            jsonio.write_to_file(mapping, self.asset.mapping.blendshapes)
+        logger.info(f'{self}: Exported blendshape: {export_path}')
+
+        return export_path
 
     def import_single(self, bs_name: str) -> bool:
         """
@@ -71,7 +243,8 @@ class BlendShapesManager(abstract.AbstractIOManager):
 
         bs_name = str(bs_name)
         latest_path = self.latest_file(bs_name, full_path=True)
-        if not latest_path:
+        deltas_path = self.latest_deltas_file(bs_name) if np is not None else None
+        if not latest_path and not deltas_path:
             logger.warning(f'{self}: no saved blendshape found: {bs_name}')
             return False
 
@@ -84,10 +257,26 @@ class BlendShapesManager(abstract.AbstractIOManager):
             return False
 
         if bs_name not in [node for node in cmds.listRelatives(cmds.listHistory(geometry), type=self.DATA_TYPE) or list()]:
-            shape_node = cmds.blendShape(geometry, n=bs_name, frontOfChain=True)
+            shape_node = cmds.blendShape(geometry, n=bs_name, frontOfChain=True)[0]
         else:
             shape_node = bs_name
 
+        if deltas_path and (not latest_path or os.path.getmtime(deltas_path) >= os.path.getmtime(
+                latest_path)):
+            try:
+                self.import_deltas(shape_node, deltas_path)
+                logger.info(f'{self}: Imported blendshape: {deltas_path}')
+                return True
+            except ValueError as exc:
+                # deltas cannot be applied into this geometry, so we fall back to the .shape file, if any
+                if not latest_path:
+                    logger.error(f'{self}: Failed to import blendshape: {deltas_path}. {exc}')
+                    return False
+                logger.warning(f'{self}: {exc}. Importing blendshape from: {latest_path}')
+            except Exception:
+                logger.exception(f'{self}: Failed to import blendshape: {deltas_path}', exc_info=True)
+                return False
+
         try:
             cmds.blendShape(shape_node, edit=True, ip=latest_path)
             logger.info(f'{self}: Imported blendshape: {latest_path}')
@@ -96,3 +285,149 @@ class BlendShapesManager(abstract.AbstractIOManager):
             logger.exception(f'{self}: Failed to import blendshape: {latest_path}', exc_info=True)
 
         return False
+
+    def import_deltas(self, bs_name: str, file_path: str):
+        """
+        Imports the targets stored within the given sparse deltas file into the given blendshape.
+        Points and components of all targets are set with a single modifier, so each target item data is set with a
+        single packed value per attribute.
+
+        :param str bs_name: name of the blendshape to import targets into.
+        :param str file_path: sparse deltas file path.
+        :raises ValueError: if the blendshape does not deform a mesh or if the mesh topology does not match the
+            topology the deltas were exported from.
+        """
+
+        with np.load(file_path) as data:
+            targets = data['targets']
+            components = data['components']
+            deltas = data['deltas']
+            fingerprint = str(data['fingerprint']) if 'fingerprint' in data.files else None
+
+        bs_object = api.node_by_name(bs_name).object()
+        geometry_filter_fn = OpenMayaAnim.MFnGeometryFilter(bs_object)
+        output_shapes = geometry_filter_fn.getOutputGeometry()
+        if not len(output_shapes) or not output_shapes[0].hasFn(OpenMaya.MFn.kMesh):
+            raise ValueError(f'Blendshape {bs_name} does not deform a mesh')
+        if fingerprint is not None and deformer.topology_fingerprint(
+                OpenMaya.MDagPath.getAPathTo(output_shapes[0])) != fingerprint:
+            raise ValueError(f'Topology of the mesh deformed by {bs_name} does not match the exported deltas topology')
+        geometry_index = geometry_filter_fn.indexForOutputShape(output_shapes[0])
+
+        bs_fn = OpenMaya.MFnDependencyNode(bs_object)
+        weight_plug = bs_fn.findPlug('weight', False)
+        groups_plug = bs_fn.findPlug('inputTarget', False).elementByLogicalIndex(geometry_index).child(
+            bs_fn.attribute('inputTargetGroup'))
+        item_attr = bs_fn.attribute('inputTargetItem')
+        points_attr = bs_fn.attribute('inputPointsTarget')
+        components_attr = bs_fn.attribute('inputComponentsTarget')
+
+        # resolve target indices, reusing the index of the existing targets with the same name
+        aliases = self._target_aliases(bs_name)
+        used_indices = set(aliases.values())
+        next_index = max(used_indices) + 1 if used_indices else 0
+        target_indices: dict[str, int] = {}
+        new_targets: dict[str, int] = {}
+        for target in targets:
+            name = str(target['name'])
+            if name in target_indices:
+                continue
+            index = aliases.get(name)
+            if index is None:
+                index = int(target['index'])
+                if index in used_indices:
+                    index = next_index
+                used_indices.add(index)
+                next_index = max(next_index, index + 1)
+                new_targets[name] = index
+            target_indices[name] = index
+
+        modifier = OpenMaya.MDGModifier()
+        for target in targets:
+            name = str(target['name'])
+            index = target_indices[name]
+            offset, count = int(target['offset']), int(target['count'])
+            item_plug = groups_plug.elementByLogicalIndex(index).child(item_attr).elementByLogicalIndex(
+                int(target['item']))
+            self._queue_target_item(
+                modifier, item_plug.child(points_attr), item_plug.child(components_attr),
+                components[offset:offset + count], deltas[offset:offset + count])
+            if name in new_targets:
+                modifier.newPlugValueDouble(weight_plug.elementByLogicalIndex(index), float(target['weight']))
+        modifier.doIt()
+
+        for name, index in new_targets.items():
+            cmds.aliasAttr(name, f'{bs_name}.weight[{index}]')
+
+    @staticmethod
+    def _target_aliases(bs_name: str) -> dict[str, int]:
+        """
+        Internal function that returns the target names of the given blendshape.
+
+        :param str bs_name: name of the blendshape.
+        :return: dictionary mapping target names with their weight index.
+        :rtype: dict[str, int]
+        """
+
+        aliases: dict[str, int] = {}
+        alias_data = cmds.aliasAttr(bs_name, query=True) or []
+        for alias, attr_name in zip(alias_data[::2], alias_data[1::2]):
+            if attr_name.startswith('weight['):
+                aliases[alias] = int(attr_name[7:-1])
+
+        return aliases
+
+    @staticmethod
+    def _read_target_item(
+            points_plug: OpenMaya.MPlug, components_plug: OpenMaya.MPlug) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Internal function that returns the components and deltas stored within the given target item plugs.
+
+        :param OpenMaya.MPlug points_plug: target item inputPointsTarget plug.
+        :param OpenMaya.MPlug components_plug: target item inputComponentsTarget plug.
+        :return: tuple containing the components indices array and the deltas array.
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+
+        try:
+            points_data = points_plug.asMObject()
+            components_data = components_plug.asMObject()
+        except RuntimeError:
+            return np.zeros(0, dtype=np.int32), np.zeros((0, 3), dtype=np.float32)
+
+        points = OpenMaya.MFnPointArrayData(points_data).array()
+        deltas = np.array([(point.x, point.y, point.z) for point in points], dtype=np.float32).reshape(-1, 3)
+        components_fn = OpenMaya.MFnComponentListData(components_data)
+        indices: list[int] = []
+        for i in range(components_fn.length()):
+            indices.extend(OpenMaya.MFnSingleIndexedComponent(components_fn.get(i)).getElements())
+        components = np.array(indices, dtype=np.int32)
+
+        count = min(len(components), len(deltas))
+
+        return components[:count], deltas[:count]
+
+    @staticmethod
+    def _queue_target_item(
+            modifier: OpenMaya.MDGModifier, points_plug: OpenMaya.MPlug, components_plug: OpenMaya.MPlug,
+            components: np.ndarray, deltas: np.ndarray):
+        """
+        Internal function that queues the set of the given components and deltas into the given target item plugs.
+
+        :param OpenMaya.MDGModifier modifier: modifier used to set the plugs values.
+        :param OpenMaya.MPlug points_plug: target item inputPointsTarget plug.
+        :param OpenMaya.MPlug components_plug: target item inputComponentsTarget plug.
+        :param np.ndarray components: components indices array.
+        :param np.ndarray deltas: deltas array.
+        """
+
+        points_data = OpenMaya.MFnPointArrayData().create(OpenMaya.MPointArray(deltas.tolist()))
+        component_fn = OpenMaya.MFnSingleIndexedComponent()
+        component = component_fn.create(OpenMaya.MFn.kMeshVertComponent)
+        component_fn.addElements(components.tolist())
+        components_fn = OpenMaya.MFnComponentListData()
+        components_data = components_fn.create()
+        components_fn.add(component)
+
+        modifier.newPlugValue(points_plug, points_data)
+        modifier.newPlugValue(components_plug, components_data)
@@ -1,13 +1,26 @@
 from __future__ import annotations
 
 import os
+import typing
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import maya.api.OpenMaya as OpenMaya
 
 from tp.core import log
 from tp.common.python import jsonio
+from tp.maya import api
+from tp.maya.api import curves
 
 from tp.libs.rig.noddle.io import abstract
 from tp.libs.rig.noddle.functions import files, rigs
 
+if typing.TYPE_CHECKING:
+    from tp.libs.rig.noddle.core.nodes import ControlNode
+
 logger = log.rigLogger
 
 
@@ -15,6 +28,12 @@ class ControlsShapeManager(abstract.AbstractIOManager):
 
     DATA_TYPE = 'controls'
     EXTENSION = 'curves'
+    CVS_EXTENSION = 'npz'
+
+    # Table with an entry for each exported curve shape. CV positions of all shapes are stored in a single positions
+    # array, and offset/count fields define the slice of that array that belongs to each shape.
+    SHAPES_DTYPE = [
+        ('control', 'U256'), ('shape', 'i4'), ('offset', 'i8'), ('count', 'i4'), ('degree', 'i4'), ('form', 'i4')]
 
     def __init__(self):
         super().__init__()
@@ -32,6 +51,17 @@ class ControlsShapeManager(abstract.AbstractIOManager):
     def latest_file(self) -> str:
         return files.latest_file(self.base_name(), self.path, extension=self.EXTENSION, full_path=True)
 
+    def cvs_file(self, shapes_file: str) -> str:
+        """
+        Returns path to the binary CVs file that is stored alongside given shapes file.
+
+        :param str shapes_file: shapes JSON file path.
+        :return: CVs file path.
+        :rtype: str
+        """
+
+        return f'{os.path.splitext(shapes_file)[0]}.{self.CVS_EXTENSION}'
+
     @classmethod
     def export_asset_shapes(cls):
         """
@@ -39,17 +69,24 @@ class ControlsShapeManager(abstract.AbstractIOManager):
         """
 
         manager = cls()
-        data_dict = {}
         all_controls = rigs.list_controls()
         if not all_controls:
             logger.warning('No controls to save')
             return
 
+        data_dict = {}
         for control_id, control in all_controls.items():
-            data_dict[control_id] = control.serializeFromScene()['shape']
+            data_dict[control_id] = curves.serialize_transform_curve(
+                control.object(), space=api.kObjectSpace, normalize=False)
 
         export_path = manager.new_file()
+        previous_mtime = files.directory_modification_time(manager.path)
         jsonio.write_to_file(data_dict, export_path)
+        exported_paths = [export_path]
+        if np is not None:
+            manager.export_cvs(all_controls, manager.cvs_file(export_path))
+            exported_paths.append(manager.cvs_file(export_path))
+        files.register_versioned_files(exported_paths, previous_mtime=previous_mtime)
         logger.info(f'Exported control shapes: "{export_path}"')
 
     @classmethod
@@ -65,11 +102,104 @@ class ControlsShapeManager(abstract.AbstractIOManager):
 
         all_controls = rigs.list_controls()
 
-        data = jsonio.read_file(latest_file)
-        for control_id, shape_data in data.items():
-            found_control = all_controls.get(control_id)
+        # fast path: update CVs in place for all controls whose curves topology did not change
+        updated_controls: set[str] = set()
+        pending_controls: set[str] | None = None
+        cvs_file = manager.cvs_file(latest_file)
+        if np is not None and os.path.isfile(cvs_file):
+            updated_controls, exported_controls = manager.import_cvs(all_controls, cvs_file)
+            pending_controls = exported_controls - updated_controls
+
+        if pending_controls is None or pending_controls:
+            data = jsonio.read_file(latest_file)
+            for control_id, shape_data in data.items():
+                if control_id in updated_controls:
+                    continue
+                found_control = all_controls.get(control_id)
+                if not found_control:
+                    continue
+                found_control.add_shape_from_data(shape_data, replace=True, maintain_colors=True)
+
+        logger.info(f'Imported control shapes: "{latest_file}"')
+
+    def export_cvs(self, controls: dict[str, ControlNode], file_path: str):
+        """
+        Exports the CV positions of all the curve shapes of the given controls into a single binary file.
+
+        :param dict[str, ControlNode] controls: controls to export CVs of.
+        :param str file_path: binary file path to export CVs into.
+        """
+
+        shapes_table = []
+        positions = []
+        offset = 0
+        for control_id, control in controls.items():
+            for i, shape in enumerate(self._curve_shapes(control)):
+                curve_fn = OpenMaya.MFnNurbsCurve(shape)
+                cvs = curve_fn.cvPositions(OpenMaya.MSpace.kObject)
+                shapes_table.append((control_id, i, offset, len(cvs), curve_fn.degree, curve_fn.form))
+                positions.extend((cv.x, cv.y, cv.z) for cv in cvs)
+                offset += len(cvs)
+
+        np.savez_compressed(
+            file_path, shapes=np.array(shapes_table, dtype=self.SHAPES_DTYPE),
+            positions=np.array(positions, dtype=np.float64).reshape(-1, 3))
+
+    def import_cvs(self, controls: dict[str, ControlNode], file_path: str) -> tuple[set[str], set[str]]:
+        """
+        Updates, in place, the CV positions of the curve shapes of the given controls from given binary file.
+        Only controls whose curve shapes count, CVs count, degree and form match the exported ones are updated.
+
+        :param dict[str, ControlNode] controls: controls to import CVs of.
+        :param str file_path: binary file path to import CVs from.
+        :return: tuple containing the IDs of the updated controls and the IDs of all the exported controls.
+        :rtype: tuple[set[str], set[str]]
+        """
+
+        with np.load(file_path) as data:
+            shapes_table = data['shapes']
+            positions = data['positions']
+
+        shapes_by_control: dict[str, list] = {}
+        for shape_entry in shapes_table:
+            shapes_by_control.setdefault(str(shape_entry['control']), []).append(shape_entry)
+
+        updates: list[tuple[OpenMaya.MFnNurbsCurve, OpenMaya.MPointArray]] = []
+        updated_controls: set[str] = set()
+        for control_id, shape_entries in shapes_by_control.items():
+            found_control = controls.get(control_id)
             if not found_control:
                 continue
-            found_control.add_shape_from_data(shape_data, replace=True, maintain_colors=True)
+            curve_shapes = self._curve_shapes(found_control)
+            if len(curve_shapes) != len(shape_entries):
+                continue
+            control_updates = []
+            for curve_shape, shape_entry in zip(curve_shapes, sorted(shape_entries, key=lambda x: x['shape'])):
+                curve_fn = OpenMaya.MFnNurbsCurve(curve_shape)
+                if curve_fn.numCVs != shape_entry['count'] or curve_fn.degree != shape_entry['degree'] or \
+                        curve_fn.form != shape_entry['form']:
+                    break
+                offset = int(shape_entry['offset'])
+                control_updates.append(
+                    (curve_fn, OpenMaya.MPointArray(positions[offset:offset + shape_entry['count']].tolist())))
+            else:
+                updates.extend(control_updates)
+                updated_controls.add(control_id)
+
+        for curve_fn, points in updates:
+            curve_fn.setCVPositions(points, OpenMaya.MSpace.kObject)
+            curve_fn.updateCurve()
+
+        return updated_controls, set(shapes_by_control.keys())
+
+    @staticmethod
+    def _curve_shapes(control: ControlNode) -> list[OpenMaya.MObject]:
+        """
+        Internal function that returns the NURBS curve shapes of the given control.
 
-        logger.info(f'Imported control shapes: "{latest_file}"')
+        :param ControlNode control: control to get curve shapes of.
+        :return: list of curve shapes objects.
+        :rtype: list[OpenMaya.MObject]
+        """
+
+        return [shape.object() for shape in control.iterateShapes() if shape.object().hasFn(OpenMaya.MFn.kNurbsCurve)]
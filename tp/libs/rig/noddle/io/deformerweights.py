@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import os
+import time
+import typing
+from typing import Iterator
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as OpenMaya
+import maya.api.OpenMayaAnim as OpenMayaAnim
+
+from tp.core import log
+from tp.maya import api
+
+from tp.libs.rig.noddle.io import abstract
+from tp.libs.rig.noddle.functions import files, deformer
+
+if typing.TYPE_CHECKING:
+    from tp.libs.rig.noddle.core.rig import Rig
+
+logger = log.rigLogger
+
+
+class DeformerWeightsManager(abstract.AbstractIOManager):
+    """
+    Base class for managers that import/export the weights of a deformer type.
+    Weights of all the deformers of the manager type found under the asset geometry are stored as NumPy arrays within
+    a single binary versioned file per asset. On import, geometries are mapped by name and validated with their
+    topology fingerprint; geometries that no longer exist are mapped to the geometry with the same fingerprint.
+
+    ..warning:: this class should never be instantiated directly, but its subclasses.
+    """
+
+    # MFn type of the deformers handled by the manager.
+    API_TYPE: int | None = None
+
+    # Deformer attributes that are stored alongside the weights.
+    SETTINGS_ATTRIBUTES: tuple[str, ...] = ('envelope',)
+
+    EXTENSION = 'npz'
+
+    # Table with an entry for each exported deformer geometry. Weights of all entries are stored in a single weights
+    # array, and offset/count fields define the slice of that array that belongs to each entry.
+    ENTRIES_DTYPE = [
+        ('deformer', 'U256'), ('geometry', 'U512'), ('index', 'i4'), ('offset', 'i8'), ('count', 'i4'),
+        ('fingerprint', 'U64')]
+
+    def base_name(self) -> str:
+        return f'{self.asset.name}_{self.DATA_TYPE}'
+
+    def new_file(self) -> str:
+        return files.new_versioned_file(self.base_name(), directory=self.path, extension=self.EXTENSION)
+
+    def latest_file(self) -> str:
+        return files.latest_file(self.base_name(), self.path, extension=self.EXTENSION, full_path=True)
+
+    def create_deformer(self, shape_path: str, deformer_name: str) -> str | None:
+        """
+        Creates a new deformer with given name for the given geometry shape.
+        Used when importing weights of deformers that do not exist within current scene.
+
+        :param str shape_path: full path of the geometry shape to deform.
+        :param str deformer_name: name of the deformer to create.
+        :return: created deformer name. None if the deformer cannot be created by this manager.
+        :rtype: str or None
+        """
+
+        return None
+
+    @classmethod
+    def export_all(cls, character: Rig | None = None) -> dict[str, dict]:
+        """
+        Exports the weights and settings of all the deformers found under the asset geometry into a new versioned file.
+
+        :param Rig or None character: optional rig to export deformers of. If not given, current build rig is used.
+        :return: dictionary containing the export result of each one of the deformers.
+        :rtype: dict[str, dict]
+        """
+
+        manager = cls()
+        if np is None:
+            logger.error(f'{manager}: NumPy is required to export {cls.DATA_TYPE} weights')
+            return {}
+        geometry_root = manager.geometry_root(character)
+        if geometry_root is None:
+            logger.warning(f'{manager}: No geometry layer found for asset rig, skipping {cls.DATA_TYPE} export...')
+            return {}
+
+        entries: list[tuple] = []
+        weights: list[np.ndarray] = []
+        settings: list[list[float]] = []
+        results: dict[str, dict] = {}
+        offset = 0
+        for deformer_name in deformer.list_deformer_paths(cls.API_TYPE, geometry_root):
+            start_time = time.time()
+            results[deformer_name] = {'file': '', 'success': False, 'time': 0.0}
+            try:
+                deformer_settings = [float(cmds.getAttr(f'{deformer_name}.{attr}')) for attr in cls.SETTINGS_ATTRIBUTES]
+                for geometry_index, shape in manager.deformer_geometries(deformer_name):
+                    count = deformer.geometry_component_count(shape)
+                    entries.append((
+                        deformer_name, OpenMaya.MDagPath(shape).pop().partialPathName(), geometry_index, offset, count,
+                        deformer.topology_fingerprint(shape)))
+                    weights.append(deformer.read_deformer_weights(deformer_name, geometry_index, count))
+                    settings.append(deformer_settings)
+                    offset += count
+            except Exception:
+                logger.exception(f'{manager}: Failed to capture {cls.DATA_TYPE} weights for: {deformer_name}')
+            results[deformer_name]['time'] = time.time() - start_time
+        if not entries:
+            logger.warning(f'{manager}: No {cls.DATA_TYPE} deformers found to export')
+            return results
+
+        export_path = manager.new_file()
+        previous_mtime = files.directory_modification_time(manager.path)
+        start_time = time.time()
+        temp_file_path = f'{export_path}.tmp'
+        with open(temp_file_path, 'wb') as f:
+            np.savez_compressed(
+                f, entries=np.array(entries, dtype=cls.ENTRIES_DTYPE),
+                weights=np.concatenate(weights).astype(np.float32),
+                settings=np.array(settings, dtype=np.float64).reshape(len(entries), len(cls.SETTINGS_ATTRIBUTES)),
+                settingNames=np.array(cls.SETTINGS_ATTRIBUTES, dtype=str))
+        os.replace(temp_file_path, export_path)
+        files.register_versioned_file(export_path, previous_mtime=previous_mtime)
+        write_time = time.time() - start_time
+
+        exported_deformers = {str(entry[0]) for entry in entries}
+        for deformer_name in exported_deformers:
+            results[deformer_name].update(file=export_path, success=True)
+            results[deformer_name]['time'] += write_time / len(exported_deformers)
+        logger.info(f'{manager}: Exported {cls.DATA_TYPE} weights: "{export_path}"')
+
+        return results
+
+    @classmethod
+    def import_all(cls, character: Rig | None = None) -> dict[str, dict]:
+        """
+        Imports the weights and settings of all the deformers stored within the latest versioned file.
+        Deformers that do not exist within current scene are created if the manager supports it.
+
+        :param Rig or None character: optional rig to import deformers for. If not given, current build rig is used.
+        :return: dictionary containing the import result of each one of the deformers.
+        :rtype: dict[str, dict]
+        """
+
+        manager = cls()
+        if np is None:
+            logger.error(f'{manager}: NumPy is required to import {cls.DATA_TYPE} weights')
+            return {}
+        latest_file = manager.latest_file()
+        if not latest_file or not os.path.isfile(latest_file):
+            logger.warning(f'{manager}: No saved {cls.DATA_TYPE} weights found')
+            return {}
+
+        with np.load(latest_file) as data:
+            entries = data['entries']
+            weights = data['weights']
+            settings = data['settings']
+            setting_names = [str(name) for name in data['settingNames']]
+
+        results: dict[str, dict] = {}
+        fingerprints: dict[str, list[OpenMaya.MDagPath]] | None = None
+        for i, entry in enumerate(entries):
+            start_time = time.time()
+            deformer_name, geometry_name = str(entry['deformer']), str(entry['geometry'])
+            fingerprint, count = str(entry['fingerprint']), int(entry['count'])
+            result = results.setdefault(deformer_name, {'file': latest_file, 'success': True, 'time': 0.0})
+            try:
+                shape = manager.find_geometry(geometry_name)
+                if shape is not None and deformer.topology_fingerprint(shape) != fingerprint:
+                    if deformer.geometry_component_count(shape) != count:
+                        shape = None
+                    else:
+                        logger.warning(
+                            f'{manager}: Topology of {geometry_name} changed, applying {deformer_name} weights by '
+                            f'component index')
+                if shape is None:
+                    if fingerprints is None:
+                        fingerprints = manager.fingerprint_geometries(manager.geometry_root(character))
+                    candidates = fingerprints.get(fingerprint, [])
+                    if len(candidates) != 1:
+                        raise RuntimeError(f'No geometry matches {geometry_name} for deformer {deformer_name}')
+                    shape = candidates[0]
+                    logger.info(f'{manager}: Mapped {geometry_name} to {shape.partialPathName()} by topology')
+                deformer_name = manager.ensure_deformer(deformer_name, shape)
+                geometry_index = OpenMayaAnim.MFnGeometryFilter(
+                    api.node_by_name(deformer_name).object()).indexForOutputShape(shape.node())
+                for setting_name, value in zip(setting_names, settings[i]):
+                    if cmds.getAttr(f'{deformer_name}.{setting_name}', settable=True):
+                        cmds.setAttr(f'{deformer_name}.{setting_name}', value)
+                offset = int(entry['offset'])
+                deformer.write_deformer_weights(deformer_name, geometry_index, weights[offset:offset + count])
+            except Exception:
+                logger.exception(f'{manager}: Failed to import {deformer_name} weights for: {geometry_name}')
+                result['success'] = False
+            result['time'] += time.time() - start_time
+
+        logger.info(f'{manager}: Imported {cls.DATA_TYPE} weights: "{latest_file}"')
+
+        return results
+
+    def geometry_root(self, character: Rig | None = None) -> api.DagNode | None:
+        """
+        Returns the root transform of the geometry layer of the given rig.
+
+        :param Rig or None character: rig to get geometry root of. If not given, current build rig is used.
+        :return: geometry root transform.
+        :rtype: api.DagNode or None
+        """
+
+        character = character or self.rig
+        geometry_layer = character.geometry_layer() if character else None
+
+        return geometry_layer.root_transform() if geometry_layer else None
+
+    @staticmethod
+    def deformer_geometries(deformer_name: str) -> Iterator[tuple[int, OpenMaya.MDagPath]]:
+        """
+        Generator function that iterates over the geometry shapes deformed by the given deformer.
+
+        :param str deformer_name: name of the deformer.
+        :return: iterated tuples containing the geometry index within the deformer and the geometry shape path.
+        :rtype: Iterator[tuple[int, OpenMaya.MDagPath]]
+        """
+
+        geometry_filter_fn = OpenMayaAnim.MFnGeometryFilter(api.node_by_name(deformer_name).object())
+        for shape in geometry_filter_fn.getOutputGeometry():
+            yield geometry_filter_fn.indexForOutputShape(shape), OpenMaya.MDagPath.getAPathTo(shape)
+
+    @staticmethod
+    def find_geometry(geometry_name: str) -> OpenMaya.MDagPath | None:
+        """
+        Returns the deformable shape, that is not an intermediate object, of the geometry with given name.
+
+        :param str geometry_name: name of the geometry transform.
+        :return: geometry shape path.
+        :rtype: OpenMaya.MDagPath or None
+        """
+
+        if not cmds.objExists(geometry_name):
+            return None
+
+        selection = OpenMaya.MSelectionList()
+        selection.add(geometry_name)
+        geometry_path = selection.getDagPath(0)
+        if geometry_path.hasFn(OpenMaya.MFn.kShape):
+            return geometry_path
+        for i in range(geometry_path.childCount()):
+            child = geometry_path.child(i)
+            if child.hasFn(OpenMaya.MFn.kShape) and not OpenMaya.MFnDagNode(child).isIntermediateObject:
+                return OpenMaya.MDagPath(geometry_path).push(child)
+
+        return None
+
+    @staticmethod
+    def fingerprint_geometries(root: api.DagNode | None = None) -> dict[str, list[OpenMaya.MDagPath]]:
+        """
+        Returns the topology fingerprints of all the geometry shapes under given root.
+
+        :param api.DagNode or None root: optional root to find geometries under. If not given, whole scene is used.
+        :return: dictionary mapping each fingerprint with the shapes that have it.
+        :rtype: dict[str, list[OpenMaya.MDagPath]]
+        """
+
+        fingerprints: dict[str, list[OpenMaya.MDagPath]] = {}
+        dag_iterator = OpenMaya.MItDag(OpenMaya.MItDag.kDepthFirst, OpenMaya.MFn.kShape)
+        if root is not None:
+            dag_iterator.reset(root.object(), OpenMaya.MItDag.kDepthFirst, OpenMaya.MFn.kShape)
+        while not dag_iterator.isDone():
+            shape = dag_iterator.getPath()
+            if not OpenMaya.MFnDagNode(shape).isIntermediateObject:
+                fingerprints.setdefault(deformer.topology_fingerprint(shape), []).append(shape)
+            dag_iterator.next()
+
+        return fingerprints
+
+    def ensure_deformer(self, deformer_name: str, shape: OpenMaya.MDagPath) -> str:
+        """
+        Makes sure a deformer with given name exists and deforms the given geometry shape.
+
+        :param str deformer_name: name of the deformer.
+        :param OpenMaya.MDagPath shape: geometry shape path.
+        :return: deformer name.
+        :rtype: str
+        :raises RuntimeError: if the deformer does not exist and the manager cannot create it.
+        """
+
+        shape_path = shape.fullPathName()
+        if not cmds.objExists(deformer_name):
+            created_deformer = self.create_deformer(shape_path, deformer_name)
+            if not created_deformer:
+                raise RuntimeError(f'Deformer {deformer_name} does not exist')
+            return created_deformer
+
+        geometry_filter_fn = OpenMayaAnim.MFnGeometryFilter(api.node_by_name(deformer_name).object())
+        if not any(OpenMaya.MDagPath.getAPathTo(i) == shape for i in geometry_filter_fn.getOutputGeometry()):
+            cmds.deformer(deformer_name, edit=True, geometry=shape_path)
+
+        return deformer_name
@@ -1,14 +1,25 @@
 from __future__ import annotations
 
+from overrides import override
 
-from tp.libs.rig.noddle.io import abstract
+import maya.cmds as cmds
+import maya.api.OpenMaya as OpenMaya
 
+from tp.libs.rig.noddle.io import deformerweights
 
-class DeltaMushManager(abstract.AbstractIOManager):
+
+class DeltaMushManager(deformerweights.DeformerWeightsManager):
 
     DATA_TYPE = 'deltaMush'
-    EXTENSION = 'json'
+    API_TYPE = OpenMaya.MFn.kDeltaMush
+    SETTINGS_ATTRIBUTES = (
+        'envelope', 'smoothingIterations', 'smoothingStep', 'inwardConstraint', 'outwardConstraint', 'displacement',
+        'distanceWeight', 'pinBorderVertices')
+
+    @property
+    def path(self) -> str:
+        return self.asset.weights.delta_mush
 
-    @classmethod
-    def import_all(cls):
-        pass
+    @override
+    def create_deformer(self, shape_path: str, deformer_name: str) -> str | None:
+        return cmds.deltaMush(shape_path, name=deformer_name)[0]
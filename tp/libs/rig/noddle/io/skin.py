@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import os
+import time
+import pickle
+from concurrent import futures
+
 from overrides import override
 
 import maya.cmds as cmds
@@ -7,13 +12,53 @@ import maya.api.OpenMaya as OpenMaya
 
 from tp.core import log
 from tp.maya import api
-from tp.libs.rig.skinner import core as skinner
+from tp.libs.rig.skinner import core as skinner, utils as skinner_utils
 from tp.preferences.interfaces import noddle
 from tp.libs.rig.noddle.io import abstract
 from tp.libs.rig.noddle.functions import files, deformer
 
 logger = log.rigLogger
 
+# Maximum number of background threads used to write/read skin files.
+IO_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+
+def write_skin_chunks(file_path: str, skin_chunks: list[skinner.SkinChunk]) -> str:
+    """
+    Writes given skin chunks into disk using the same file layout as Skinner, so written files can also be loaded
+    through Skinner importer. File is written into a temporary file first, so partially written files never replace
+    valid ones.
+
+    ..note:: this function does not access Maya scene, so it is safe to call it from a background thread.
+
+    :param str file_path: absolute file path where skin chunks will be written into.
+    :param list[skinner.SkinChunk] skin_chunks: skin chunks to write.
+    :return: written file path.
+    :rtype: str
+    """
+
+    temp_file_path = f'{file_path}.tmp'
+    with open(temp_file_path, 'wb') as f:
+        pickle.dump(skin_chunks, f, 2)
+    os.replace(temp_file_path, file_path)
+
+    return file_path
+
+
+def read_skin_chunks(file_path: str) -> list[skinner.SkinChunk]:
+    """
+    Reads skin chunks from given Skinner file.
+
+    ..note:: this function does not access Maya scene, so it is safe to call it from a background thread.
+
+    :param str file_path: absolute Skinner file path.
+    :return: list of read skin chunks.
+    :rtype: list[skinner.SkinChunk]
+    """
+
+    with open(file_path, 'rb') as f:
+        return pickle.load(f)
+
 
 class SkinManager(abstract.AbstractIOManager):
 
@@ -41,28 +86,137 @@ class SkinManager(abstract.AbstractIOManager):
         return self.asset.weights.skin
 
     @classmethod
-    def export_all(cls):
+    def export_all(cls, max_workers: int | None = None) -> dict[str, dict]:
         """
         Exports all skin cluster weights located under asset geometry group to asset skin folder.
+        Weights are captured from the scene in the main thread, while files are written in background threads.
+
+        :param int or None max_workers: maximum number of threads used to write skin files.
+        :return: dictionary containing the export result of each one of the geometries.
+        :rtype: dict[str, dict]
         """
 
         skin_manager = cls()
-        for deformer_node in deformer.list_deformer_paths(cls.DATA_TYPE, skin_manager.character.geometry_group()):
-            print('gogogogo', deformer_node)
+        geometry_layer = skin_manager.rig.geometry_layer() if skin_manager.rig else None
+        if not geometry_layer:
+            logger.warning(f'{skin_manager}: No geometry layer found for asset rig, skipping skin export...')
+            return {}
+
+        results: dict[str, dict] = {}
+        pending: dict[futures.Future, str] = {}
+        exported_paths: list[str] = []
+        previous_mtime = files.directory_modification_time(skin_manager.path)
+        logger.info(f'{skin_manager}: Exporting weights...')
+        with futures.ThreadPoolExecutor(max_workers=max_workers or IO_MAX_WORKERS) as executor:
+            geometry_root = geometry_layer.root_transform()
+            for deformer_path in deformer.list_deformer_paths(cls.DATA_TYPE, geometry_root):
+                for geometry_node in skin_manager.skin_cluster_geometries(deformer_path):
+                    geometry_name = skin_manager.base_name(geometry_node)
+                    start_time = time.time()
+                    try:
+                        export_path, skin_chunks = skin_manager.capture_single(geometry_node)
+                    except Exception:
+                        logger.exception(f'{skin_manager}: Failed to capture skin weights for: {geometry_node}')
+                        results[geometry_name] = {
+                            'file': '', 'success': False, 'time': time.time() - start_time}
+                        continue
+                    results[geometry_name] = {'file': export_path, 'success': False, 'time': time.time() - start_time}
+                    pending[executor.submit(write_skin_chunks, export_path, skin_chunks)] = geometry_name
+
+            for future in futures.as_completed(pending):
+                geometry_name = pending[future]
+                start_time = time.time()
+                try:
+                    export_path = future.result()
+                    exported_paths.append(export_path)
+                    results[geometry_name]['success'] = True
+                    logger.info(f'{skin_manager}: Exported {geometry_name} weights: {export_path}')
+                except Exception:
+                    logger.exception(f'{skin_manager}: Failed to write skin weights for: {geometry_name}')
+                results[geometry_name]['time'] += time.time() - start_time
+        files.register_versioned_files(exported_paths, previous_mtime=previous_mtime)
+
+        return results
 
     @classmethod
-    def import_all(cls):
+    def import_all(cls) -> dict[str, dict]:
         """
         Imports all skin weights for asset.
+        While the weights of a geometry are applied, the file of the next geometry is read in a background thread.
+
+        :return: dictionary containing the import result of each one of the geometries.
+        :rtype: dict[str, dict]
         """
 
         skin_manager = cls()
         logger.info(f'{skin_manager}: Importing weights...')
+
+        import_items: list[tuple[api.DagNode, str]] = []
         for geo_name in skin_manager.versioned_files:
             if not cmds.objExists(geo_name):
                 logger.warning(f'{skin_manager}: Object {geo_name} no longer exists, skipping...')
                 continue
-            skin_manager.import_single(api.node_by_name(geo_name))
+            geometry_node = api.node_by_name(geo_name)
+            latest_file = skin_manager.latest_file(geometry_node)
+            if not latest_file:
+                logger.warning(f'{skin_manager}: No saved skin weights found for {geometry_node}')
+                continue
+            import_items.append((geometry_node, latest_file))
+        if not import_items:
+            return {}
+
+        results: dict[str, dict] = {}
+        selection = cmds.ls(selection=True, long=True)
+        try:
+            with futures.ThreadPoolExecutor(max_workers=1) as executor:
+                next_chunks = executor.submit(read_skin_chunks, import_items[0][1])
+                for i, (geometry_node, latest_file) in enumerate(import_items):
+                    start_time = time.time()
+                    current_chunks = next_chunks
+                    if i + 1 < len(import_items):
+                        next_chunks = executor.submit(read_skin_chunks, import_items[i + 1][1])
+                    success = False
+                    try:
+                        weight_results = skinner.setWeights(
+                            [geometry_node.fullPathName()], skinChunks=current_chunks.result(), verbose=False,
+                            promptOnNonInteractiveNormalization=False)
+                        success = bool(weight_results) and all(
+                            mesh_result['success'] for mesh_result in weight_results.values())
+                        if success:
+                            logger.info(f'{skin_manager}: Imported {geometry_node} weights: {latest_file}')
+                        else:
+                            logger.error(f'{skin_manager}: Failed to set skin weights for: {geometry_node}')
+                    except Exception:
+                        logger.exception(
+                            f'{skin_manager}: Failed to import skin weights for: {geometry_node}', exc_info=True)
+                    results[skin_manager.base_name(geometry_node)] = {
+                        'file': latest_file, 'success': success, 'time': time.time() - start_time}
+        finally:
+            if selection:
+                cmds.select(selection)
+            else:
+                cmds.select(clear=True)
+
+        return results
+
+    @staticmethod
+    def skin_cluster_geometries(skin_cluster_path: str) -> list[api.DagNode]:
+        """
+        Returns the transforms of the geometries deformed by the given skin cluster.
+
+        :param str skin_cluster_path: skin cluster full path.
+        :return: list of deformed geometry transforms.
+        :rtype: list[api.DagNode]
+        """
+
+        geometries: list[api.DagNode] = []
+        for shape_path in cmds.skinCluster(skin_cluster_path, query=True, geometry=True) or []:
+            shape_node = api.node_by_name(shape_path)
+            geometry_node = shape_node.parent() if shape_node.object().hasFn(OpenMaya.MFn.kShape) else shape_node
+            if geometry_node not in geometries:
+                geometries.append(geometry_node)
+
+        return geometries
 
     @override(check_signature=False)
     def base_name(self, geometry_node: api.DagNode) -> str:
@@ -73,6 +227,33 @@ class SkinManager(abstract.AbstractIOManager):
         return files.latest_file(
             self.base_name(geometry_node), directory=self.path, extension=self.EXTENSION, full_path=True)
 
+    @override(check_signature=False)
+    def new_file(self, geometry_node: api.DagNode) -> str:
+        return files.new_versioned_file(
+            self.base_name(geometry_node), directory=self.path, extension=self.EXTENSION, full_path=True)
+
+    def capture_single(self, geometry_node: api.DagNode) -> tuple[str, list[skinner.SkinChunk]]:
+        """
+        Captures skin weights of the given geometry from current scene.
+
+        :param api.DagNode geometry_node: geometry to capture skin weights of.
+        :return: tuple containing the new versioned file path where weights should be exported and the skin chunks.
+        :rtype: tuple[str, list[skinner.SkinChunk]]
+        :raises RuntimeError: if skin weights capture operation was cancelled.
+        """
+
+        mesh_shape_vertex_ids = skinner_utils.getMeshVertIds(items=[geometry_node.fullPathName()])
+        skin_chunks = skinner.generateSkinChunks(
+            mesh_shape_vertex_ids, verbose=False, promptOnNonInteractiveNormalization=False)
+        if not skin_chunks:
+            raise RuntimeError(f'Skin weights capture was cancelled for: {geometry_node}')
+
+        export_path = self.new_file(geometry_node)
+        for skin_chunk in skin_chunks:
+            skin_chunk.setFilePath(export_path)
+
+        return export_path, skin_chunks
+
     def import_single(self, geometry_node: api.DagNode):
         """
         Import skin cluster for given geometry.
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+from typing import Iterator
+
+from overrides import override
+
 from tp.core import log
+from tp.maya import api
 from tp.libs.rig.noddle import consts
 from tp.libs.rig.noddle.meta import component
 
@@ -11,4 +16,42 @@ class NoddleAnimComponent(component.NoddleComponent):
 
     ID = consts.ANIM_COMPONENT_TYPE
 
+    @override
+    def meta_attributes(self) -> list[dict]:
+        attrs = super().meta_attributes()
+
+        attrs.append(
+            dict(name=consts.NODDLE_SKELETON_ATTACHMENT_NODES_ATTR, isArray=True, type=api.kMFnMessageAttribute))
+
+        return attrs
+
+    def skeleton_attachment_nodes_plug(self) -> api.OpenMaya.MPlug:
+        """
+        Returns the array plug where the nodes created to attach the component into the rig skeleton are connected.
+        Attribute is added if it does not exist, so meta nodes created before it was introduced can also record them.
+
+        :return: skeleton attachment nodes array plug.
+        :rtype: api.OpenMaya.MPlug
+        """
+
+        if not self.hasAttribute(consts.NODDLE_SKELETON_ATTACHMENT_NODES_ATTR):
+            self.addAttribute(consts.NODDLE_SKELETON_ATTACHMENT_NODES_ATTR, type=api.kMFnMessageAttribute, isArray=True)
+
+        return self.attribute(consts.NODDLE_SKELETON_ATTACHMENT_NODES_ATTR).plug()
+
+    def iterate_skeleton_attachment_nodes(self) -> Iterator[api.OpenMaya.MObject]:
+        """
+        Generator function that iterates over all the nodes created to attach the component into the rig skeleton.
+
+        :return: iterated skeleton attachment nodes.
+        :rtype: Iterator[api.OpenMaya.MObject]
+        """
+
+        if not self.hasAttribute(consts.NODDLE_SKELETON_ATTACHMENT_NODES_ATTR):
+            return
 
+        nodes_plug = self.attribute(consts.NODDLE_SKELETON_ATTACHMENT_NODES_ATTR).plug()
+        for logical_index in nodes_plug.getExistingArrayAttributeIndices():
+            source_plug = nodes_plug.elementByLogicalIndex(logical_index).source()
+            if not source_plug.isNull:
+                yield source_plug.node()
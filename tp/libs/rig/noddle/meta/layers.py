@@ -948,6 +948,46 @@ class NoddleSkeletonLayer(NoddleLayer):
         joint_id = joint_id or joint.fullPathName(partial_name=True, include_namespace=False)
         element.child(1).set(joint_id)
 
+    def add_joints(self, joints: Iterable[tuple[nodes.Joint, str | None]]):
+        """
+        Attaches given joints to this layer in a single batch. ID attributes and connections for all joints are added
+        with one modifier and ID values are set with another one.
+
+        :param Iterable[tuple[nodes.Joint, str or None]] joints: joint instances to attach with their IDs.
+        """
+
+        joints_attr = self.attribute(consts.NODDLE_JOINTS_ATTR)
+        joints_attr.isLocked = False
+        joints_plug = joints_attr.plug()
+        existing_indices = joints_plug.getExistingArrayAttributeIndices()
+        next_index = existing_indices[-1] + 1 if existing_indices else 0
+
+        add_modifier = api.OpenMaya.MDGModifier()
+        pending_values: list[tuple[api.OpenMaya.MFnDependencyNode, api.OpenMaya.MPlug, str, str | None]] = []
+        for joint, joint_id in joints:
+            joint_fn = api.OpenMaya.MFnDependencyNode(joint.object())
+            attribute_id = joint_id
+            if joint_fn.hasAttribute(consts.NODDLE_ID_ATTR):
+                joint_id = joint_fn.findPlug(consts.NODDLE_ID_ATTR, False).asString()
+                attribute_id = None
+            else:
+                add_modifier.addAttribute(
+                    joint.object(), api.OpenMaya.MFnTypedAttribute().create(
+                        consts.NODDLE_ID_ATTR, consts.NODDLE_ID_ATTR, api.OpenMaya.MFnData.kString))
+            joint_id = joint_id or joint.fullPathName(partial_name=True, include_namespace=False)
+            element = joints_plug.elementByLogicalIndex(next_index)
+            next_index += 1
+            add_modifier.connect(joint_fn.findPlug('message', False), element.child(0))
+            pending_values.append((joint_fn, element.child(1), joint_id, attribute_id))
+        add_modifier.doIt()
+
+        value_modifier = api.OpenMaya.MDGModifier()
+        for joint_fn, id_plug, joint_id, attribute_id in pending_values:
+            value_modifier.newPlugValueString(id_plug, joint_id)
+            if attribute_id:
+                value_modifier.newPlugValueString(joint_fn.findPlug(consts.NODDLE_ID_ATTR, False), attribute_id)
+        value_modifier.doIt()
+
     def delete_joint(self, joint_id: str) -> bool:
         """
         Deletes joint with given ID from this layer instance.
@@ -0,0 +1,600 @@
+r"""
+Name : skinner.batch.py
+Creation Date : 2026-10-19
+Description :
+    Export / import skin weights across many scenes, headless.
+
+    A pool of mayapy standalone workers is run, one scene per task: Each worker
+    opens its scene, exports (or imports) the weights of every skinned mesh via
+    the skinner.core API, and writes its per-mesh results back for the parent
+    process to collect.  Since every scene is processed in its own Maya process,
+    a crashing scene can't take the whole batch down with it.
+
+    The parent process doesn't need Maya at all: It can be ran from any Python
+    3 interpreter, as long as it can find mayapy.  After each scene completes,
+    a JSON report with per-mesh timings and failures is (atomically) rewritten,
+    so if the run is interrupted it can be resumed, skipping all the scenes that
+    already succeeded.
+
+    Command line usage examples:
+    # Export the weights of all the scenes in a folder, next to each scene:
+    > mayapy -m tp.libs.rig.skinner.batch export c:/assets/characters --report c:/temp/export.json
+    # Import them back, saving the scenes, using 4 workers:
+    > mayapy -m tp.libs.rig.skinner.batch import c:/assets/characters --report c:/temp/import.json --workers 4 --save
+    # Resume the interrupted import, retrying only the scenes that didn't succeed:
+    > mayapy -m tp.libs.rig.skinner.batch import c:/assets/characters --report c:/temp/import.json --resume --save
+
+    Dependencies:
+    * numpy & scipy on the mayapy path, same as skinner.core.
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import hashlib
+import argparse
+import tempfile
+import traceback
+import subprocess
+import concurrent.futures
+
+#---------------------------
+
+MODES = ("export", "import")
+
+# Env var that can point to the mayapy executable to use for the workers.
+MAYAPY_ENV = "SKINNER_MAYAPY"
+
+SCENE_EXTENSIONS = (".ma", ".mb")
+
+REPORT_VERSION = 1
+
+# The module the workers run: When ran via 'python -m', __name__ is '__main__'.
+WORKER_MODULE = __spec__.name if __spec__ else "tp.libs.rig.skinner.batch"
+
+# The root dir that needs to be on the workers PYTHONPATH to import WORKER_MODULE.
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), *[os.pardir] * WORKER_MODULE.count(".")))
+
+#---------------------------
+# Worker : Ran inside mayapy
+
+def getSkinnedMeshShapes() -> list:
+    r"""
+    Return the full paths of all the skinned mesh shapes in the scene.
+
+    Return : list : The sorted full paths of the mesh shapes.
+    """
+    import maya.cmds as mc
+
+    meshShapes = set()
+    for skinCluster in mc.ls(type="skinCluster"):
+        geometry = mc.skinCluster(skinCluster, query=True, geometry=True) or []
+        meshShapes.update(mc.ls(geometry, type="mesh", long=True))
+    return sorted(meshShapes)
+
+def findMeshShape(meshShape:str) -> (str,None):
+    r"""
+    Find the mesh shape stored in a SkinChunk in the current scene.  If its full
+    path doesn't exist (it has been reparented, for example), fall back to its
+    leaf name, if unique.
+
+    Parameters:
+    meshShape : string : The mesh shape name, as stored in the SkinChunk.
+
+    Return : string/None : The full path of the mesh shape, or None if not found.
+    """
+    import maya.cmds as mc
+
+    found = mc.ls(meshShape, type="mesh", long=True)
+    if not found:
+        found = mc.ls(meshShape.split("|")[-1], type="mesh", long=True)
+    if len(found) != 1:
+        return None
+    return found[0]
+
+def exportScene(weightPath:str, setToBindPose=False, verbose=False) -> dict:
+    r"""
+    Export the weights of all the skinned mesh in the open scene to a single
+    .sknr file.  SkinChunks are generated per mesh, so a failing mesh doesn't
+    prevent the rest from being exported.
+
+    Parameters:
+    weightPath : string : The .sknr file to export to.
+    setToBindPose : bool : Default False : See core.generateSkinChunks.
+    verbose : bool : Default False : Print the skinner.core results?
+
+    Return : dict : For each mesh shape, a dict with keys:
+        "success" : bool : If the SkinChunk was generated and exported.
+        "time" : float : The time in seconds it took.
+        "numVerts" : int : The number of verts exported.
+        "error" : string/None : The error, if any.
+    """
+    from . import core, utils
+
+    results = {}
+    skinChunks = []
+    # The long path of the mesh each SkinChunk was generated from.  SkinChunks only
+    # store the mesh leaf name, which may not be unique.
+    chunkMeshShapes = []
+    for meshShape in getSkinnedMeshShapes():
+        startTime = time.time()
+        results[meshShape] = {"success": False, "time": 0.0, "numVerts": 0, "error": None}
+        try:
+            meshShapeVertIds = utils.getMeshVertIds(items=[meshShape])
+            meshChunks = core.generateSkinChunks(meshShapeVertIds, setToBindPose=setToBindPose, verbose=verbose,
+                                                 promptOnNonInteractiveNormalization=False)
+            if not meshChunks:
+                raise RuntimeError("No SkinChunk was generated.")
+            skinChunks.extend(meshChunks)
+            chunkMeshShapes.extend([meshShape] * len(meshChunks))
+            results[meshShape]["numVerts"] = sum(chunk.getNumVerts() for chunk in meshChunks)
+        except Exception as e:
+            results[meshShape]["error"] = str(e)
+        results[meshShape]["time"] = time.time() - startTime
+
+    if skinChunks:
+        weightDir = os.path.dirname(weightPath)
+        if weightDir and not os.path.isdir(weightDir):
+            os.makedirs(weightDir)
+        startTime = time.time()
+        core.exportSkinChunks(weightPath, skinChunks, verbose=verbose)
+        # Spread the time it took to write the file across the exported mesh:
+        exportTime = (time.time() - startTime) / len(skinChunks)
+        for meshShape in chunkMeshShapes:
+            results[meshShape]["time"] += exportTime
+        for meshResult in results.values():
+            if meshResult["error"] is None:
+                meshResult["success"] = True
+
+    return results
+
+def importScene(weightPath:str, verbose=False, **kwargs) -> dict:
+    r"""
+    Import the weights of a .sknr file onto the mesh stored in it.
+
+    Parameters:
+    weightPath : string : The .sknr file to import.
+    verbose : bool : Default False : Print the skinner.core results?
+    kwargs : Any additional keyword:args that should be passed to core.setWeights.
+
+    Return : dict : For each mesh shape, a dict with keys:
+        "success" : bool : If the weights were set.
+        "time" : float : The time in seconds it took.
+        "importMethod" : string/None : The method used to set the weights.
+        "error" : string/None : The error, if any.
+    """
+    from . import core
+
+    if not os.path.isfile(weightPath):
+        raise IOError("Weight file doesn't exist: '%s'"%weightPath)
+
+    results = {}
+    skinChunks = core.importSkinChunks([weightPath], verbose=verbose)
+    items = []
+    for skinChunk in skinChunks:
+        storedShape = skinChunk.getMeshShapeName()
+        meshShape = findMeshShape(storedShape)
+        if meshShape:
+            items.append(meshShape)
+        else:
+            results[storedShape] = {"success": False, "time": 0.0, "importMethod": None,
+                                    "error": "Mesh not found in the scene."}
+    if not items:
+        return results
+
+    kwargs["promptOnNonInteractiveNormalization"] = False
+    weightResults = core.setWeights(items, skinChunks=skinChunks, verbose=verbose, **kwargs)
+    for meshShape, importData in weightResults.items():
+        results[meshShape] = {"success": importData["success"], "time": importData["totalTime"],
+                              "importMethod": importData["importMethod"],
+                              "error": None if importData["success"] else "Failed to set weights."}
+
+    return results
+
+def processScene(mode:str, scenePath:str, weightPath:str, save=False, verbose=False, **kwargs) -> dict:
+    r"""
+    Open the scene and export / import its weights.
+
+    Parameters:
+    mode : string : "export" or "import".
+    scenePath : string : The scene to open.
+    weightPath : string : The .sknr file to export to / import from.
+    save : bool : Default False : Save the scene after importing?
+    verbose : bool : Default False : Print the skinner.core results?
+    kwargs : Any additional keyword:args that should be passed to exportScene
+        / importScene.
+
+    Return : dict : A dict with keys:
+        "success" : bool : If all the mesh succeeded.
+        "meshes" : dict : The per mesh results, see exportScene / importScene.
+    """
+    import maya.cmds as mc
+    from . import utils
+
+    utils.loadPlugin()
+    mc.file(scenePath, open=True, force=True, prompt=False)
+    if mode == "export":
+        meshResults = exportScene(weightPath, verbose=verbose, **kwargs)
+    else:
+        meshResults = importScene(weightPath, verbose=verbose, **kwargs)
+        if save:
+            mc.file(save=True, force=True)
+
+    return {"success": all(meshResult["success"] for meshResult in meshResults.values()),
+            "meshes": meshResults}
+
+def runWorker(taskPath:str) -> int:
+    r"""
+    The entry point of the mayapy workers: Initialize Maya standalone, process
+    the scene described in the task file, and write the result file.
+
+    Parameters:
+    taskPath : string : The task .json file, see runTask.
+
+    Return : int : The process exit code : 0 if the scene succeeded, 1 otherwise.
+    """
+    with open(taskPath) as f:
+        task = json.load(f)
+
+    result = {"success": False, "meshes": {}, "error": None}
+    import maya.standalone
+    maya.standalone.initialize(name="python")
+    try:
+        result.update(processScene(task["mode"], task["scenePath"], task["weightPath"], **task["kwargs"]))
+    except Exception:
+        result["error"] = traceback.format_exc()
+        print(result["error"])
+    finally:
+        writeJson(task["resultPath"], result)
+        maya.standalone.uninitialize()
+
+    return 0 if result["success"] else 1
+
+#---------------------------
+# Parent process
+
+def writeJson(filePath:str, data:dict):
+    r"""
+    Write the data to a .json file atomically: It's written to a temp file first,
+    which then replaces the target file, so an interrupted write can never leave
+    a corrupted file behind.
+
+    Parameters:
+    filePath : string : The .json file to write.
+    data : dict : The data to write.
+    """
+    fileDir = os.path.dirname(os.path.abspath(filePath))
+    if not os.path.isdir(fileDir):
+        os.makedirs(fileDir)
+    fd, tempPath = tempfile.mkstemp(suffix=".json", dir=fileDir)
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        os.replace(tempPath, filePath)
+    except Exception:
+        if os.path.isfile(tempPath):
+            os.remove(tempPath)
+        raise
+
+def findMayapy(mayapyPath=None) -> (str,None):
+    r"""
+    Find the mayapy executable to run the workers with.
+
+    Parameters:
+    mayapyPath : string/None : Default None : If provided, use it.  Otherwise use
+        the MAYAPY_ENV env var, then the 'mayapy' found on the PATH, and then the
+        current interpreter if it's mayapy itself.
+
+    Return : string/None : The mayapy executable, or None if it can't be found.
+    """
+    candidates = [mayapyPath, os.environ.get(MAYAPY_ENV), shutil.which("mayapy")]
+    if os.path.basename(sys.executable).lower().startswith("mayapy"):
+        candidates.append(sys.executable)
+    for candidate in candidates:
+        if candidate and os.path.isfile(candidate):
+            return candidate
+    return None
+
+def findScenes(paths:list) -> list:
+    r"""
+    Find all the scenes to process.
+
+    Parameters:
+    paths : list : Scene files, and/or dirs to recursively search for scenes.
+
+    Return : list : The sorted, normalized scene paths.
+    """
+    scenePaths = set()
+    for path in paths:
+        if os.path.isdir(path):
+            for dirPath, dirNames, fileNames in os.walk(path):
+                for fileName in fileNames:
+                    if os.path.splitext(fileName)[-1].lower() in SCENE_EXTENSIONS:
+                        scenePaths.add(os.path.join(dirPath, fileName))
+        elif os.path.isfile(path):
+            scenePaths.add(path)
+        else:
+            raise IOError("Scene path doesn't exist: '%s'"%path)
+    return sorted(os.path.abspath(scenePath).replace("\\", "/") for scenePath in scenePaths)
+
+def getWeightPath(scenePath:str, weightDir=None) -> str:
+    r"""
+    Return the .sknr file path for the provided scene.
+
+    Parameters:
+    scenePath : string : The scene path.
+    weightDir : string/None : Default None : The dir to store the weight files.
+        If None, they're stored next to the scenes.
+
+    Return : string : The .sknr file path, named after the scene.
+    """
+    sceneDir, sceneFile = os.path.split(scenePath)
+    weightFile = "%s.sknr"%os.path.splitext(sceneFile)[0]
+    return os.path.join(weightDir or sceneDir, weightFile).replace("\\", "/")
+
+def getLogPath(scenePath:str, logDir:str) -> str:
+    r"""
+    Return the worker log file path for the provided scene: Hashed on the full
+    scene path, since scenes in different dirs can share the same name.
+
+    Parameters:
+    scenePath : string : The scene path.
+    logDir : string : The dir to store the logs.
+
+    Return : string : The log file path.
+    """
+    sceneName = os.path.splitext(os.path.basename(scenePath))[0]
+    sceneHash = hashlib.md5(scenePath.encode("utf-8")).hexdigest()[:8]
+    return os.path.join(logDir, "%s_%s.log"%(sceneName, sceneHash)).replace("\\", "/")
+
+def runTask(mayapyPath:str, task:dict, logPath:str, timeout=None) -> dict:
+    r"""
+    Run a mayapy worker process for a single scene, and wait for its result.
+
+    Parameters:
+    mayapyPath : string : The mayapy executable.
+    task : dict : The task to run, with keys "mode", "scenePath", "weightPath"
+        and "kwargs".  See processScene.
+    logPath : string : The file to write the worker output to.
+    timeout : float/None : Default None : If provided, the seconds to wait for
+        the worker before killing it.
+
+    Return : dict : The scene results, with keys:
+        "success" : bool : If all the mesh succeeded.
+        "meshes" : dict : The per mesh results.
+        "error" : string/None : The error, if any.
+        "returnCode" : int/None : The worker exit code.
+        "time" : float : The time in seconds it took, Maya startup included.
+    """
+    startTime = time.time()
+    result = {"success": False, "meshes": {}, "error": None, "returnCode": None}
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT_DIR, env.get("PYTHONPATH")]))
+
+    tempDir = tempfile.mkdtemp(prefix="skinner_batch_")
+    try:
+        taskPath = os.path.join(tempDir, "task.json")
+        task = dict(task, resultPath=os.path.join(tempDir, "result.json"))
+        writeJson(taskPath, task)
+        with open(logPath, "w") as log:
+            try:
+                process = subprocess.run([mayapyPath, "-m", WORKER_MODULE, "worker", taskPath], env=env,
+                                         stdout=log, stderr=subprocess.STDOUT, timeout=timeout)
+                result["returnCode"] = process.returncode
+            except subprocess.TimeoutExpired:
+                result["error"] = "Worker timed out after %s seconds."%timeout
+
+        if os.path.isfile(task["resultPath"]):
+            with open(task["resultPath"]) as f:
+                result.update(json.load(f))
+        elif not result["error"]:
+            result["error"] = "Worker exited with code %s without results, see log."%result["returnCode"]
+    finally:
+        shutil.rmtree(tempDir, ignore_errors=True)
+
+    result["time"] = time.time() - startTime
+    return result
+
+def loadReport(reportPath:str, mode:str) -> dict:
+    r"""
+    Load a previous report to resume, making sure it was generated in the same mode.
+
+    Parameters:
+    reportPath : string : The .json report.
+    mode : string : "export" or "import".
+
+    Return : dict : The report.  If the file doesn't exist, a new empty report.
+    """
+    if not os.path.isfile(reportPath):
+        return newReport(mode)
+    with open(reportPath) as f:
+        report = json.load(f)
+    if report.get("mode") != mode:
+        raise ValueError("Can't resume a '%s' report in '%s' mode: '%s'"%(report.get("mode"), mode, reportPath))
+    return report
+
+def newReport(mode:str) -> dict:
+    r"""
+    Return a new empty report.
+
+    Parameters:
+    mode : string : "export" or "import".
+
+    Return : dict : The report.
+    """
+    return {"version": REPORT_VERSION, "mode": mode, "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "updated": None, "numScenes": 0, "numSucceeded": 0, "numFailed": 0, "scenes": {}}
+
+def updateReport(report:dict):
+    r"""
+    Update the report summary from its scene results.
+
+    Parameters:
+    report : dict : The report to update.
+    """
+    scenes = report["scenes"].values()
+    report["updated"] = time.strftime("%Y-%m-%d %H:%M:%S")
+    report["numScenes"] = len(report["scenes"])
+    report["numSucceeded"] = sum(1 for scene in scenes if scene["success"])
+    report["numFailed"] = report["numScenes"] - report["numSucceeded"]
+
+def runBatch(mode:str, scenePaths:list, reportPath:str, weightDir=None, workers=None, resume=False,
+             mayapyPath=None, timeout=None, save=False, verbose=True, **kwargs) -> dict:
+    r"""
+    Export / import the weights of all the provided scenes, processing each one
+    in its own mayapy worker.
+
+    Parameters:
+    mode : string : "export" or "import".
+    scenePaths : list : Scene files, and/or dirs to recursively search for scenes.
+    reportPath : string : The .json report to write.  The worker logs are written
+        to a '<report name>_logs' dir next to it.
+    weightDir : string/None : Default None : See getWeightPath.
+    workers : int/None : Default None : The number of workers to run at the same
+        time.  If None, use half the CPU count: Maya processes are heavy.
+    resume : bool : Default False : If True and the report exists, skip all the
+        scenes that already succeeded in it.
+    mayapyPath : string/None : Default None : See findMayapy.
+    timeout : float/None : Default None : See runTask.
+    save : bool : Default False : Save the scenes after importing?
+    verbose : bool : Default True : Print the progress?
+    kwargs : Any additional keyword:args that should be passed to exportScene
+        / importScene.
+
+    Return : dict : The report.  Per scene (keys), a dict with keys:
+        "success" : bool : If all the mesh succeeded.
+        "meshes" : dict : The per mesh results, see exportScene / importScene.
+        "weightPath" : string : The .sknr file exported to / imported from.
+        "logPath" : string : The worker log file.
+        "error" : string/None : The error, if any.
+        "returnCode" : int/None : The worker exit code.
+        "time" : float : The time in seconds it took, Maya startup included.
+    """
+    if mode not in MODES:
+        raise ValueError("runBatch : 'mode' must be one of %s, got '%s'"%(MODES, mode))
+    mayapy = findMayapy(mayapyPath)
+    if not mayapy:
+        raise RuntimeError("Unable to find mayapy: Provide its path, or set the '%s' env var."%MAYAPY_ENV)
+
+    report = loadReport(reportPath, mode) if resume else newReport(mode)
+    scenePaths = findScenes(scenePaths)
+    pending = [scenePath for scenePath in scenePaths
+               if not report["scenes"].get(scenePath, {}).get("success")]
+    workers = workers or max(1, (os.cpu_count() or 2) // 2)
+    logDir = "%s_logs"%os.path.splitext(reportPath)[0]
+    if not os.path.isdir(logDir):
+        os.makedirs(logDir)
+    if verbose:
+        print("Skinner batch %s : %s scenes, %s already done, %s workers."%(
+            mode, len(scenePaths), len(scenePaths) - len(pending), workers))
+
+    startTime = time.time()
+    futures = {}
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+    try:
+        for scenePath in pending:
+            task = {"mode": mode, "scenePath": scenePath, "weightPath": getWeightPath(scenePath, weightDir),
+                    "kwargs": dict(kwargs, save=save)}
+            logPath = getLogPath(scenePath, logDir)
+            future = executor.submit(runTask, mayapy, task, logPath, timeout=timeout)
+            futures[future] = (task, logPath)
+
+        # Only this thread touches the report, rewriting it as each scene completes:
+        for i, future in enumerate(concurrent.futures.as_completed(futures)):
+            task, logPath = futures[future]
+            result = future.result()
+            result.update(weightPath=task["weightPath"], logPath=logPath)
+            report["scenes"][task["scenePath"]] = result
+            updateReport(report)
+            writeJson(reportPath, report)
+            if verbose:
+                numMeshes = len(result["meshes"])
+                numFailed = sum(1 for meshResult in result["meshes"].values() if not meshResult["success"])
+                print("    %s/%s : %s : %s : %s mesh, %s failed, %.2f seconds"%(
+                    i + 1, len(pending), "Success" if result["success"] else "FAILED", task["scenePath"],
+                    numMeshes, numFailed, result["time"]))
+    finally:
+        # If interrupted, don't start any scene still queued: Resume picks them up.
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+        updateReport(report)
+        writeJson(reportPath, report)
+
+    if verbose:
+        print("Skinner batch %s complete in %.2f seconds : %s succeeded, %s failed.  Report : '%s'"%(
+            mode, time.time() - startTime, report["numSucceeded"], report["numFailed"], reportPath))
+
+    return report
+
+#---------------------------
+# Command line
+
+def getArgParser() -> argparse.ArgumentParser:
+    r"""
+    Return the command line argument parser.
+
+    Return : ArgumentParser
+    """
+    parser = argparse.ArgumentParser(prog="skinner.batch",
+                                     description="Export / import skinner weights across many scenes, "
+                                                 "processing each scene in its own mayapy worker.")
+    subParsers = parser.add_subparsers(dest="mode", required=True)
+    for mode in MODES:
+        modeParser = subParsers.add_parser(mode, help="%s the weights of the scenes."%mode.capitalize())
+        modeParser.add_argument("scenes", nargs="+", help="Scene files, and/or dirs to search for scenes.")
+        modeParser.add_argument("--report", required=True, help="The .json report file to write.")
+        modeParser.add_argument("--weightDir", help="Dir for the .sknr files. Default: Next to each scene.")
+        modeParser.add_argument("--workers", type=int, help="Number of workers. Default: Half the CPU count.")
+        modeParser.add_argument("--resume", action="store_true", help="Skip the scenes that succeeded in the report.")
+        modeParser.add_argument("--mayapy",
+                                help="The mayapy executable. Default: $%s, or found on the PATH."%MAYAPY_ENV)
+        modeParser.add_argument("--timeout", type=float, help="Seconds before killing a worker.")
+        modeParser.add_argument("--quiet", action="store_true", help="Don't print the progress.")
+        if mode == "export":
+            modeParser.add_argument("--setToBindPose", action="store_true",
+                                    help="Set the mesh to their bindpose before exporting.")
+        else:
+            modeParser.add_argument("--save", action="store_true", help="Save the scenes after importing.")
+            modeParser.add_argument("--fallbackSkinningMethod", default="closestNeighbors",
+                                    choices=("closestNeighbors", "closestPoint"),
+                                    help="How weights are set when there isn't a 1:1 vert match.")
+
+    # Internal : Ran by the parent process in each mayapy worker.
+    workerParser = subParsers.add_parser("worker")
+    workerParser.add_argument("task")
+
+    return parser
+
+def main(args=None) -> int:
+    r"""
+    The command line entry point.
+
+    Parameters:
+    args : list/None : Default None : The command line args.  If None, use sys.argv.
+
+    Return : int : The exit code : 0 if all the scenes succeeded, 1 otherwise.
+    """
+    parser = getArgParser()
+    parsedArgs = parser.parse_args(args)
+    if parsedArgs.mode == "worker":
+        return runWorker(parsedArgs.task)
+
+    kwargs = {}
+    if parsedArgs.mode == "export":
+        kwargs["setToBindPose"] = parsedArgs.setToBindPose
+    else:
+        kwargs["fallbackSkinningMethod"] = parsedArgs.fallbackSkinningMethod
+    try:
+        report = runBatch(parsedArgs.mode, parsedArgs.scenes, parsedArgs.report, weightDir=parsedArgs.weightDir,
+                          workers=parsedArgs.workers, resume=parsedArgs.resume, mayapyPath=parsedArgs.mayapy,
+                          timeout=parsedArgs.timeout, save=getattr(parsedArgs, "save", False),
+                          verbose=not parsedArgs.quiet, **kwargs)
+    except (IOError, ValueError, RuntimeError) as e:
+        parser.error(str(e))
+
+    return 0 if not report["numFailed"] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,309 @@
+r"""
+Name : skinner.mirror.py
+Creation Date : 2026-10-19
+Description :
+    Mirror skin weights across a symmetry plane, fast.
+
+    The symmetry map (for each vert, the id of the vert on the other side of
+    the mesh) is built once with a KDTree over the mirrored pre-deformed vert
+    positions, and cached by mesh topology: Mirroring again on the same mesh, or
+    on any other mesh with the same topology, skips straight to the weights.
+    Influences are mapped to their mirrored counterparts by swapping the side
+    tokens in their names, and the whole weight matrix is remapped with numpy
+    fancy indexing.  No UI is involved, so it can be called from build scripts
+    running in batch mode.
+
+    Dependencies:
+    * numpy & scipy on the path for import, same as skinner.core.
+"""
+import time
+import hashlib
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+try:
+    from scipy.spatial import KDTree
+except ImportError:
+    KDTree = None
+
+import maya.cmds as mc
+import maya.api.OpenMaya as om2
+
+from . import utils
+
+#---------------------------
+
+AXES = ("x", "y", "z")
+
+# Default side tokens used when none are provided: Maps each side token to its
+# mirrored counterpart.
+DEFAULT_SIDE_TOKENS = {"L": "R", "R": "L", "l": "r", "r": "l",
+                       "left": "right", "right": "left", "LEFT": "RIGHT", "RIGHT": "LEFT"}
+
+# Default separator used to split influence names into tokens.
+TOKEN_SEPARATOR = "_"
+
+# Symmetry maps cache: {(topologyFingerprint, axis, tolerance) : ndarray[n]}
+gSymmetryMaps = {}
+
+#---------------------------
+# Symmetry
+
+def getTopologyFingerprint(meshShape:str) -> str:
+    r"""
+    Return a string that identifies the topology of the provided mesh : Mesh with
+    the same vert count and face connectivity return the same fingerprint.
+
+    Parameters:
+    meshShape : string : The mesh shape node to query.
+
+    Return : string : "vertCount:hash"
+    """
+    mFnMesh = om2.MFnMesh(utils.getMDagPath(meshShape))
+    counts, connects = mFnMesh.getVertices()
+    digest = hashlib.sha1(np.asarray(counts, dtype=np.int32).tobytes())
+    digest.update(np.asarray(connects, dtype=np.int32).tobytes())
+    return "%s:%s"%(mFnMesh.numVertices, digest.hexdigest()[:16])
+
+def getVertPositions(meshShape:str) -> np.ndarray:
+    r"""
+    Return the object space positions of the pre-deformed shape of the provided
+    mesh, so the result doesn't depend on the current pose of the skeleton.
+
+    Parameters:
+    meshShape : string : The mesh shape node to query.
+
+    Return : ndarray[n][3] : The position of each vert, in vert id order.
+    """
+    preDeformedShape = utils.getPreDeformedShape(meshShape)
+    points = om2.MFnMesh(utils.getMDagPath(preDeformedShape)).getPoints(om2.MSpace.kObject)
+    return np.array([(p.x, p.y, p.z) for p in points], dtype=np.float64)
+
+def buildSymmetryMap(positions:np.ndarray, axis="x", tolerance=0.001) -> np.ndarray:
+    r"""
+    Build the symmetry map for the provided positions : For each vert, the index
+    of the closest vert to its mirrored position.
+
+    Parameters:
+    positions : ndarray[n][3] : The position of each vert.
+    axis : string : Default "x" : The axis normal to the symmetry plane.
+    tolerance : float : Default 0.001 : Maximum distance between a mirrored
+        position and its closest vert for them to be considered symmetrical.
+
+    Return : ndarray[n] : The index of the symmetrical vert of each vert, or -1
+        if no vert was found within tolerance.
+    """
+    if not KDTree:
+        raise ImportError("Unable to import the scipy.spatial module to access the KDTree class")
+    mirroredPositions = np.array(positions, dtype=np.float64)
+    mirroredPositions[:, AXES.index(axis)] *= -1.0
+    distances, indexes = KDTree(positions).query(mirroredPositions, workers=-1)
+    symmetryMap = np.asarray(indexes, dtype=np.int64)
+    symmetryMap[distances > tolerance] = -1
+    return symmetryMap
+
+def getSymmetryMap(meshShape:str, axis="x", tolerance=0.001, rebuild=False) -> np.ndarray:
+    r"""
+    Return the symmetry map for the provided mesh, building it if it's not already
+    cached for the mesh topology.
+
+    Parameters:
+    meshShape : string : The mesh shape node to query.
+    axis : string : Default "x" : The axis normal to the symmetry plane.
+    tolerance : float : Default 0.001 : See buildSymmetryMap.
+    rebuild : bool : Default False : Force the map to be rebuilt, even if cached.
+
+    Return : ndarray[n] : See buildSymmetryMap.  Shared with the cache: Don't modify.
+    """
+    key = (getTopologyFingerprint(meshShape), axis, tolerance)
+    symmetryMap = gSymmetryMaps.get(key)
+    if symmetryMap is None or rebuild:
+        symmetryMap = buildSymmetryMap(getVertPositions(meshShape), axis=axis, tolerance=tolerance)
+        symmetryMap.flags.writeable = False
+        gSymmetryMaps[key] = symmetryMap
+    return symmetryMap
+
+def clearSymmetryCache():
+    r"""
+    Clear all the cached symmetry maps.
+    """
+    gSymmetryMaps.clear()
+
+#---------------------------
+# Influences
+
+def getMirroredInfluenceName(influence:str, sideTokens:dict, separator=TOKEN_SEPARATOR) -> str:
+    r"""
+    Return the name of the mirrored influence for the provided influence name, by
+    swapping each of its side tokens.  Only whole tokens are swapped, so
+    'L_arm_jnt' becomes 'R_arm_jnt', but 'Leg_jnt' is left untouched.
+
+    Parameters:
+    influence : string : The influence name.  Namespaces and DAG paths are kept.
+    sideTokens : dict : Maps each side token to its mirrored counterpart.
+    separator : string : Default "_" : The separator between name tokens.
+
+    Return : string : The mirrored influence name.  The same name if it has no
+        side tokens.
+    """
+    prefix, sep, name = influence.rpartition("|")
+    namespace, nsSep, shortName = name.rpartition(":")
+    tokens = [sideTokens.get(token, token) for token in shortName.split(separator)]
+    return prefix + sep + namespace + nsSep + separator.join(tokens)
+
+def getInfluenceMirrorMap(influences:list, sideTokens:dict, separator=TOKEN_SEPARATOR) -> np.ndarray:
+    r"""
+    Return, for each influence, the index of its mirrored influence.
+
+    Parameters:
+    influences : list : The influence names, in skinCluster influence order.
+    sideTokens : dict : See getMirroredInfluenceName.
+    separator : string : See getMirroredInfluenceName.
+
+    Return : ndarray[m] : The index of the mirrored influence of each influence.
+        Influences without a mirrored name, or whose mirrored influence isn't in
+        the provided influences, map to themselves.
+    """
+    indexes = {influence:i for i, influence in enumerate(influences)}
+    return np.array([indexes.get(getMirroredInfluenceName(influence, sideTokens, separator=separator), i)
+                     for i, influence in enumerate(influences)], dtype=np.int64)
+
+#---------------------------
+# Weights
+
+def getMirrorTargetVertIds(positions:np.ndarray, symmetryMap:np.ndarray, axis="x",
+                           positiveToNegative=True, tolerance=0.001) -> np.ndarray:
+    r"""
+    Return the ids of the verts that receive mirrored weights : The verts on the
+    destination side of the symmetry plane that have a symmetrical vert.  Verts
+    on the symmetry plane are left untouched.
+
+    Parameters:
+    positions : ndarray[n][3] : The position of each vert.
+    symmetryMap : ndarray[n] : See buildSymmetryMap.
+    axis : string : Default "x" : The axis normal to the symmetry plane.
+    positiveToNegative : bool : Default True : Mirror from the positive side of
+        the axis to the negative one, or the other way around.
+    tolerance : float : Default 0.001 : Distance to the symmetry plane under which
+        verts are considered to be on it.
+
+    Return : ndarray[x] : The destination vert ids.
+    """
+    coordinates = positions[:, AXES.index(axis)]
+    destination = coordinates < -tolerance if positiveToNegative else coordinates > tolerance
+    return np.flatnonzero(destination & (symmetryMap >= 0))
+
+def mirrorWeights(weights:np.ndarray, symmetryMap:np.ndarray, targetVertIds:np.ndarray,
+                  influenceMirrorMap:np.ndarray) -> np.ndarray:
+    r"""
+    Mirror the provided weight matrix.
+
+    Parameters:
+    weights : ndarray[n][m] : The weights of each vert (n) for each influence (m).
+    symmetryMap : ndarray[n] : See buildSymmetryMap.
+    targetVertIds : ndarray[x] : The ids of the verts to mirror weights onto.
+    influenceMirrorMap : ndarray[m] : See getInfluenceMirrorMap.
+
+    Return : ndarray[x][m] : The mirrored weights of each target vert.
+    """
+    sourceWeights = weights[symmetryMap[targetVertIds]]
+    mirroredWeights = np.zeros_like(sourceWeights)
+    # The weight of each influence goes to its mirrored influence.  Accumulate,
+    # in case more than one influence maps onto the same mirrored influence:
+    np.add.at(mirroredWeights.T, influenceMirrorMap, sourceWeights.T)
+    return mirroredWeights
+
+def mirrorSkinWeights(items=None, axis="x", positiveToNegative=True, sideTokens=None,
+                      separator=TOKEN_SEPARATOR, tolerance=0.001, rebuildSymmetry=False,
+                      verbose=True) -> dict:
+    r"""
+    Mirror the skin weights of the provided mesh across the symmetry plane.
+
+    Parameters:
+    items : string/list/None : Default None : The mesh (transform or shape) nodes
+        to mirror.  If None, use the selection.
+    axis : string : Default "x" : The axis normal to the symmetry plane.
+    positiveToNegative : bool : Default True : Mirror from the positive side of
+        the axis to the negative one, or the other way around.
+    sideTokens : dict/None : Default None : Maps each side token to its mirrored
+        counterpart.  If None, DEFAULT_SIDE_TOKENS is used.
+    separator : string : Default "_" : The separator between influence name tokens.
+    tolerance : float : Default 0.001 : See buildSymmetryMap.
+    rebuildSymmetry : bool : Default False : Force the symmetry maps to be rebuilt.
+    verbose : bool : Default True : Print results?
+
+    Return : dict : For each mesh shape, a dict with keys:
+        "success" : bool : If the weights were mirrored.
+        "numVerts" : int : The number of verts that received mirrored weights.
+        "time" : float : The time in seconds it took.
+    """
+    if np is None:
+        raise ImportError("Unable to import numpy")
+    if axis not in AXES:
+        raise ValueError("mirrorSkinWeights : 'axis' must be one of %s, got '%s'"%(AXES, axis))
+    if items is None:
+        items = mc.ls(selection=True, long=True)
+    elif not isinstance(items, (list, tuple)):
+        items = [items]
+    sideTokens = DEFAULT_SIDE_TOKENS if sideTokens is None else sideTokens
+
+    results = {}
+    for item in items:
+        startTime = time.time()
+        meshShape = utils.getMeshShape(item)
+        results[meshShape] = {"success": False, "numVerts": 0, "time": 0.0}
+        meshDagPath = utils.getMDagPath(meshShape)
+        mFnSkinCluster = utils.getMFnSkinCluster(meshDagPath)
+        if not mFnSkinCluster:
+            om2.MGlobal.displayWarning("mirrorSkinWeights : '%s' isn't skinned, skipping."%meshShape)
+            continue
+
+        positions = getVertPositions(meshShape)
+        symmetryMap = getSymmetryMap(meshShape, axis=axis, tolerance=tolerance, rebuild=rebuildSymmetry)
+        targetVertIds = getMirrorTargetVertIds(positions, symmetryMap, axis=axis,
+                                               positiveToNegative=positiveToNegative, tolerance=tolerance)
+        if not len(targetVertIds):
+            om2.MGlobal.displayWarning("mirrorSkinWeights : '%s' has no symmetrical verts to mirror onto."%meshShape)
+            continue
+
+        # Get all the weights in one call:
+        infDags = mFnSkinCluster.influenceObjects()
+        influences = [infDag.partialPathName() for infDag in infDags]
+        allVertsComp = om2.MFnSingleIndexedComponent()
+        allVertsCompObj = allVertsComp.create(om2.MFn.kMeshVertComponent)
+        allVertsComp.setCompleteData(len(positions))
+        weights, numInfs = mFnSkinCluster.getWeights(meshDagPath, allVertsCompObj)
+        weights = np.array(weights, dtype=np.float64).reshape(-1, numInfs)
+
+        influenceMirrorMap = getInfluenceMirrorMap(influences, sideTokens, separator=separator)
+        mirroredWeights = mirrorWeights(weights, symmetryMap, targetVertIds, influenceMirrorMap)
+
+        # Set them back in one call, hacking the undo queue same as core.setWeights:
+        skinClustName = mFnSkinCluster.name()
+        infIndexes = om2.MIntArray([int(mFnSkinCluster.indexForInfluenceObject(infDag)) for infDag in infDags])
+        targetVertNames = ["%s.vtx[%s]"%(meshShape, vertId) for vertId in targetVertIds.tolist()]
+        targetVertsComp = om2.MFnSingleIndexedComponent()
+        targetVertsCompObj = targetVertsComp.create(om2.MFn.kMeshVertComponent)
+        targetVertsComp.addElements(targetVertIds.tolist())
+        utils.unlockInfluences(skinClustName)
+        mc.undoInfo(openChunk=True)
+        try:
+            mc.skinPercent(skinClustName, targetVertNames, transformValue=[(infDags[0].fullPathName(), 1.0)])
+            mFnSkinCluster.setWeights(meshDagPath, targetVertsCompObj, infIndexes,
+                                      om2.MDoubleArray(mirroredWeights.ravel().tolist()))
+            results[meshShape]["success"] = True
+            results[meshShape]["numVerts"] = len(targetVertIds)
+        except RuntimeError as e:
+            print(e)
+            om2.MGlobal.displayError("Encountered an error mirroring skin weights on '%s', see above."%meshShape)
+        finally:
+            mc.undoInfo(closeChunk=True)
+
+        results[meshShape]["time"] = time.time() - startTime
+        if verbose:
+            print("Mirrored weights on %s verts of '%s' in %.3f seconds."%(
+                results[meshShape]["numVerts"], meshShape, results[meshShape]["time"]))
+
+    return results
@@ -3,8 +3,16 @@ from __future__ import annotations
 import math
 from typing import List, Iterator
 
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
+import maya.cmds as cmds
+
 from tp.maya import api
 from tp.maya.om import mathlib
+from tp.libs.rig.utils.maya import undomodifier
 
 
 def construct_plane_from_positions(
@@ -139,6 +147,16 @@ def orient_nodes_iterator(nodes: list[api.DagNode]) -> Iterator[tuple[api.DagNod
 def orient_nodes(
 		nodes: list[api.DagNode], primary_axis: api.Vector, secondary_axis: api.Vector,
 		world_up_axis: api.Vector, skip_end: bool = True):
+	"""
+	Orients given nodes so their primary axis aims to the next node and their secondary axis points to the world up
+	axis.
+
+	:param list[api.DagNode] nodes: list of nodes to orient.
+	:param api.Vector primary_axis: aim primary axis vector.
+	:param api.Vector secondary_axis: up secondary axis vector.
+	:param api.Vector world_up_axis: world up axis vector.
+	:param bool skip_end: whether to skip end node.
+	"""
 
 	joints: list[api.DagNode] = []
 
@@ -171,6 +189,241 @@ def orient_nodes(
 			current_node.setRotation(rotation, space=api.kWorldSpace)
 
 
+def orient_chains(
+		chains: list[tuple[list[api.DagNode], bool]], primary_axis: api.Vector, secondary_axis: api.Vector,
+		world_up_axis: api.Vector, freeze_joints: bool = True) -> list[api.DagNode]:
+	"""
+	Orients all given node chains in a single batch, without un-parenting and re-parenting nodes.
+	World matrices are read once, aim/up frames for all chains are solved with NumPy, new local transforms are computed
+	from the new world matrices of the parents, and all channels are written using a single DG modifier. Children of
+	oriented nodes that are not oriented themselves keep their world transform.
+	Results match orient_nodes: nodes without target are aligned to the world, joints scale is reset and plain
+	transforms keep their scale values.
+	DG modifier is executed through an undoable command, so the whole orientation can be undone in a single step.
+
+	:param list[tuple[list[api.DagNode], bool]] chains: list of chains to orient. Each chain is defined by a tuple with
+		the list of nodes to orient (in hierarchy order) and whether the end node of the chain should be skipped.
+	:param api.Vector primary_axis: aim primary axis vector.
+	:param api.Vector secondary_axis: up secondary axis vector.
+	:param api.Vector world_up_axis: world up axis vector.
+	:param bool freeze_joints: whether to store oriented joints rotation into their joint orient instead of their rotate
+		attribute.
+	:return: list of oriented nodes.
+	:rtype: list[api.DagNode]
+	"""
+
+	if np is None:
+		oriented_nodes: list[api.DagNode] = []
+		for chain_nodes, skip_end in chains:
+			orient_nodes(chain_nodes, primary_axis, secondary_axis, world_up_axis, skip_end=skip_end)
+			oriented_nodes.extend(chain_nodes)
+		joint_names = [node.fullPathName() for node in oriented_nodes if node.hasFn(api.kNodeTypes.kJoint)]
+		if freeze_joints and joint_names:
+			cmds.makeIdentity(joint_names, apply=True, scale=True, rotate=True, translate=True)
+		return oriented_nodes
+
+	# gather nodes to orient, their aim targets and the nodes that are aligned to the world
+	indices: dict[int, int] = {}
+	infos: list[dict] = []
+
+	def _add_node(_node_object: api.OpenMaya.MObject, _node: api.DagNode | None = None) -> int:
+		_handle_hash = api.OpenMaya.MObjectHandle(_node_object).hashCode()
+		_index = indices.get(_handle_hash)
+		if _index is None:
+			_dag_path = api.OpenMaya.MFnDagNode(_node_object).getPath()
+			_index = indices[_handle_hash] = len(infos)
+			infos.append(dict(
+				node=_node, object=_node_object, world=_dag_path.inclusiveMatrix(), parent=_dag_path.exclusiveMatrix(),
+				mode=None, target=None))
+		return _index
+
+	for chain_nodes, skip_end in chains:
+		last_index = len(chain_nodes) - 1
+		for i, node in enumerate(chain_nodes):
+			node_object = node.object()
+			has_children = any(
+				api.OpenMaya.MFnDagNode(node_object).child(child_index).hasFn(api.OpenMaya.MFn.kTransform)
+				for child_index in range(api.OpenMaya.MFnDagNode(node_object).childCount()))
+			target = chain_nodes[i + 1] if has_children and i != last_index else None
+			if skip_end and target is None:
+				continue
+			info = infos[_add_node(node_object, node)]
+			if target is None:
+				info['mode'] = 'reset'
+			else:
+				info['mode'] = 'orient'
+				info['target'] = _add_node(target.object(), target)
+	oriented = [info for info in infos if info['mode'] is not None]
+	if not oriented:
+		return []
+
+	# children of oriented nodes that are not oriented must keep their world transform
+	for info in oriented:
+		dag_fn = api.OpenMaya.MFnDagNode(info['object'])
+		for child_index in range(dag_fn.childCount()):
+			child = dag_fn.child(child_index)
+			if child.hasFn(api.OpenMaya.MFn.kTransform):
+				child_info = infos[_add_node(child)]
+				if child_info['mode'] is None:
+					child_info['mode'] = 'keep'
+
+	node_count = len(infos)
+	world_matrices = np.array([list(info['world']) for info in infos], dtype=np.float64).reshape(node_count, 4, 4)
+	new_world_matrices = world_matrices.copy()
+	positions = world_matrices[:, 3, :3]
+
+	# solve aim/up frames for all oriented nodes at once
+	local_axes = np.array([list(primary_axis), list(secondary_axis), [0.0, 0.0, 0.0]], dtype=np.float64)
+	local_axes[:2] /= np.linalg.norm(local_axes[:2], axis=-1, keepdims=True)
+	local_axes[2] = np.cross(local_axes[0], local_axes[1])
+	orient_indices = np.array([i for i, info in enumerate(infos) if info['mode'] == 'orient'], dtype=np.int64)
+	if orient_indices.size:
+		target_indices = np.array([infos[i]['target'] for i in orient_indices], dtype=np.int64)
+		aim_vectors = positions[target_indices] - positions[orient_indices]
+		aim_vectors /= np.maximum(np.linalg.norm(aim_vectors, axis=-1, keepdims=True), 1e-12)
+		up_vectors = np.broadcast_to(np.array(list(world_up_axis), dtype=np.float64), aim_vectors.shape)
+		up_vectors = up_vectors - np.sum(up_vectors * aim_vectors, axis=-1, keepdims=True) * aim_vectors
+		up_lengths = np.linalg.norm(up_vectors, axis=-1, keepdims=True)
+		# when aiming along the world up axis, current secondary axis direction is used as up vector
+		current_up_vectors = np.einsum('j,njk->nk', local_axes[1], world_matrices[orient_indices, :3, :3])
+		current_up_vectors = current_up_vectors - np.sum(
+			current_up_vectors * aim_vectors, axis=-1, keepdims=True) * aim_vectors
+		up_vectors = np.where(up_lengths > 1e-6, up_vectors, current_up_vectors)
+		up_vectors /= np.maximum(np.linalg.norm(up_vectors, axis=-1, keepdims=True), 1e-12)
+		world_axes = np.stack([aim_vectors, up_vectors, np.cross(aim_vectors, up_vectors)], axis=1)
+		new_world_matrices[orient_indices, :3, :3] = np.matmul(local_axes.T, world_axes)
+
+	# resolve new matrices from top to bottom, so the new world matrices of oriented parents are used
+	local_matrices = np.empty((node_count, 4, 4), dtype=np.float64)
+	depths = [api.OpenMaya.MFnDagNode(info['object']).getPath().length() for info in infos]
+	for i in sorted(range(node_count), key=depths.__getitem__):
+		info = infos[i]
+		dag_fn = api.OpenMaya.MFnDagNode(info['object'])
+		parent_index = None
+		if dag_fn.parentCount():
+			parent_index = indices.get(api.OpenMaya.MObjectHandle(dag_fn.parent(0)).hashCode())
+		if parent_index is not None:
+			parent_world = new_world_matrices[parent_index]
+		else:
+			parent_world = np.array(list(info['parent']), dtype=np.float64).reshape(4, 4)
+		inverse_parent_world = np.linalg.inv(parent_world)
+		if info['mode'] not in ('orient', 'reset'):
+			new_world_matrices[i] = world_matrices[i]
+			local_matrices[i] = np.matmul(world_matrices[i], inverse_parent_world)
+			continue
+
+		# nodes without target are aligned to the world, same as orient_nodes does
+		world_rotation = new_world_matrices[i, :3, :3] if info['mode'] == 'orient' else np.identity(3)
+		parent_rotation = parent_world[:3, :3] / np.linalg.norm(parent_world[:3, :3], axis=-1, keepdims=True)
+		# joints scale is reset, while plain transforms keep their scale values
+		if info['object'].hasFn(api.OpenMaya.MFn.kJoint):
+			local_scale = np.ones(3, dtype=np.float64)
+		else:
+			local_scale = np.array(api.OpenMaya.MFnTransform(info['object']).scale(), dtype=np.float64)
+		local_matrix = np.identity(4, dtype=np.float64)
+		local_matrix[:3, :3] = local_scale[:, None] * np.matmul(world_rotation, parent_rotation.T)
+		local_matrix[3, :3] = np.matmul(world_matrices[i, 3], inverse_parent_world)[:3]
+		local_matrices[i] = local_matrix
+		new_world_matrices[i] = np.matmul(local_matrix, parent_world)
+
+	modifier = api.OpenMaya.MDGModifier()
+	for i, info in enumerate(infos):
+		if info['mode'] is not None:
+			_queue_local_transform(
+				modifier, info['object'], local_matrices[i], info['mode'], freeze_joints=freeze_joints)
+	undomodifier.execute(modifier)
+
+	return [info['node'] for info in oriented]
+
+
+def _queue_local_transform(
+		modifier: api.OpenMaya.MDGModifier, node_object: api.OpenMaya.MObject, local_matrix: np.ndarray, mode: str,
+		freeze_joints: bool = True):
+	"""
+	Internal function that queues into given modifier the channel values that makes given node to match given local
+	matrix.
+
+	:param api.OpenMaya.MDGModifier modifier: modifier to queue channel values into.
+	:param api.OpenMaya.MObject node_object: transform or joint node.
+	:param np.ndarray local_matrix: 4x4 local matrix.
+	:param str mode: whether node was oriented ('orient' or 'reset') or it should keep its rotation values ('keep').
+	:param bool freeze_joints: whether oriented joints rotation should be stored into joint orient.
+	"""
+
+	transform_fn = api.OpenMaya.MFnTransform(node_object)
+	is_joint = node_object.hasFn(api.OpenMaya.MFn.kJoint)
+	rotate_order = transform_fn.findPlug('rotateOrder', False).asInt()
+
+	rotation_scale = local_matrix[:3, :3]
+	scale = np.linalg.norm(rotation_scale, axis=-1)
+	if np.linalg.det(rotation_scale) < 0.0:
+		scale[0] *= -1.0
+	rotation = rotation_scale / scale[:, None]
+	rotate_axis = _rotation_to_array(transform_fn.rotateOrientation(api.OpenMaya.MSpace.kTransform).asMatrix())
+
+	rotate_values = None
+	rotate_axis_values = None
+	joint_orient_values = None
+	if is_joint and mode != 'keep':
+		rotate_axis_values = (0.0, 0.0, 0.0)
+		scale = np.ones(3, dtype=np.float64)
+		if freeze_joints:
+			rotate_values = (0.0, 0.0, 0.0)
+			joint_orient_values = _array_to_euler(rotation, api.OpenMaya.MEulerRotation.kXYZ)
+		else:
+			rotate_values = _array_to_euler(rotation, rotate_order)
+			joint_orient_values = (0.0, 0.0, 0.0)
+	elif is_joint:
+		# keep rotate and rotate axis values, and solve joint orient: [rotateAxis] * [rotate] * [jointOrient]
+		current_rotation = _rotation_to_array(transform_fn.rotation(asQuaternion=True).asMatrix())
+		joint_orient = np.matmul(np.matmul(current_rotation.T, rotate_axis.T), rotation)
+		joint_orient_values = _array_to_euler(joint_orient, api.OpenMaya.MEulerRotation.kXYZ)
+	else:
+		rotate_values = _array_to_euler(np.matmul(rotate_axis.T, rotation), rotate_order)
+
+	for attribute_name, values in (
+			('translate', local_matrix[3, :3]), ('rotate', rotate_values), ('rotateAxis', rotate_axis_values),
+			('jointOrient', joint_orient_values), ('scale', scale)):
+		if values is None:
+			continue
+		plug = transform_fn.findPlug(attribute_name, False)
+		if plug.isLocked:
+			continue
+		for i in range(3):
+			child_plug = plug.child(i)
+			if not child_plug.isLocked:
+				modifier.newPlugValueDouble(child_plug, float(values[i]))
+
+
+def _rotation_to_array(matrix: api.OpenMaya.MMatrix) -> np.ndarray:
+	"""
+	Internal function that returns the 3x3 rotation part of given matrix as a NumPy array.
+
+	:param api.OpenMaya.MMatrix matrix: matrix to convert.
+	:return: 3x3 array.
+	:rtype: np.ndarray
+	"""
+
+	return np.array(list(matrix), dtype=np.float64).reshape(4, 4)[:3, :3]
+
+
+def _array_to_euler(rotation: np.ndarray, rotate_order: int) -> tuple[float, float, float]:
+	"""
+	Internal function that converts given 3x3 rotation array into Euler angles (in radians).
+
+	:param np.ndarray rotation: 3x3 rotation array.
+	:param int rotate_order: rotation order to decompose rotation with.
+	:return: Euler angles.
+	:rtype: tuple[float, float, float]
+	"""
+
+	matrix = np.identity(4, dtype=np.float64)
+	matrix[:3, :3] = rotation
+	euler = api.OpenMaya.MEulerRotation.decompose(api.OpenMaya.MMatrix(matrix.ravel().tolist()), rotate_order)
+
+	return euler.x, euler.y, euler.z
+
+
 def world_axis_to_rotation(
 		axis: int, invert: bool = False, rotation_order: int = api.consts.kRotateOrder_XYZ) -> api.EulerRotation:
 	"""
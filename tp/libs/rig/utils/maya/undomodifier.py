@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import os
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as OpenMaya
+
+COMMAND_NAME = 'tpUndoableModifier'
+PLUGIN_NAME = os.path.splitext(os.path.basename(__file__))[0]
+
+# Modifiers waiting to be executed by the undoable modifier command.
+_PENDING_MODIFIERS: list[OpenMaya.MDGModifier] = []
+
+
+def maya_useNewAPI():
+	"""
+	Function used by Maya to know that this plugin uses Maya Python API 2.0.
+	"""
+
+	pass
+
+
+def execute(modifier: OpenMaya.MDGModifier):
+	"""
+	Executes given DG modifier through an undoable command, so all its queued operations are registered within Maya
+	undo queue as a single undo step.
+
+	:param OpenMaya.MDGModifier modifier: DG or DAG modifier to execute.
+	"""
+
+	if not cmds.pluginInfo(PLUGIN_NAME, query=True, loaded=True):
+		cmds.loadPlugin(os.path.splitext(__file__)[0] + '.py', quiet=True)
+
+	_PENDING_MODIFIERS.append(modifier)
+	try:
+		getattr(cmds, COMMAND_NAME)()
+	finally:
+		if modifier in _PENDING_MODIFIERS:
+			_PENDING_MODIFIERS.remove(modifier)
+
+
+class UndoableModifierCommand(OpenMaya.MPxCommand):
+	"""
+	Command that executes the last pending modifier and undoes/redoes it with Maya undo queue.
+	"""
+
+	def __init__(self):
+		super().__init__()
+
+		self._modifier: OpenMaya.MDGModifier | None = None
+
+	@staticmethod
+	def creator() -> UndoableModifierCommand:
+		return UndoableModifierCommand()
+
+	def doIt(self, args: OpenMaya.MArgList):
+		# Maya imports plugins as standalone modules, so pending modifiers are retrieved from the package module.
+		from tp.libs.rig.utils.maya import undomodifier
+
+		if not undomodifier._PENDING_MODIFIERS:
+			raise RuntimeError(f'{COMMAND_NAME} must be called through undomodifier.execute function!')
+
+		self._modifier = undomodifier._PENDING_MODIFIERS.pop()
+		self._modifier.doIt()
+
+	def redoIt(self):
+		self._modifier.doIt()
+
+	def undoIt(self):
+		self._modifier.undoIt()
+
+	def isUndoable(self) -> bool:
+		return self._modifier is not None
+
+
+def initializePlugin(plugin: OpenMaya.MObject):
+	OpenMaya.MFnPlugin(plugin).registerCommand(COMMAND_NAME, UndoableModifierCommand.creator)
+
+
+def uninitializePlugin(plugin: OpenMaya.MObject):
+	OpenMaya.MFnPlugin(plugin).deregisterCommand(COMMAND_NAME)
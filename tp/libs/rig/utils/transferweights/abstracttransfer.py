@@ -1,18 +1,161 @@
 from __future__ import annotations
 
 import abc
+import threading
+from concurrent import futures
+from dataclasses import dataclass
+from typing import Callable, Iterator
 
-from tp.dcc import mesh, skin as skin_ctx
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from tp.core import log
+from tp.dcc import node, mesh, skin as skin_ctx
 from tp.common.python import decorators
 
+logger = log.rigLogger
+
+# default number of points solved between progress reports and cancellation checks.
+CHUNK_SIZE = 2048
+
+# weights below this value are not written into the target skin.
+WEIGHT_TOLERANCE = 1e-6
+
+
+class TransferCancelled(Exception):
+    """
+    Exception raised by the solve step of a transfer when it is cancelled.
+    """
+
+    pass
+
+
+@dataclass(frozen=True)
+class WeightsSnapshot:
+    """
+    Immutable copy of the vertex positions, influences and weights of a skin.
+    Snapshot data is stored within read-only NumPy arrays, so it can be safely shared with worker threads and it does
+    not hold any reference to scene nodes.
+    """
+
+    name: str
+    vertex_indices: np.ndarray
+    points: np.ndarray
+    influence_ids: np.ndarray
+    influence_names: tuple[str, ...]
+    weights: np.ndarray
+    max_influences: int
+
+    @classmethod
+    def create(cls, skin_fn: skin_ctx.Skin, vertex_indices: list[int] | None = None) -> WeightsSnapshot:
+        """
+        Creates a new snapshot from the given skin.
+
+        :param skin_ctx.Skin skin_fn: skin to snapshot.
+        :param list[int] or None vertex_indices: vertex indices to snapshot. If not given, all vertices are used.
+        :return: newly created skin snapshot.
+        :rtype: WeightsSnapshot
+        :raises ImportError: if NumPy is not available.
+        """
+
+        if np is None:
+            raise ImportError('NumPy is required to snapshot skin weights!')
+
+        vertex_indices = list(vertex_indices if vertex_indices is not None else skin_fn.vertices())
+        vertex_weights = skin_fn.vertex_weights(*vertex_indices)
+        influences = skin_fn.influences()
+        influence_ids = sorted(skin_fn.used_influence_ids(*vertex_indices))
+        influence_columns = {influence_id: i for i, influence_id in enumerate(influence_ids)}
+        weights = np.zeros((len(vertex_indices), len(influence_ids)), dtype=np.float64)
+        for row, vertex_index in enumerate(vertex_indices):
+            for influence_id, weight in vertex_weights[vertex_index].items():
+                column = influence_columns.get(influence_id)
+                if column is not None:
+                    weights[row, column] = weight
+
+        snapshot = cls(
+            name=node.Node(skin_fn.shape()).name(),
+            vertex_indices=np.asarray(vertex_indices, dtype=np.int64),
+            points=np.asarray(skin_fn.control_points(*vertex_indices), dtype=np.float64).reshape(-1, 3),
+            influence_ids=np.asarray(influence_ids, dtype=np.int64),
+            influence_names=tuple(influences[influence_id].absolute_name() for influence_id in influence_ids),
+            weights=weights,
+            max_influences=skin_fn.max_influences())
+        for array in (snapshot.vertex_indices, snapshot.points, snapshot.influence_ids, snapshot.weights):
+            array.flags.writeable = False
+
+        return snapshot
+
+    def __len__(self) -> int:
+        return len(self.vertex_indices)
+
+    @property
+    def influences(self) -> dict[int, str]:
+        """
+        Getter method that returns the snapshot influence names by their influence ID.
+
+        :return: influence names by ID.
+        :rtype: dict[int, str]
+        """
+
+        return dict(zip(self.influence_ids.tolist(), self.influence_names))
+
+
+def target_points(skin_fn: skin_ctx.Skin, vertex_indices: list[int]) -> np.ndarray:
+    """
+    Returns the positions of the given vertices of the given skin as a read-only NumPy array.
+
+    :param skin_ctx.Skin skin_fn: skin to get points of.
+    :param list[int] vertex_indices: vertex indices to get points of.
+    :return: (N, 3) array of points.
+    :rtype: np.ndarray
+    """
+
+    points = np.asarray(skin_fn.control_points(*vertex_indices), dtype=np.float64).reshape(-1, 3)
+    points.flags.writeable = False
+
+    return points
+
+
+def iterate_chunks(
+        count: int, chunk_size: int = CHUNK_SIZE, progress: Callable[[int, int], None] | None = None,
+        cancelled: Callable[[], bool] | None = None) -> Iterator[slice]:
+    """
+    Generator function that yields the slices used to solve the given number of points in chunks.
+    Progress is reported and cancellation is checked before each chunk.
+
+    :param int count: number of points to solve.
+    :param int chunk_size: number of points within each chunk.
+    :param Callable[[int, int], None] or None progress: optional function called with the number of solved points and
+        the total number of points.
+    :param Callable[[], bool] or None cancelled: optional function that returns whether the solve was cancelled.
+    :return: iterated chunk slices.
+    :rtype: Iterator[slice]
+    :raises TransferCancelled: if the solve was cancelled.
+    """
+
+    chunk_size = max(1, chunk_size)
+    for start in range(0, count, chunk_size):
+        if cancelled is not None and cancelled():
+            raise TransferCancelled()
+        if progress is not None:
+            progress(start, count)
+        yield slice(start, min(start + chunk_size, count))
+
+    if progress is not None:
+        progress(count, count)
+
 
 class AbstractTransfer(abc.ABC):
     """
     Abstract base class that handles weight transfer behaviour.
     """
 
-    __slots__ = ('_mesh', '_skin', '_vertex_indices', '_vertex_map')
+    __slots__ = ('_mesh', '_skin', '_vertex_indices', '_vertex_map', '_snapshot')
     __title__ = ''
+    __supports_snapshot__ = True
 
     def __init__(self, *args):
         super().__init__()
@@ -21,9 +164,17 @@ class AbstractTransfer(abc.ABC):
         self._mesh: mesh.Mesh | None = None
         self._vertex_indices: list[int] = []
         self._vertex_map: dict[int, int] = {}
+        self._snapshot: WeightsSnapshot | None = None
 
         num_args = len(args)
-        if num_args == 1:
+        if num_args == 1 and isinstance(args[0], WeightsSnapshot):
+            if not self.supports_snapshot:
+                raise TypeError(f'{self.class_name}() does not support weights snapshots!')
+            # Snapshot transfers do not access the scene, so they can be solved within worker threads.
+            self._snapshot = args[0]
+            self._vertex_indices = self._snapshot.vertex_indices.tolist()
+            self._vertex_map = dict(enumerate(self._vertex_indices))
+        elif num_args == 1:
             skin_fn = args[0]
             if not isinstance(skin_fn, skin_ctx.Skin):
                 raise TypeError(f'{self.class_name}() expects a valid skin ({type(skin_ctx.Skin).__name__} given)!')
@@ -69,6 +220,19 @@ class AbstractTransfer(abc.ABC):
 
         return cls.__title__
 
+    @decorators.classproperty
+    def supports_snapshot(cls) -> bool:
+        """
+        Getter method that returns whether this transfer can be solved from a weights snapshot. Transfers that do not
+        support snapshots need to access the source skin within the scene, so they cannot be solved within a worker
+        thread.
+
+        :return: True if transfer can be solved from a weights snapshot; False otherwise.
+        :rtype: bool
+        """
+
+        return cls.__supports_snapshot__
+
     @property
     def skin(self) -> skin_ctx.Skin:
         """
@@ -113,7 +277,69 @@ class AbstractTransfer(abc.ABC):
 
         return self._vertex_map
 
+    @property
+    def snapshot(self) -> WeightsSnapshot:
+        """
+        Getter method that returns the weights snapshot the weights are transferred from.
+        If the transfer was created from a skin, the snapshot is created the first time it is accessed.
+
+        :return: weights snapshot.
+        :rtype: WeightsSnapshot
+        """
+
+        if self._snapshot is None:
+            self._snapshot = WeightsSnapshot.create(self._skin, self._vertex_indices)
+
+        return self._snapshot
+
     @abc.abstractmethod
+    def solve(
+            self, points: np.ndarray, progress: Callable[[int, int], None] | None = None,
+            cancelled: Callable[[], bool] | None = None) -> np.ndarray:
+        """
+        Computes the weights of the given points from the snapshot weights.
+        If transfer supports snapshots, this function only works with the snapshot data, so it can be called from a
+        worker thread.
+
+        :param np.ndarray points: (N, 3) array of points to compute weights for.
+        :param Callable[[int, int], None] or None progress: optional function called with the number of solved points
+            and the total number of points.
+        :param Callable[[], bool] or None cancelled: optional function that returns whether the solve was cancelled.
+        :return: (N, M) array of weights, where columns follow the snapshot influences order.
+        :rtype: np.ndarray
+        :raises TransferCancelled: if the solve was cancelled.
+        """
+
+        pass
+
+    def apply(self, other_skin: skin_ctx.Skin, vertex_indices: list[int], weights: np.ndarray):
+        """
+        Writes the given solved weights into the given skin.
+        Must be called from the main thread.
+
+        :param skin_ctx.Skin other_skin: skin to write weights into.
+        :param list[int] vertex_indices: vertex indices to write weights for.
+        :param np.ndarray weights: (N, M) array of weights returned by solve function.
+        :raises TypeError: if the given skin does not have all the influences with weights.
+        """
+
+        snapshot = self.snapshot
+        used_columns = np.flatnonzero((weights > WEIGHT_TOLERANCE).any(axis=0))
+        target_ids = {
+            influence.absolute_name(): influence_id for influence_id, influence in other_skin.influences().items()}
+        missing = [snapshot.influence_names[i] for i in used_columns if snapshot.influence_names[i] not in target_ids]
+        if missing:
+            raise TypeError(f'apply() expects target skin to have influences: {", ".join(missing)}')
+
+        influence_ids = [target_ids[snapshot.influence_names[i]] for i in used_columns]
+        used_weights = weights[:, used_columns]
+        updates = {}
+        for vertex_index, row in zip(vertex_indices, used_weights):
+            nonzero = np.flatnonzero(row > WEIGHT_TOLERANCE)
+            updates[vertex_index] = {influence_ids[i]: float(row[i]) for i in nonzero}
+
+        other_skin.apply_vertex_weights(updates)
+
     def transfer(self, other_skin: skin_ctx.Skin, vertex_indices: list[int]):
         """
         Transfers the weights from this skin to the given one.
@@ -122,4 +348,107 @@ class AbstractTransfer(abc.ABC):
         :param list[int] vertex_indices: vertex indices to transfer skin weights for.
         """
 
-        pass
+        weights = self.solve(target_points(other_skin, vertex_indices))
+        self.apply(other_skin, vertex_indices, weights)
+
+
+class TransferTask:
+    """
+    Runs the solve step of a transfer within a worker thread.
+    Task progress can be polled and the task can be cancelled from the main thread. Once the task is done, the solved
+    weights should be written by calling the transfer apply function from the main thread.
+    """
+
+    def __init__(self, transfer: AbstractTransfer, points: np.ndarray):
+        super().__init__()
+
+        self._transfer = transfer
+        self._points = points
+        self._progress: tuple[int, int] = (0, len(points))
+        self._cancel_event = threading.Event()
+        self._future: futures.Future | None = None
+
+    @property
+    def transfer(self) -> AbstractTransfer:
+        """
+        Getter method that returns the transfer being solved.
+
+        :return: transfer instance.
+        :rtype: AbstractTransfer
+        """
+
+        return self._transfer
+
+    @property
+    def progress(self) -> tuple[int, int]:
+        """
+        Getter method that returns the number of solved points and the total number of points.
+
+        :return: solved and total points.
+        :rtype: tuple[int, int]
+        """
+
+        return self._progress
+
+    def start(self):
+        """
+        Starts solving the transfer within a worker thread.
+        """
+
+        if self._future is not None:
+            return
+
+        executor = futures.ThreadPoolExecutor(max_workers=1)
+        try:
+            self._future = executor.submit(
+                self._transfer.solve, self._points, progress=self._set_progress, cancelled=self._cancel_event.is_set)
+        finally:
+            executor.shutdown(wait=False)
+
+    def cancel(self):
+        """
+        Requests the cancellation of the task. Solve stops before solving its next chunk of points.
+        """
+
+        self._cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        """
+        Returns whether the task cancellation was requested.
+
+        :return: True if task was cancelled; False otherwise.
+        :rtype: bool
+        """
+
+        return self._cancel_event.is_set()
+
+    def done(self) -> bool:
+        """
+        Returns whether the task finished, was cancelled or failed.
+
+        :return: True if task is done; False otherwise.
+        :rtype: bool
+        """
+
+        return self._future is not None and self._future.done()
+
+    def result(self) -> np.ndarray:
+        """
+        Returns the solved weights, waiting for the task to finish if necessary.
+
+        :return: (N, M) array of weights.
+        :rtype: np.ndarray
+        :raises TransferCancelled: if the task was cancelled.
+        """
+
+        return self._future.result()
+
+    def _set_progress(self, solved: int, total: int):
+        """
+        Internal function that is called from the worker thread each time a chunk of points is going to be solved.
+
+        :param int solved: number of solved points.
+        :param int total: total number of points.
+        """
+
+        self._progress = (solved, total)
@@ -1,18 +1,14 @@
 from __future__ import annotations
 
-import typing
-from itertools import chain
+from typing import Callable
 
+import numpy as np
 from overrides import override
 from scipy.spatial import cKDTree
 
 from tp.core import log
-from tp.dcc.dataclasses import vector
 from tp.libs.rig.utils.transferweights import abstracttransfer
 
-if typing.TYPE_CHECKING:
-    from tp.dcc.skin import Skin
-
 logger = log.rigLogger
 
 
@@ -21,64 +17,63 @@ class ClosestPoint(abstracttransfer.AbstractTransfer):
     Overload of AbstractTransfer that transfer weights by closes point.
     """
 
-    __slots__ = ('_vertex_points', '_point_tree')
+    __slots__ = ('_point_tree',)
     __title__ = 'Closest Point'
 
     def __init__(self, *args):
         super().__init__(*args)
 
-        self._vertex_points = self._skin.control_points(*self._vertex_indices)
-        self._point_tree = cKDTree(self._vertex_points)
+        self._point_tree: cKDTree | None = None
 
     @property
-    def vertex_points(self) -> list[vector.Vector]:
+    def vertex_points(self) -> np.ndarray:
         """
         Getter method that returns the vertex points.
 
-        :return: list of vertex points.
-        :rtype: list[vector.Vector]
+        :return: (N, 3) array of vertex points.
+        :rtype: np.ndarray
         """
 
-        return self._vertex_points
+        return self.snapshot.points
 
     @property
     def point_tree(self) -> cKDTree:
         """
         Getter method that returns the point tree.
+        Tree is built the first time it is accessed, which usually happens within the solve worker thread.
 
         :return: point tree.
         :rtype: cKDTree
         """
 
+        if self._point_tree is None:
+            self._point_tree = cKDTree(self.vertex_points)
+
         return self._point_tree
 
     @override
-    def transfer(self, other_skin: Skin, vertex_indices: list[int]):
+    def solve(
+            self, points: np.ndarray, progress: Callable[[int, int], None] | None = None,
+            cancelled: Callable[[], bool] | None = None) -> np.ndarray:
         """
-        Transfers the weights from this skin to the given one.
-
-        :param  Skin other_skin: skin to transfer weights to.
-        :param list[int] vertex_indices: vertex indices to transfer skin weights for.
+        Computes the weights of the given points from the snapshot weights.
+        This function only works with the snapshot data, so it can be called from a worker thread.
+
+        :param np.ndarray points: (N, 3) array of points to compute weights for.
+        :param Callable[[int, int], None] or None progress: optional function called with the number of solved points
+            and the total number of points.
+        :param Callable[[], bool] or None cancelled: optional function that returns whether the solve was cancelled.
+        :return: (N, M) array of weights, where columns follow the snapshot influences order.
+        :rtype: np.ndarray
+        :raises TransferCancelled: if the solve was cancelled.
         """
 
-        # Get the closest points from the point tree.
-        vertex_points = other_skin.control_points(*vertex_indices)
-        distances, closest_indices = self._point_tree.query(vertex_points)
-
-        # Get associated vertex weights.
-        # Remember we have to convert our local indices back to global!
-        closest_vertex_indices = [self.vertex_map[x] for x in closest_indices]
-        closest_vertices = self.skin.vertex_weights(*closest_vertex_indices)
-
-        updates = {
-            vertex_index: closest_vertices[closestVertexIndex] for (vertex_index, closestVertexIndex) in zip(
-                vertex_indices, closest_vertex_indices)}
-
-        # Remap source weights to target.
-        influence_ids = set(chain(*[list(x.keys()) for x in updates.values()]))
-        influence_map = self.skin.create_influence_map(other_skin, influence_ids=influence_ids)
+        source_weights = self.snapshot.weights
+        weights = np.empty((len(points), source_weights.shape[1]), dtype=source_weights.dtype)
+        for chunk in abstracttransfer.iterate_chunks(len(points), progress=progress, cancelled=cancelled):
+            _, closest_indices = self.point_tree.query(points[chunk])
+            weights[chunk] = source_weights[closest_indices]
 
-        updates = self.skin.remap_vertex_weights(updates, influence_map)
-        other_skin.apply_vertex_weights(updates)
+        logger.info('Finished solving weights via closest point!')
 
-        logger.info('Finished transferring weights via closest point!')
+        return weights
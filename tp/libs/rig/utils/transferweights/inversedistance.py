@@ -1,45 +1,42 @@
 from __future__ import annotations
 
-import typing
-from itertools import chain
+from typing import Callable
 
+import numpy as np
 from overrides import override
 
 from tp.core import log
-from tp.dcc.dataclasses import vector
 from tp.libs.rig.utils.transferweights import abstracttransfer
 
-if typing.TYPE_CHECKING:
-    from tp.dcc.skin import Skin
-
-
 logger = log.rigLogger
 
+# maximum number of distances computed at once, used to bound the memory used by each solved chunk.
+MAX_CHUNK_DISTANCES = 4_000_000
+
 
 class InverseDistance(abstracttransfer.AbstractTransfer):
     """
     Overload of AbstractTransfer that transfer weights via inverse distance.
     """
 
-    __slots__ = ('_vertex_points', '_power')
+    __slots__ = ('_power',)
     __title__ = 'Inverse Distance'
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args)
 
-        self._vertex_points = self._skin.control_points(*self._vertex_indices)
         self._power = kwargs.get('power', 2.0)
 
     @property
-    def vertex_points(self) -> list[vector.Vector]:
+    def vertex_points(self) -> np.ndarray:
         """
         Getter method that returns the vertex points.
 
-        :return: list of vertex points.
-        :rtype: list[vector.Vector]
+        :return: (N, 3) array of vertex points.
+        :rtype: np.ndarray
         """
 
-        return self._vertex_points
+        return self.snapshot.points
 
     @property
     def power(self) -> float:
@@ -53,27 +50,38 @@ class InverseDistance(abstracttransfer.AbstractTransfer):
         return self._power
 
     @override
-    def transfer(self, other_skin: Skin, vertex_indices: list[int]):
+    def solve(
+            self, points: np.ndarray, progress: Callable[[int, int], None] | None = None,
+            cancelled: Callable[[], bool] | None = None) -> np.ndarray:
         """
-        Transfers the weights from this skin to the given one.
-
-        :param  Skin other_skin: skin to transfer weights to.
-        :param list[int] vertex_indices: vertex indices to transfer skin weights for.
+        Computes the weights of the given points from the snapshot weights.
+        This function only works with the snapshot data, so it can be called from a worker thread.
+
+        :param np.ndarray points: (N, 3) array of points to compute weights for.
+        :param Callable[[int, int], None] or None progress: optional function called with the number of solved points
+            and the total number of points.
+        :param Callable[[], bool] or None cancelled: optional function that returns whether the solve was cancelled.
+        :return: (N, M) array of weights, where columns follow the snapshot influences order.
+        :rtype: np.ndarray
+        :raises TransferCancelled: if the solve was cancelled.
         """
 
-        vertex_points = other_skin.controlPoints(*vertex_indices)
-        vertex_weights = self.skin.vertex_weights(*self.vertex_indices)
-
-        updates = {}
-        for vertex_index, vertex_point in zip(vertex_indices, vertex_points):
-            distances = [vertex_point.distanceBetween(otherPoint) for otherPoint in self.vertex_points]
-            updates[vertex_index] = self.skin.inverse_distance_weights(vertex_weights, distances, power=self.power)
-
-        # Remap source weights to target
-        influence_ids = set(chain(*[list(x.keys()) for x in updates.values()]))
-        influence_map = self.skin.createInfluenceMap(other_skin, influenceIds=influence_ids)
-
-        updates = self.skin.remapVertexWeights(updates, influence_map)
-        other_skin.applyVertexWeights(updates)
-
-        logger.info('Finished transferring weights via inverse distance!')
+        vertex_points = self.vertex_points
+        source_weights = self.snapshot.weights
+        weights = np.empty((len(points), source_weights.shape[1]), dtype=source_weights.dtype)
+        chunk_size = MAX_CHUNK_DISTANCES // max(1, len(vertex_points))
+        for chunk in abstracttransfer.iterate_chunks(
+                len(points), chunk_size=chunk_size, progress=progress, cancelled=cancelled):
+            distances = np.linalg.norm(points[chunk, np.newaxis, :] - vertex_points[np.newaxis, :, :], axis=2)
+            coincident = distances <= abstracttransfer.WEIGHT_TOLERANCE
+            with np.errstate(divide='ignore'):
+                factors = 1.0 / np.power(distances, self.power)
+            # points that lie on top of a source vertex get the weights of that vertex.
+            coincident_rows = coincident.any(axis=1)
+            factors[coincident_rows] = coincident[coincident_rows]
+            factors /= factors.sum(axis=1, keepdims=True)
+            weights[chunk] = factors @ source_weights
+
+        logger.info('Finished solving weights via inverse distance!')
+
+        return weights
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import typing
 from itertools import chain
+from typing import Callable
 
+import numpy as np
 from overrides import override
 
 from tp.core import log
@@ -18,10 +20,12 @@ logger = log.rigLogger
 class PointOnSurface(abstracttransfer.AbstractTransfer):
     """
     Overload of AbstractTransfer that transfer weights by closest point on surface.
+    Closest points are queried on the source mesh, so this transfer cannot be solved from a weights snapshot.
     """
 
     __slots__ = ('_face_indices',)
     __title__ = 'Point on Surface'
+    __supports_snapshot__ = False
 
     def __init__(self, *args):
         super().__init__(*args)
@@ -40,6 +44,41 @@ class PointOnSurface(abstracttransfer.AbstractTransfer):
 
         return self._face_indices
 
+    @override
+    def solve(
+            self, points: np.ndarray, progress: Callable[[int, int], None] | None = None,
+            cancelled: Callable[[], bool] | None = None) -> np.ndarray:
+        """
+        Computes the weights of the given points from the source skin weights.
+        Source mesh is accessed, so this function must be called from the main thread.
+
+        :param np.ndarray points: (N, 3) array of points to compute weights for.
+        :param Callable[[int, int], None] or None progress: optional function called with the number of solved points
+            and the total number of points.
+        :param Callable[[], bool] or None cancelled: optional function that returns whether the solve was cancelled.
+        :return: (N, M) array of weights, where columns follow the snapshot influences order.
+        :rtype: np.ndarray
+        :raises TransferCancelled: if the solve was cancelled.
+        :raises TypeError: if not expected number of vertices found for a face.
+        """
+
+        columns = {int(influence_id): i for i, influence_id in enumerate(self.snapshot.influence_ids)}
+        weights = np.zeros((len(points), len(columns)), dtype=np.float64)
+        for chunk in abstracttransfer.iterate_chunks(len(points), progress=progress, cancelled=cancelled):
+            for row, vertex_weights in enumerate(self._point_weights(points[chunk].tolist()), start=chunk.start):
+                for influence_id, weight in vertex_weights.items():
+                    column = columns.get(influence_id)
+                    if column is not None:
+                        weights[row, column] = weight
+
+        # hit faces can have vertices with influences that are not used by the snapshot vertices, so weights are
+        # normalized again.
+        totals = weights.sum(axis=1, keepdims=True)
+        np.divide(weights, totals, out=weights, where=totals > abstracttransfer.WEIGHT_TOLERANCE)
+        logger.info('Finished solving weights via point on surface!')
+
+        return weights
+
     @override
     def transfer(self, other_skin: Skin, vertex_indices: list[int]):
         """
@@ -51,18 +90,7 @@ class PointOnSurface(abstracttransfer.AbstractTransfer):
         """
 
         vertex_points = other_skin.controlPoints(*vertex_indices)
-        hits = self.mesh.closest_point_on_surface(*vertex_points, dataset=self.face_indices)
-
-        updates = {}
-        for vertexIndex, hit in zip(vertex_indices, hits):
-            # Evaluate which operation to perform
-            num_face_vertices = len(self.mesh.face_vertex_indices(hit.face_index)[0])
-            if num_face_vertices == 3:
-                updates[vertexIndex] = self.skin.barycentric_weights(hit.triangle_vertex_indices, hit.bary_coords)
-            elif num_face_vertices == 4:
-                updates[vertexIndex] = self.skin.bilinear_weights(hit.face_vertex_indices, hit.bi_coords)
-            else:
-                raise TypeError(f'transfer() expects 3-4 vertices per face ({num_face_vertices} found)!')
+        updates = dict(zip(vertex_indices, self._point_weights(vertex_points)))
 
         # Remap source weights to target
         influence_ids = set(chain(*[list(x.keys()) for x in updates.values()]))
@@ -71,3 +99,26 @@ class PointOnSurface(abstracttransfer.AbstractTransfer):
         other_skin.apply_vertex_weights(updates)
 
         logger.info('Finished transferring weights via point on surface!')
+
+    def _point_weights(self, points: list) -> list[dict[int, float]]:
+        """
+        Internal function that returns the source skin weights at the closest point on surface of each given point.
+
+        :param list points: points to get weights for.
+        :return: list of weights by influence ID for each point.
+        :rtype: list[dict[int, float]]
+        :raises TypeError: if not expected number of vertices found for a face.
+        """
+
+        point_weights = []
+        for hit in self.mesh.closest_point_on_surface(*points, dataset=self.face_indices):
+            # Evaluate which operation to perform
+            num_face_vertices = len(self.mesh.face_vertex_indices(hit.face_index)[0])
+            if num_face_vertices == 3:
+                point_weights.append(self.skin.barycentric_weights(hit.triangle_vertex_indices, hit.bary_coords))
+            elif num_face_vertices == 4:
+                point_weights.append(self.skin.bilinear_weights(hit.face_vertex_indices, hit.bi_coords))
+            else:
+                raise TypeError(f'transfer() expects 3-4 vertices per face ({num_face_vertices} found)!')
+
+        return point_weights
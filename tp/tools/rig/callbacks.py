@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from tp.core import log
+from tp.common.qt import api as qt
+
+logger = log.rigLogger
+
+
+class CoalescedCallback(qt.QObject):
+    """
+    Wraps a callback function, so bursts of calls (such as the ones triggered by DCC selection changed events while
+    the user drags a selection marquee or steps through the outliner) are coalesced into a single call that happens
+    once the event loop is idle.
+    Each schedule call restarts the internal timer, so the wrapped function is only called with the arguments of the
+    latest scheduled call.
+    """
+
+    def __init__(self, fn: Callable, delay: int = 0, parent: qt.QObject | None = None):
+        """
+        Constructor.
+
+        :param Callable fn: function to call.
+        :param int delay: time in milliseconds to wait after the latest scheduled call before calling the function.
+            If 0, function is called within the next idle event.
+        :param qt.QObject or None parent: optional parent object, used to tie the lifetime of the callback to it.
+        """
+
+        super().__init__(parent)
+
+        self._fn = fn
+        self._args: tuple = ()
+        self._kwargs: dict[str, Any] = {}
+        self._timer = qt.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self._on_timer_timeout)
+
+    @property
+    def pending(self) -> bool:
+        """
+        Getter method that returns whether there is a scheduled call that was not executed yet.
+
+        :return: True if a call is pending; False otherwise.
+        :rtype: bool
+        """
+
+        return self._timer.isActive()
+
+    def schedule(self, *args, **kwargs):
+        """
+        Schedules a call of the wrapped function with the given arguments, replacing any pending call.
+
+        :param tuple args: positional arguments to call the function with.
+        :param dict kwargs: keyword arguments to call the function with.
+        """
+
+        self._args = args
+        self._kwargs = kwargs
+        self._timer.start()
+
+    def flush(self):
+        """
+        Executes pending call immediately, if any.
+        """
+
+        if not self._timer.isActive():
+            return
+
+        self._timer.stop()
+        self._on_timer_timeout()
+
+    def cancel(self):
+        """
+        Discards pending call, if any.
+        """
+
+        self._timer.stop()
+        self._args = ()
+        self._kwargs = {}
+
+    def _on_timer_timeout(self):
+        """
+        Internal callback function that is called when the internal timer times out.
+        """
+
+        args, kwargs = self._args, self._kwargs
+        self._args = ()
+        self._kwargs = {}
+        try:
+            self._fn(*args, **kwargs)
+        except Exception:
+            logger.exception(f'Error while executing coalesced callback: {self._fn}')
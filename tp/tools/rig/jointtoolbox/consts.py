@@ -4,6 +4,9 @@ import enum
 
 TOOL_ID = 'tp.rig.jointtoolbox'
 
+# delay in milliseconds used to coalesce bursts of scene selection changes into a single UI update.
+SELECTION_CHANGED_DELAY = 50
+
 XYZ_LIST = ['X', 'Y', 'Z']
 XYZ_WITH_NEG_LIST = ['X', 'Y', 'Z', '-X', '-Y', '-Z']
 AXIS_VECTORS = [
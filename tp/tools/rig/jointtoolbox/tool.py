@@ -11,6 +11,7 @@ from tp.common.qt import api as qt
 from tp.dcc import scene
 
 from . import consts, hook
+from .. import callbacks
 
 if typing.TYPE_CHECKING:
     from tp.common.plugin import PluginFactory
@@ -431,6 +432,8 @@ class JointToolboxView(qt.QWidget):
         super().__init__(parent=parent)
 
         self._tool = tool_instance
+        self._selection_changed_callback = callbacks.CoalescedCallback(
+            self._on_selection_changed_callback, delay=consts.SELECTION_CHANGED_DELAY, parent=self)
 
         self._accordion: qt.AccordionWidget | None = None
         self._orient_widget: qt.QWidget | None = None
@@ -740,7 +743,7 @@ class JointToolboxView(qt.QWidget):
         self._freeze_offset_matrix_button.clicked.connect(self.tool.freeze_to_matrix)
         self._reset_offset_matrix_button.clicked.connect(self.tool.reset_matrix)
 
-        self.tool.callbacks.add_selection_changed_callback(self._on_selection_changed_callback)
+        self.tool.callbacks.add_selection_changed_callback(self._selection_changed_callback.schedule)
 
     def _update_orient_buttons(self):
         """
@@ -835,7 +838,7 @@ class JointToolboxView(qt.QWidget):
 
     def _on_selection_changed_callback(self, *args, **kwargs):
         """
-        Internal callback function that is called each time scene selection changes.
+        Internal callback function that is called once after a burst of scene selection changes, when Maya is idle.
         """
 
         selection = scene.FnScene().active_selection()
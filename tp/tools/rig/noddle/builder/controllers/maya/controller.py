@@ -11,8 +11,10 @@ import maya.mel as mel
 from tp.common.qt import api as qt
 from tp.common.nodegraph import registers
 from tp.tools.rig.noddle.builder.controllers import abstract
-from tp.libs.rig.noddle.core import nodes, component, animcomponent, rig
+from tp.libs.rig.skinner import mirror
+from tp.libs.rig.noddle.core import config, nodes, component, animcomponent, rig
 from tp.libs.rig.noddle.io import skin
+from tp.libs.rig.noddle.functions import naming
 
 
 class MayaNoddleController(abstract.AbstractNoddleController):
@@ -90,7 +92,8 @@ class MayaNoddleController(abstract.AbstractNoddleController):
 
     @override
     def mirror_skin_weights(self):
-        mel.eval('MirrorSkinWeightsOptions;')
+        name_manager = config.Configuration().find_name_manager_for_type('global')
+        mirror.mirrorSkinWeights(sideTokens=naming.side_symmetry_tokens(name_manager) or None)
 
     @override
     def copy_skin_weights(self):
@@ -8,6 +8,7 @@ from tp.core import log
 from tp.common.qt import api as qt
 from tp.common.nodegraph.widgets import palette
 from tp.common.resources import api as resources
+from tp.libs.rig.noddle.core import registry, nameregistry
 
 from tp.tools.rig.noddle.builder import editor
 from tp.tools.rig.noddle.builder.widgets import workspace, history, vars, attributeseditor
@@ -31,6 +32,11 @@ class NoddleBuilderWindow(qt.FramelessWindow):
 
         super().__init__(title=self._window_title, parent=parent)
 
+        # keep scene rigs and names registries in sync with the scene while the builder is opened
+        registry.RigRegistry.register_callbacks()
+        nameregistry.NameRegistry.register_callbacks()
+        self._registry_callbacks_registered = True
+
     @property
     def controller(self) -> NoddleController:
         return self._controller
@@ -127,6 +133,14 @@ class NoddleBuilderWindow(qt.FramelessWindow):
         self._vars_widget.variables_list_widget.itemClicked.connect(
             self._attributes_editor.update_current_variable_widget)
 
+    @override
+    def closeEvent(self, event: qt.QCloseEvent):
+        if self._registry_callbacks_registered:
+            registry.RigRegistry.unregister_callbacks()
+            nameregistry.NameRegistry.unregister_callbacks()
+            self._registry_callbacks_registered = False
+        super().closeEvent(event)
+
     def find_mdi_child_by_widget(self, widget: qt.QWidget) -> qt.QMdiSubWindow | None:
         """
         Returns the MDI sub window instance that matches given graph file name.
@@ -1,3 +1,6 @@
 from __future__ import annotations
 
 TOOL_ID = 'tp.rig.transferskinweights'
+
+# interval in milliseconds used to poll the progress of the weights transfer being solved.
+TRANSFER_POLL_INTERVAL = 100
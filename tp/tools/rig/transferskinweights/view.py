@@ -5,15 +5,18 @@ from collections import namedtuple
 from overrides import override
 
 from tp.core import log
-from tp.dcc import scene, node, skin
+from tp.dcc import scene, skin
 from tp.common.qt import api as qt
 from tp.common.resources import api as resources
-from tp.libs.rig.utils.transferweights import closestpoint
+from tp.libs.rig.utils.transferweights import abstracttransfer, closestpoint, inversedistance
+
+from tp.tools.rig.transferskinweights import consts
 
 logger = log.rigLogger
 
 
-ClipboardItem = namedtuple('ClipboardItem', ('skin', 'influences', 'selection'))
+ClipboardItem = namedtuple('ClipboardItem', ('snapshot',))
+PendingTransfer = namedtuple('PendingTransfer', ('task', 'skin', 'vertex_indices'))
 
 
 class TransferSkinWeightsView(qt.FramelessWindow):
@@ -25,9 +28,13 @@ class TransferSkinWeightsView(qt.FramelessWindow):
 
         self._scene = scene.Scene()
         self._clipboard: list[ClipboardItem] = []
+        self._pending_transfer: PendingTransfer | None = None
+        self._transfer_timer = qt.QTimer(self)
+        self._transfer_timer.setInterval(consts.TRANSFER_POLL_INTERVAL)
 
         self._methods = [
-            closestpoint.ClosestPoint
+            closestpoint.ClosestPoint,
+            inversedistance.InverseDistance
         ]
 
     @property
@@ -119,9 +126,19 @@ class TransferSkinWeightsView(qt.FramelessWindow):
         buttons_layout.addWidget(self._extract_weights_button)
         buttons_layout.addWidget(self._transfer_weights_button)
 
+        progress_layout = qt.horizontal_layout(spacing=2)
+        self._progress_bar = qt.QProgressBar(parent=self)
+        self._progress_bar.setTextVisible(True)
+        self._cancel_transfer_button = qt.base_button('Cancel', parent=self)
+        progress_layout.addWidget(self._progress_bar)
+        progress_layout.addWidget(self._cancel_transfer_button)
+        self._progress_widget = qt.widget(layout=progress_layout, parent=self)
+        self._progress_widget.setVisible(False)
+
         main_layout.addWidget(self._main_splitter)
         main_layout.addWidget(qt.divider(parent=self))
         main_layout.addLayout(buttons_layout)
+        main_layout.addWidget(self._progress_widget)
 
         self._main_splitter.addWidget(self._clipboard_widget)
         self._main_splitter.addWidget(self._influences_widget)
@@ -135,6 +152,13 @@ class TransferSkinWeightsView(qt.FramelessWindow):
         self._extract_weights_button.clicked.connect(self._on_extract_button_clicked)
         self._create_skin_button.clicked.connect(self._on_create_skin_button_clicked)
         self._transfer_weights_button.clicked.connect(self._on_transfer_weights_button_clicked)
+        self._cancel_transfer_button.clicked.connect(self.cancel_transfer)
+        self._transfer_timer.timeout.connect(self._on_transfer_timer_timeout)
+
+    @override
+    def closeEvent(self, event: qt.QCloseEvent):
+        self.cancel_transfer()
+        super().closeEvent(event)
 
     def clipboard_count(self) -> int:
         """
@@ -170,6 +194,52 @@ class TransferSkinWeightsView(qt.FramelessWindow):
 
         return self._method_combo.currentIndex()
 
+    def is_transferring(self) -> bool:
+        """
+        Returns whether a weights transfer is being solved.
+
+        :return: True if a transfer is running; False otherwise.
+        :rtype: bool
+        """
+
+        return self._pending_transfer is not None
+
+    def start_transfer(
+            self, instance: abstracttransfer.AbstractTransfer, other_skin: skin.Skin, vertex_indices: list[int]):
+        """
+        Starts solving the given transfer within a worker thread.
+        Target points are read from the scene before starting, and solved weights are written into the target skin
+        from the main thread once the solve finishes.
+
+        :param abstracttransfer.AbstractTransfer instance: transfer to solve.
+        :param skin.Skin other_skin: skin to transfer weights to.
+        :param list[int] vertex_indices: vertex indices to transfer weights for.
+        """
+
+        if self.is_transferring():
+            logger.warning('A weights transfer is already in progress!')
+            return
+
+        task = abstracttransfer.TransferTask(instance, abstracttransfer.target_points(other_skin, vertex_indices))
+        self._pending_transfer = PendingTransfer(task=task, skin=other_skin, vertex_indices=vertex_indices)
+        self._progress_bar.setRange(0, len(vertex_indices))
+        self._progress_bar.setValue(0)
+        self._progress_widget.setVisible(True)
+        self._transfer_weights_button.setEnabled(False)
+        self._create_skin_button.setEnabled(False)
+        task.start()
+        self._transfer_timer.start()
+
+    def cancel_transfer(self):
+        """
+        Cancels the weights transfer being solved, if any. Target skin is not modified.
+        """
+
+        if self._pending_transfer is None:
+            return
+
+        self._pending_transfer.task.cancel()
+
     def refresh(self):
         """
         Resets the influence list widget with the current clipboard's item used influences.
@@ -180,10 +250,7 @@ class TransferSkinWeightsView(qt.FramelessWindow):
         if clipboard_item is None:
             return
 
-        if not clipboard_item.skin.is_valid():
-            return
-
-        for influence_name in clipboard_item.influences.values():
+        for influence_name in clipboard_item.snapshot.influence_names:
             item = self._create_list_widget_item(influence_name)
             self._influences_list_widget.addItem(item)
 
@@ -241,20 +308,14 @@ class TransferSkinWeightsView(qt.FramelessWindow):
         if num_vertex_indices == 0:
             vertex_indices = skin_fn.vertices()
 
-        # Get used influence names.
-        influences = skin_fn.influences()
-        used_influence_ids = skin_fn.used_influence_ids(*vertex_indices)
-        used_influences = {
-            influence_id: influences[influence_id].absolute_name() for influence_id in used_influence_ids}
-
-        # Define clipboard items.
-        clipboard_item = ClipboardItem(skin=skin_fn, selection=vertex_indices, influences=used_influences)
+        # Define clipboard items. Weights are snapshot, so clipboard items do not hold any reference to the skin.
+        snapshot = abstracttransfer.WeightsSnapshot.create(skin_fn, vertex_indices)
+        clipboard_item = ClipboardItem(snapshot=snapshot)
         self._clipboard.append(clipboard_item)
 
         # Create items and parent them to cells.
-        shape = node.Node(skin_fn.shape())
-        item1 = self._create_table_widget_item(shape.name())
-        item2 = self._create_table_widget_item(str(len(vertex_indices)))
+        item1 = self._create_table_widget_item(snapshot.name)
+        item2 = self._create_table_widget_item(str(len(snapshot)))
         delete_button = qt.base_button(icon=resources.icon('delete'), parent=self)
         delete_button.setSizePolicy(qt.QSizePolicy.Expanding, qt.QSizePolicy.Expanding)
         delete_button.clicked.connect(self._on_delete_button_clicked)
@@ -348,13 +409,12 @@ class TransferSkinWeightsView(qt.FramelessWindow):
 
         # Create new skin and add influences
         skin_fn = skin.Skin.create(mesh)
-        skin_fn.set_max_influences(clipboard_item.skin.max_influences())
-        influences = list(clipboard_item.influences.values())
-        skin_fn.add_influence(*influences)
+        skin_fn.set_max_influences(clipboard_item.snapshot.max_influences)
+        skin_fn.add_influence(*clipboard_item.snapshot.influence_names)
 
         # Transfer weights to new skin
-        instance = closestpoint.ClosestPoint(clipboard_item.skin, clipboard_item.selection)
-        instance.transfer(skin_fn, skin_fn.vertices())
+        instance = closestpoint.ClosestPoint(clipboard_item.snapshot)
+        self.start_transfer(instance, skin_fn, skin_fn.vertices())
 
     def _on_transfer_weights_button_clicked(self):
         """
@@ -380,6 +440,59 @@ class TransferSkinWeightsView(qt.FramelessWindow):
             return
 
         current_method = self.current_method()
+        if not 0 <= current_method < len(self._methods):
+            logger.warning(f'Transfer method "{self._method_combo.currentText()}" is not supported yet!')
+            return
+
         cls = self._methods[current_method]
-        instance = cls(clipboard_item.skin, clipboard_item.selection)
-        instance.transfer(other_skin, other_skin.selection() or other_skin.vertices())
+        # Clipboard items only store weights snapshots, so only transfers that can be solved from them are supported.
+        if not cls.supports_snapshot:
+            logger.warning(f'Transfer method "{cls.title}" cannot transfer weights from the clipboard!')
+            return
+
+        instance = cls(clipboard_item.snapshot)
+        self.start_transfer(instance, other_skin, other_skin.selection() or other_skin.vertices())
+
+    def _on_transfer_timer_timeout(self):
+        """
+        Internal callback function that is called periodically while a weights transfer is being solved.
+        Updates the transfer progress and writes the solved weights once the transfer finishes.
+        """
+
+        pending_transfer = self._pending_transfer
+        if pending_transfer is None:
+            self._transfer_timer.stop()
+            return
+
+        task = pending_transfer.task
+        solved, _ = task.progress
+        self._progress_bar.setValue(solved)
+        if not task.done():
+            return
+
+        self._transfer_timer.stop()
+        self._pending_transfer = None
+        self._progress_widget.setVisible(False)
+        self._transfer_weights_button.setEnabled(True)
+        self._create_skin_button.setEnabled(True)
+
+        try:
+            weights = task.result()
+        except abstracttransfer.TransferCancelled:
+            logger.info('Weights transfer cancelled!')
+            return
+        except Exception:
+            logger.exception('Error while solving weights transfer!')
+            return
+
+        if not pending_transfer.skin.is_valid():
+            logger.warning('Unable to apply transferred weights because target skin no longer exists!')
+            return
+
+        try:
+            task.transfer.apply(pending_transfer.skin, pending_transfer.vertex_indices, weights)
+        except Exception:
+            logger.exception('Error while applying transferred weights!')
+            return
+
+        logger.info(f'Finished transferring weights via {task.transfer.title.lower()}!')